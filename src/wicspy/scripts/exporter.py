@@ -0,0 +1,43 @@
+"""
+Metrics exporter CLI tool for Prometheus
+"""
+
+import argparse
+from loguru import logger
+
+from wicspy.server.exporter import MetricsExporter
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Serve server metrics in OpenMetrics format")
+    parser.add_argument("--host", default="0.0.0.0", help="Address to listen on")
+    parser.add_argument("--port", "-p", type=int, default=9184, help="Port to listen on")
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=1.0,
+        help="Seconds to reuse a collection across scrapes"
+    )
+    parser.add_argument("--no-processes", action="store_true", help="Do not export per-process metrics")
+    return parser
+
+
+def exporter():
+    """Metrics exporter CLI entry point"""
+    parser = create_parser()
+    args = parser.parse_args()
+
+    server = MetricsExporter(
+        host=args.host,
+        port=args.port,
+        cache_ttl=args.cache_ttl,
+        processes=not args.no_processes,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Exporter stopped")
+
+
+if __name__ == "__main__":
+    exporter()
@@ -4,5 +4,43 @@
 
 
 
-from .monitor import get_system_info, get_memory_usage, get_disk_usage, get_cpu_usage
-from .process import list_processes, find_process, kill_process
+from .monitor import (
+    get_system_info,
+    get_memory_usage,
+    get_disk_usage,
+    get_cpu_usage,
+    get_snapshot,
+    get_io_rates,
+    get_system_info_async,
+    get_memory_usage_async,
+    get_disk_usage_async,
+    get_cpu_usage_async,
+    get_snapshot_async,
+    iter_snapshots_async,
+    CPUSampler,
+    DiskCollector,
+    IOSampler,
+    Snapshot,
+    SystemSnapshot,
+)
+from .cgroup import CgroupSampler, PressureSampler, get_cgroup_usage, get_pressure
+from .daemon import Monitor, RingBuffer
+from .exporter import MetricsExporter
+from .process import (
+    list_processes,
+    find_process,
+    find_processes,
+    kill_process,
+    kill_processes,
+    kill_processes_async,
+    list_processes_async,
+    find_process_async,
+    KillResult,
+)
+from .proctable import ProcessTable, ProcessEvent
+from .columns import ProcessColumns, process_columns
+from .proctop import ProcessRate, ProcessSampler, iter_top_async
+from .proctree import ProcessTree, SubtreeUsage, process_tree
+from .smaps import MemoryDetail, SmapsCollector, get_memory_details
+from .sockets import SocketInfo, SocketTable, find_listeners, get_socket_counts
+from .supervisor import ChildSpec, ChildStats, Supervisor
@@ -0,0 +1,425 @@
+"""
+cgroup 监控模块 - 采集当前进程所在 cgroup v2 的资源使用情况及 PSI 压力信息
+
+容器内 /proc 中的数据反映的是宿主机，本模块读取进程自身 cgroup 目录下的
+memory.*、cpu.*、io.* 文件，按两次采样的差值计算使用率、限流和 I/O 速率。
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field
+from loguru import logger
+
+from .monitor import _counter_delta, _read_proc_file, get_mount_table
+
+
+PSI_RESOURCES = ("cpu", "memory", "io")
+
+# 采样器读取的控制器，未启用时对应的接口文件不存在
+CGROUP_CONTROLLERS = ("cpu", "memory", "io")
+
+
+class PressureStats(BaseModel):
+    """PSI 压力信息模型"""
+    resource: str = Field(..., description="资源类型(cpu/memory/io)")
+    some_avg10: float = Field(0.0, description="部分任务停顿比例，10 秒平均")
+    some_avg60: float = Field(0.0, description="部分任务停顿比例，60 秒平均")
+    some_avg300: float = Field(0.0, description="部分任务停顿比例，300 秒平均")
+    some_percent: float = Field(0.0, description="两次采样之间部分任务停顿时间百分比")
+    full_avg10: float = Field(0.0, description="全部任务停顿比例，10 秒平均")
+    full_avg60: float = Field(0.0, description="全部任务停顿比例，60 秒平均")
+    full_avg300: float = Field(0.0, description="全部任务停顿比例，300 秒平均")
+    full_percent: float = Field(0.0, description="两次采样之间全部任务停顿时间百分比")
+
+
+class CgroupMemory(BaseModel):
+    """cgroup 内存使用情况模型"""
+    current: int = Field(0, description="当前使用量(字节)")
+    max: Optional[int] = Field(None, description="内存上限(字节)，无限制时为 None")
+    percent: Optional[float] = Field(None, description="占上限百分比，无限制时为 None")
+    stat: Dict[str, int] = Field(default_factory=dict, description="memory.stat 内容")
+
+
+class CgroupCPU(BaseModel):
+    """cgroup CPU 使用情况模型"""
+    usage_cores: float = Field(0.0, description="平均占用核数")
+    user_cores: float = Field(0.0, description="用户态平均占用核数")
+    system_cores: float = Field(0.0, description="内核态平均占用核数")
+    limit_cores: Optional[float] = Field(None, description="cpu.max 限制的核数，无限制时为 None")
+    percent: Optional[float] = Field(None, description="占限制百分比，无限制时为 None")
+    periods: int = Field(0, description="区间内调度周期数")
+    throttled_periods: int = Field(0, description="区间内被限流的周期数")
+    throttled_ratio: float = Field(0.0, description="被限流周期占比")
+    throttled_seconds: float = Field(0.0, description="区间内被限流的总时间(秒)")
+
+
+class CgroupIO(BaseModel):
+    """cgroup 块设备 I/O 速率模型"""
+    device: str = Field(..., description="设备号(major:minor)")
+    read_bytes_per_sec: float = Field(0.0, description="每秒读字节数")
+    write_bytes_per_sec: float = Field(0.0, description="每秒写字节数")
+    read_iops: float = Field(0.0, description="每秒读次数")
+    write_iops: float = Field(0.0, description="每秒写次数")
+
+
+class CgroupSample(BaseModel):
+    """cgroup 采样结果模型"""
+    path: str = Field(..., description="cgroup 目录")
+    interval: float = Field(..., description="采样区间(秒)，首次采样为 0")
+    memory: Optional[CgroupMemory] = Field(None, description="内存使用情况，cgroup 未启用 memory 控制器时为 None")
+    cpu: CgroupCPU = Field(default_factory=CgroupCPU, description="CPU 使用情况")
+    io: List[CgroupIO] = Field(default_factory=list, description="块设备 I/O 速率")
+    pressure: List[PressureStats] = Field(default_factory=list, description="cgroup 级 PSI 压力信息")
+
+
+def _read_text(path: str) -> Optional[str]:
+    """读取文件内容，文件不存在或不可读时返回 None"""
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _parse_flat_keyed(data: str) -> Dict[str, int]:
+    """解析 "key value" 形式的文件，例如 memory.stat、cpu.stat"""
+    result = {}
+    for line in data.splitlines():
+        key, _, value = line.partition(" ")
+        try:
+            result[key] = int(value)
+        except ValueError:
+            continue
+    return result
+
+
+def _parse_io_stat(data: str) -> Dict[str, Dict[str, int]]:
+    """解析 io.stat，返回 设备号 -> {rbytes, wbytes, rios, wios, ...}"""
+    result = {}
+    for line in data.splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        fields = {}
+        for item in parts[1:]:
+            key, _, value = item.partition("=")
+            try:
+                fields[key] = int(value)
+            except ValueError:
+                continue
+        result[parts[0]] = fields
+    return result
+
+
+# (some/full) -> (avg10, avg60, avg300, total 微秒)
+_PressureCounters = Dict[str, Tuple[float, float, float, int]]
+
+
+def _parse_pressure(data: str) -> _PressureCounters:
+    """解析 PSI 文件内容"""
+    result = {}
+    for line in data.splitlines():
+        parts = line.split()
+        if len(parts) < 5:
+            continue
+        values = dict(item.split("=", 1) for item in parts[1:])
+        result[parts[0]] = (
+            float(values.get("avg10", 0)),
+            float(values.get("avg60", 0)),
+            float(values.get("avg300", 0)),
+            int(values.get("total", 0)),
+        )
+    return result
+
+
+def _pressure_stats(
+    resource: str, cur: _PressureCounters, prev: Optional[_PressureCounters], elapsed: float
+) -> PressureStats:
+    """根据两次 PSI 读数构建压力信息，停顿百分比由 total 差值计算"""
+    fields: Dict[str, float] = {}
+    for kind in ("some", "full"):
+        counters = cur.get(kind)
+        if counters is None:
+            continue
+        fields[f"{kind}_avg10"] = counters[0]
+        fields[f"{kind}_avg60"] = counters[1]
+        fields[f"{kind}_avg300"] = counters[2]
+        if prev is not None and kind in prev and elapsed > 0:
+            stalled_us = _counter_delta(counters[3], prev[kind][3])
+            fields[f"{kind}_percent"] = min(stalled_us / (elapsed * 1e6) * 100.0, 100.0)
+    return PressureStats(resource=resource, **fields)
+
+
+def find_cgroup_path(pid: Optional[int] = None) -> Optional[str]:
+    """
+    查找进程所在的 cgroup v2 目录
+
+    同时支持纯 cgroup v2 和混合模式（cgroup2 挂载在 /sys/fs/cgroup/unified）。/proc/[pid]/cgroup
+    中的路径相对于 cgroup2 层级的根，挂载的只是其中的子树（mountinfo 的 root 字段）时先去掉
+    该前缀；不在挂载子树中的 cgroup 无法访问，返回 None。
+
+    Args:
+        pid: 进程ID，为 None 时为当前进程
+
+    Returns:
+        Optional[str]: cgroup 目录，系统未启用 cgroup v2 时返回 None
+    """
+    data = _read_text(f"/proc/{pid or 'self'}/cgroup")
+    if data is None:
+        return None
+    relative = None
+    for line in data.splitlines():
+        # cgroup v2 的层级号为 0，控制器列表为空
+        if line.startswith("0::"):
+            relative = line[3:]
+            break
+    if relative is None:
+        return None
+
+    for mount in get_mount_table().mounts():
+        if mount.fstype != "cgroup2":
+            continue
+        root = mount.root.rstrip("/")
+        if relative != root and not relative.startswith(root + "/"):
+            continue
+        path = os.path.normpath(mount.mountpoint + "/" + relative[len(root):].lstrip("/"))
+        if os.path.isdir(path):
+            return path
+    return None
+
+
+class PressureSampler:
+    """
+    PSI 压力采样器
+
+    读取 /proc/pressure/{cpu,memory,io}，除内核给出的 avg10/60/300 外，
+    还根据 total 计数的差值计算两次采样之间的准确停顿百分比。
+    """
+
+    def __init__(self, base: str = "/proc/pressure"):
+        """
+        初始化 PSI 采样器
+
+        Args:
+            base: PSI 文件所在目录
+        """
+        self._base = base
+        self._prev: Dict[str, _PressureCounters] = {}
+        self._prev_time: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def sample(self) -> List[PressureStats]:
+        """
+        采样 PSI 压力信息
+
+        Returns:
+            List[PressureStats]: 各资源的压力信息，内核不支持 PSI 时返回空列表
+        """
+        now = time.monotonic()
+        current = {}
+        for resource in PSI_RESOURCES:
+            try:
+                data = _read_proc_file(f"{self._base}/{resource}")
+                current[resource] = _parse_pressure(data.decode())
+            except OSError:
+                continue
+            except ValueError as e:
+                logger.debug(f"解析 {resource} 压力信息失败: {e}")
+
+        with self._lock:
+            elapsed = now - self._prev_time if self._prev_time is not None else 0.0
+            result = [
+                _pressure_stats(resource, counters, self._prev.get(resource), elapsed)
+                for resource, counters in current.items()
+            ]
+            self._prev = current
+            self._prev_time = now
+        return result
+
+
+class CgroupSampler:
+    """
+    cgroup v2 资源采样器
+
+    每次 sample() 读取 cgroup 目录下的 memory.current、memory.max、memory.stat、
+    cpu.stat、cpu.max、io.stat 和 *.pressure，CPU、限流、I/O 和停顿时间按与上一次
+    采样的差值计算。首次采样没有上一次计数，速率类字段为 0。
+
+    cgroup 未启用的控制器（例如混合模式下 memory、cpu 仍由 cgroup v1 管理）在创建时记录警告，
+    对应的结果为 None、空列表或只包含 cpu.stat 中始终存在的计数，不会报告为 0。
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        初始化 cgroup 采样器
+
+        Args:
+            path: cgroup 目录，为 None 时自动查找当前进程所在的 cgroup
+
+        Raises:
+            ValueError: 未找到 cgroup v2 目录
+        """
+        path = path or find_cgroup_path()
+        if not path:
+            raise ValueError("未找到 cgroup v2 目录，系统可能未启用 cgroup v2")
+        self.path = path
+        controllers = self._file("cgroup.controllers")
+        self.controllers = frozenset(controllers.split() if controllers is not None else ())
+        missing = [name for name in CGROUP_CONTROLLERS if name not in self.controllers]
+        if missing:
+            logger.warning(f"cgroup {path} 未启用控制器 {', '.join(missing)}，对应的指标不可用")
+        self._prev_time: Optional[float] = None
+        self._prev_cpu: Dict[str, int] = {}
+        self._prev_io: Dict[str, Dict[str, int]] = {}
+        self._prev_pressure: Dict[str, _PressureCounters] = {}
+        self._lock = threading.Lock()
+
+    def _file(self, name: str) -> Optional[str]:
+        return _read_text(os.path.join(self.path, name))
+
+    def _memory(self) -> Optional[CgroupMemory]:
+        current = self._file("memory.current")
+        if current is None:
+            return None
+        limit = self._file("memory.max")
+        stat = self._file("memory.stat")
+
+        mem_current = int(current)
+        mem_max = None
+        if limit and limit.strip() != "max":
+            mem_max = int(limit)
+        return CgroupMemory(
+            current=mem_current,
+            max=mem_max,
+            percent=mem_current / mem_max * 100.0 if mem_max else None,
+            stat=_parse_flat_keyed(stat) if stat else {},
+        )
+
+    def _cpu_limit(self) -> Optional[float]:
+        data = self._file("cpu.max")
+        if not data:
+            return None
+        quota, _, period = data.strip().partition(" ")
+        if quota == "max" or not period:
+            return None
+        return int(quota) / int(period)
+
+    def sample(self) -> CgroupSample:
+        """
+        采样 cgroup 资源使用情况
+
+        Returns:
+            CgroupSample: cgroup 采样结果对象
+        """
+        now = time.monotonic()
+        memory = self._memory()
+        limit_cores = self._cpu_limit()
+        cpu_data = self._file("cpu.stat")
+        cpu_stat = _parse_flat_keyed(cpu_data) if cpu_data else {}
+        io_data = self._file("io.stat")
+        io_stat = _parse_io_stat(io_data) if io_data else {}
+        pressure = {}
+        for resource in PSI_RESOURCES:
+            data = self._file(f"{resource}.pressure")
+            if data:
+                try:
+                    pressure[resource] = _parse_pressure(data)
+                except ValueError as e:
+                    logger.debug(f"解析 {resource}.pressure 失败: {e}")
+
+        with self._lock:
+            elapsed = now - self._prev_time if self._prev_time is not None else 0.0
+            per_sec = 1.0 / elapsed if elapsed > 0 else 0.0
+            prev_cpu = self._prev_cpu or cpu_stat
+
+            def cpu_delta(key: str) -> int:
+                return _counter_delta(cpu_stat.get(key, 0), prev_cpu.get(key, 0))
+
+            usage_cores = cpu_delta("usage_usec") / 1e6 * per_sec
+            periods = cpu_delta("nr_periods")
+            throttled_periods = cpu_delta("nr_throttled")
+            cpu = CgroupCPU(
+                usage_cores=usage_cores,
+                user_cores=cpu_delta("user_usec") / 1e6 * per_sec,
+                system_cores=cpu_delta("system_usec") / 1e6 * per_sec,
+                limit_cores=limit_cores,
+                percent=usage_cores / limit_cores * 100.0 if limit_cores else None,
+                periods=periods,
+                throttled_periods=throttled_periods,
+                throttled_ratio=throttled_periods / periods if periods else 0.0,
+                throttled_seconds=cpu_delta("throttled_usec") / 1e6,
+            )
+
+            io = []
+            for device, fields in io_stat.items():
+                prev = self._prev_io.get(device, fields)
+
+                def io_delta(key: str) -> float:
+                    return _counter_delta(fields.get(key, 0), prev.get(key, 0)) * per_sec
+
+                io.append(CgroupIO(
+                    device=device,
+                    read_bytes_per_sec=io_delta("rbytes"),
+                    write_bytes_per_sec=io_delta("wbytes"),
+                    read_iops=io_delta("rios"),
+                    write_iops=io_delta("wios"),
+                ))
+
+            pressure_stats = [
+                _pressure_stats(resource, counters, self._prev_pressure.get(resource), elapsed)
+                for resource, counters in pressure.items()
+            ]
+
+            self._prev_time = now
+            self._prev_cpu = cpu_stat
+            self._prev_io = io_stat
+            self._prev_pressure = pressure
+
+        return CgroupSample(
+            path=self.path,
+            interval=elapsed,
+            memory=memory,
+            cpu=cpu,
+            io=io,
+            pressure=pressure_stats,
+        )
+
+
+_default_cgroup_sampler: Optional[CgroupSampler] = None
+_default_pressure_sampler: Optional[PressureSampler] = None
+
+
+def get_cgroup_usage() -> Optional[CgroupSample]:
+    """
+    获取当前进程所在 cgroup 的资源使用情况
+
+    使用默认的 CgroupSampler，返回自上次调用以来的速率。
+
+    Returns:
+        Optional[CgroupSample]: cgroup 采样结果，未启用 cgroup v2 时返回 None
+    """
+    global _default_cgroup_sampler
+    if _default_cgroup_sampler is None:
+        try:
+            _default_cgroup_sampler = CgroupSampler()
+        except ValueError as e:
+            logger.warning(f"获取 cgroup 信息失败: {e}")
+            return None
+    return _default_cgroup_sampler.sample()
+
+
+def get_pressure() -> List[PressureStats]:
+    """
+    获取系统级 PSI 压力信息
+
+    使用默认的 PressureSampler，停顿百分比为自上次调用以来的值。
+
+    Returns:
+        List[PressureStats]: 各资源的压力信息，内核不支持 PSI 时返回空列表
+    """
+    global _default_pressure_sampler
+    if _default_pressure_sampler is None:
+        _default_pressure_sampler = PressureSampler()
+    return _default_pressure_sampler.sample()
@@ -0,0 +1,305 @@
+"""
+列式进程表模块 - 以 array 列保存进程数据，排序、Top-N 和分组无需构建 Process 对象
+"""
+
+import heapq
+import sys
+import time
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+from loguru import logger
+
+from .monitor import _read_meminfo, _read_uptime
+from .process import (
+    _CLK_TCK,
+    _PAGE_SIZE,
+    _STATE_NAMES,
+    PidStat,
+    Process,
+    _iter_pids,
+    _read_pid_cmdline,
+    _read_pid_exe,
+    _read_pid_stat,
+    _read_pid_uid,
+    _username,
+)
+
+
+# 数值列 -> array 类型码
+_NUMERIC_COLUMNS = {
+    "pid": "q",
+    "ppid": "q",
+    "threads": "q",
+    "rss": "q",
+    "cpu_time": "d",
+    "cpu_percent": "d",
+    "memory_percent": "d",
+    "start_time": "d",
+}
+# 字符串列，值均经过 sys.intern
+_STRING_COLUMNS = ("name", "state", "user")
+
+# top()/sort() 中 by 参数的别名
+_SORT_ALIASES = {"cpu": "cpu_percent", "memory": "rss"}
+
+
+class ProcessColumns:
+    """
+    列式进程表
+
+    每个数值列是一个 array（pid、ppid、threads、rss 为 int64，cpu_time、cpu_percent、
+    memory_percent、start_time 为 float64），可通过缓冲区协议零拷贝交给 NumPy，例如
+    numpy.frombuffer(columns.column("rss"), dtype=numpy.int64)。进程名、状态码和用户名
+    以 intern 后的字符串列表保存。排序、Top-N、分组只操作列数据；下标访问或遍历时才
+    按需构建单个 Process，cmd 和 exe 也在此时才读取（来自进程表时使用其缓存）。
+    cpu_percent 与 ps 一致，为进程生命周期内的平均值。
+
+    Example:
+        >>> cols = process_columns()
+        >>> for p in cols.top(5, by="memory"):
+        ...     print(p.pid, p.name, p.rss)
+        >>> {user: g.sum("rss") for user, g in cols.group_by("user").items()}
+    """
+    __slots__ = tuple(_NUMERIC_COLUMNS) + _STRING_COLUMNS + ("_static", "_rows")
+
+    def __init__(self, static: Optional[Dict[int, Dict[str, Any]]] = None):
+        """
+        初始化空的列式进程表，通常通过 process_columns() 或 ProcessTable.columns() 创建
+
+        Args:
+            static: 进程ID -> 缓存的 cmd/exe 等静态信息
+        """
+        for name, typecode in _NUMERIC_COLUMNS.items():
+            setattr(self, name, array(typecode))
+        for name in _STRING_COLUMNS:
+            setattr(self, name, [])
+        self._static = static or {}
+        self._rows: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def __getitem__(self, row: int) -> Process:
+        return self._materialize(row)
+
+    def __iter__(self) -> Iterator[Process]:
+        for row in range(len(self.pid)):
+            yield self._materialize(row)
+
+    def _append(self, st: PidStat, user: str, boot_time: float, uptime: float, mem_total: int) -> None:
+        """追加一行"""
+        rss = st.rss_pages * _PAGE_SIZE
+        cpu_time = (st.utime + st.stime) / _CLK_TCK
+        start = st.starttime / _CLK_TCK
+        elapsed = uptime - start
+        self.pid.append(st.pid)
+        self.ppid.append(st.ppid)
+        self.threads.append(st.num_threads)
+        self.rss.append(rss)
+        self.cpu_time.append(cpu_time)
+        self.cpu_percent.append(cpu_time / elapsed * 100.0 if elapsed > 0 else 0.0)
+        self.memory_percent.append(rss / mem_total * 100.0 if mem_total else 0.0)
+        self.start_time.append(boot_time + start)
+        self.name.append(sys.intern(st.comm))
+        self.state.append(sys.intern(st.state))
+        self.user.append(sys.intern(user))
+
+    def _materialize(self, row: int) -> Process:
+        """构建单行的 Process，cmd 和 exe 优先取自缓存"""
+        pid = self.pid[row]
+        static = self._static.get(pid, {})
+        try:
+            cmd = static["cmd"] if "cmd" in static else _read_pid_cmdline(pid)
+            exe = static["exe"] if "exe" in static else _read_pid_exe(pid)
+        except OSError:
+            # 进程已在采集后退出
+            cmd = exe = ""
+        state = self.state[row]
+        start_time = self.start_time[row]
+        return Process(
+            pid=pid,
+            name=self.name[row],
+            cmd=cmd,
+            cpu_percent=self.cpu_percent[row],
+            memory_percent=self.memory_percent[row],
+            status=_STATE_NAMES.get(state, state),
+            user=self.user[row],
+            created=datetime.fromtimestamp(start_time).isoformat(timespec="seconds"),
+            ppid=self.ppid[row],
+            threads=self.threads[row],
+            rss=self.rss[row],
+            start_time=start_time,
+            state=state,
+            exe=exe,
+        )
+
+    def column(self, name: str) -> Union[array, List[str]]:
+        """
+        获取一列数据（不复制）
+
+        Args:
+            name: 列名，数值列为 pid、ppid、threads、rss、cpu_time、cpu_percent、
+                memory_percent、start_time，字符串列为 name、state、user
+
+        Returns:
+            Union[array, List[str]]: 列数据，调用方不应修改
+
+        Raises:
+            ValueError: 未知的列名
+        """
+        if name not in _NUMERIC_COLUMNS and name not in _STRING_COLUMNS:
+            raise ValueError(f"未知的列: {name}")
+        return getattr(self, name)
+
+    def row_of(self, pid: int) -> Optional[int]:
+        """
+        查找进程所在的行，首次调用时建立 pid -> 行号索引
+
+        Args:
+            pid: 进程ID
+
+        Returns:
+            Optional[int]: 行号，不存在时返回 None
+        """
+        if self._rows is None:
+            self._rows = {pid: row for row, pid in enumerate(self.pid)}
+        return self._rows.get(pid)
+
+    def get(self, pid: int) -> Optional[Process]:
+        """
+        获取单个进程的信息
+
+        Args:
+            pid: 进程ID
+
+        Returns:
+            Optional[Process]: 进程信息，不存在时返回 None
+        """
+        row = self.row_of(pid)
+        return self._materialize(row) if row is not None else None
+
+    def take(self, rows: Iterable[int]) -> "ProcessColumns":
+        """
+        按行号选取子集，结果中的行顺序与 rows 一致
+
+        Args:
+            rows: 行号序列
+
+        Returns:
+            ProcessColumns: 新的列式进程表，与原表共享静态信息缓存
+        """
+        rows = list(rows)
+        result = ProcessColumns(self._static)
+        for name, typecode in _NUMERIC_COLUMNS.items():
+            src = getattr(self, name)
+            setattr(result, name, array(typecode, [src[i] for i in rows]))
+        for name in _STRING_COLUMNS:
+            src = getattr(self, name)
+            setattr(result, name, [src[i] for i in rows])
+        return result
+
+    def argsort(self, by: str, reverse: bool = False) -> List[int]:
+        """
+        按某列排序后的行号
+
+        Args:
+            by: 列名，也可使用别名 "cpu"（cpu_percent）和 "memory"（rss）
+            reverse: 是否降序
+
+        Returns:
+            List[int]: 行号列表
+        """
+        col = self.column(_SORT_ALIASES.get(by, by))
+        return sorted(range(len(col)), key=col.__getitem__, reverse=reverse)
+
+    def sort(self, by: str, reverse: bool = False) -> "ProcessColumns":
+        """
+        按某列排序
+
+        Args:
+            by: 列名，也可使用别名 "cpu" 和 "memory"
+            reverse: 是否降序
+
+        Returns:
+            ProcessColumns: 排序后的新表
+        """
+        return self.take(self.argsort(by, reverse))
+
+    def top(self, n: int, by: str = "cpu") -> "ProcessColumns":
+        """
+        取某列最大的 n 个进程，按该列降序排列
+
+        使用堆选择，复杂度为 O(N log n)，不对整表排序。
+
+        Args:
+            n: 进程数
+            by: 列名，也可使用别名 "cpu"（cpu_percent）和 "memory"（rss）
+
+        Returns:
+            ProcessColumns: 包含至多 n 行的新表
+        """
+        col = self.column(_SORT_ALIASES.get(by, by))
+        return self.take(heapq.nlargest(n, range(len(col)), key=col.__getitem__))
+
+    def group_by(self, key: str = "user") -> Dict[Any, "ProcessColumns"]:
+        """
+        按某列的值分组
+
+        Args:
+            key: 分组列名，例如 user、name、state、ppid
+
+        Returns:
+            Dict[Any, ProcessColumns]: 列值 -> 该组进程
+        """
+        groups: Dict[Any, List[int]] = {}
+        for row, value in enumerate(self.column(key)):
+            groups.setdefault(value, []).append(row)
+        return {value: self.take(rows) for value, rows in groups.items()}
+
+    def sum(self, name: str) -> Union[int, float]:
+        """
+        数值列求和
+
+        Args:
+            name: 数值列名，例如 rss、cpu_percent、threads
+
+        Returns:
+            Union[int, float]: 列之和
+        """
+        if name not in _NUMERIC_COLUMNS:
+            raise ValueError(f"不是数值列: {name}")
+        return sum(getattr(self, name))
+
+
+def process_columns(users: bool = True, pids: Optional[Sequence[int]] = None) -> ProcessColumns:
+    """
+    扫描 /proc 构建列式进程表
+
+    每个进程只读取 /proc/[pid]/stat（users 为 True 时另读 status），不构建任何 Process 对象，
+    仅支持 Linux。
+
+    Args:
+        users: 是否填充用户列，为 False 时用户列为空字符串，可省去读取 status 的开销
+        pids: 只采集这些进程，为 None 时采集全部进程
+
+    Returns:
+        ProcessColumns: 列式进程表
+    """
+    uptime = _read_uptime()
+    boot_time = time.time() - uptime
+    mem_total = _read_meminfo().total
+
+    cols = ProcessColumns()
+    for pid in (_iter_pids() if pids is None else pids):
+        try:
+            st = _read_pid_stat(pid)
+            user = _username(_read_pid_uid(pid)) if users else ""
+        except OSError:
+            # 进程在扫描期间退出或无权访问
+            continue
+        except (ValueError, IndexError) as e:
+            logger.debug(f"解析进程 {pid} 信息失败: {e}")
+            continue
+        cols._append(st, user, boot_time, uptime, mem_total)
+    return cols
@@ -0,0 +1,411 @@
+"""
+后台监控模块 - 在后台线程中定时采样，并将结果保存在固定内存的环形缓冲区中
+"""
+
+import math
+import threading
+import time
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+from pydantic import BaseModel, Field
+from loguru import logger
+
+from .monitor import CPUSampler, Snapshot, get_snapshot
+
+
+class SeriesSummary(BaseModel):
+    """时间序列窗口统计模型"""
+    metric: str = Field(..., description="指标名")
+    count: int = Field(0, description="窗口内样本数")
+    last: Optional[float] = Field(None, description="最新值")
+    mean: Optional[float] = Field(None, description="平均值")
+    min: Optional[float] = Field(None, description="最小值")
+    max: Optional[float] = Field(None, description="最大值")
+    p50: Optional[float] = Field(None, description="50 分位数")
+    p95: Optional[float] = Field(None, description="95 分位数")
+    p99: Optional[float] = Field(None, description="99 分位数")
+    rate: Optional[float] = Field(None, description="每秒变化率（适用于累计计数）")
+
+
+class RingBuffer:
+    """
+    定长时间序列环形缓冲区
+
+    时间戳和数值分别保存在预分配的 array('d') 中，写满后覆盖最旧的样本，
+    内存占用只与容量有关。
+    """
+    __slots__ = ("capacity", "_times", "_values", "_head", "_size")
+
+    def __init__(self, capacity: int):
+        """
+        初始化环形缓冲区
+
+        Args:
+            capacity: 最多保存的样本数
+        """
+        if capacity <= 0:
+            raise ValueError("capacity 必须大于 0")
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, value: float) -> None:
+        """追加一个样本"""
+        head = self._head
+        self._times[head] = timestamp
+        self._values[head] = value
+        self._head = (head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def newest_time(self) -> Optional[float]:
+        """最新样本的时间戳"""
+        if not self._size:
+            return None
+        return self._times[self._head - 1]
+
+    def iter_newest(self, n: Optional[int] = None) -> Iterator[Tuple[float, float]]:
+        """
+        从新到旧遍历样本，不复制缓冲区
+
+        Args:
+            n: 最多遍历的样本数，为 None 时遍历全部
+
+        Yields:
+            Tuple[float, float]: (时间戳, 数值)
+        """
+        count = self._size if n is None else min(n, self._size)
+        idx = self._head
+        times = self._times
+        values = self._values
+        for _ in range(count):
+            idx = idx - 1 if idx else self.capacity - 1
+            yield times[idx], values[idx]
+
+    def since(self, start: float) -> List[Tuple[float, float]]:
+        """
+        获取时间戳不早于 start 的样本，从旧到新排列
+
+        Args:
+            start: 起始时间戳
+
+        Returns:
+            List[Tuple[float, float]]: (时间戳, 数值) 列表
+        """
+        result = []
+        for item in self.iter_newest():
+            if item[0] < start:
+                break
+            result.append(item)
+        result.reverse()
+        return result
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """线性插值计算分位数，sorted_values 需已排序且非空"""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = (len(sorted_values) - 1) * q / 100.0
+    lo = math.floor(pos)
+    hi = math.ceil(pos)
+    if lo == hi:
+        return sorted_values[lo]
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def _rate(samples: List[Tuple[float, float]]) -> Optional[float]:
+    """计算累计计数的每秒变化率，计数器回退（重置）时只累加正增量"""
+    if len(samples) < 2:
+        return None
+    elapsed = samples[-1][0] - samples[0][0]
+    if elapsed <= 0:
+        return None
+    total = 0.0
+    prev = samples[0][1]
+    for _, value in samples[1:]:
+        if value >= prev:
+            total += value - prev
+        prev = value
+    return total / elapsed
+
+
+def _flatten_snapshot(snapshot: Snapshot) -> Iterator[Tuple[str, float]]:
+    """将快照展开为 (指标名, 数值) 序列"""
+    cpu = snapshot.cpu
+    yield "cpu.percent", cpu.percent
+    if cpu.times:
+        # 字段顺序与 /proc/stat 一致
+        yield "cpu.user", cpu.times[0]
+        yield "cpu.system", cpu.times[2]
+        yield "cpu.iowait", cpu.times[4]
+        yield "cpu.steal", cpu.times[7]
+
+    memory = snapshot.memory
+    yield "memory.percent", memory.percent
+    yield "memory.used", float(memory.used)
+    yield "memory.available", float(memory.available)
+
+    yield "load.1", snapshot.load_avg[0]
+    yield "load.5", snapshot.load_avg[1]
+    yield "load.15", snapshot.load_avg[2]
+
+    for disk in snapshot.disks:
+        if disk.stale:
+            continue
+        yield f"disk.percent:{disk.mountpoint}", disk.percent
+        yield f"disk.used:{disk.mountpoint}", float(disk.used)
+
+    for net in snapshot.network:
+        yield f"net.bytes_recv:{net.interface}", float(net.bytes_recv)
+        yield f"net.bytes_sent:{net.interface}", float(net.bytes_sent)
+        yield f"net.packets_recv:{net.interface}", float(net.packets_recv)
+        yield f"net.packets_sent:{net.interface}", float(net.packets_sent)
+        yield f"net.errors:{net.interface}", float(net.errin + net.errout)
+
+
+class Monitor:
+    """
+    后台监控服务
+
+    在守护线程中按固定间隔调用 get_snapshot()，将 CPU、内存、负载、磁盘和网络指标
+    写入每个指标独立的环形缓冲区。指标名形如 "cpu.percent"、"disk.percent:/"、
+    "net.bytes_recv:eth0"。长时间没有新样本的指标（例如已删除的网卡）会被清理，
+    因此总内存不随运行时间增长。
+
+    Example:
+        >>> with Monitor(interval=1.0) as monitor:
+        ...     time.sleep(10)
+        ...     print(monitor.mean("cpu.percent", window=5))
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        capacity: int = 3600,
+        disks: bool = True,
+        exclude_pseudo: bool = True,
+    ):
+        """
+        初始化监控服务
+
+        Args:
+            interval: 采样间隔(秒)
+            capacity: 每个指标保存的样本数
+            disks: 是否采集磁盘使用情况
+            exclude_pseudo: 是否过滤伪文件系统
+        """
+        self.interval = interval
+        self.capacity = capacity
+        self._disks = disks
+        self._exclude_pseudo = exclude_pseudo
+        self._cpu_sampler = CPUSampler()
+        self._series: Dict[str, RingBuffer] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "Monitor":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        """后台线程是否在运行"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """启动后台采样线程"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="wicspy-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        停止后台采样线程
+
+        Args:
+            timeout: 等待线程退出的最长时间(秒)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """后台线程主循环，按绝对时间排期，避免误差累积"""
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self.sample_once()
+            except Exception as e:
+                logger.error(f"监控采样失败: {e}")
+            next_tick += self.interval
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                # 采样耗时超过间隔，跳过错过的周期
+                next_tick = time.monotonic()
+                delay = 0
+            self._stop.wait(delay)
+
+    def sample_once(self) -> Snapshot:
+        """
+        立即采样一次并写入缓冲区
+
+        Returns:
+            Snapshot: 本次采样的快照
+        """
+        snapshot = get_snapshot(
+            disks=self._disks,
+            exclude_pseudo=self._exclude_pseudo,
+            cpu_sampler=self._cpu_sampler,
+        )
+        ts = snapshot.timestamp
+        with self._lock:
+            series = self._series
+            for name, value in _flatten_snapshot(snapshot):
+                buf = series.get(name)
+                if buf is None:
+                    buf = series[name] = RingBuffer(self.capacity)
+                buf.append(ts, value)
+            self._expire(ts)
+        return snapshot
+
+    def _expire(self, now: float) -> None:
+        """清理超过一个缓冲区周期没有新样本的指标"""
+        horizon = now - self.capacity * self.interval
+        expired = [
+            name for name, buf in self._series.items()
+            if (buf.newest_time() or 0.0) < horizon
+        ]
+        for name in expired:
+            del self._series[name]
+
+    def metrics(self) -> List[str]:
+        """
+        获取当前所有指标名
+
+        Returns:
+            List[str]: 指标名列表
+        """
+        with self._lock:
+            return sorted(self._series)
+
+    def last(self, metric: str, n: int = 1) -> List[Tuple[float, float]]:
+        """
+        获取最近 n 个样本
+
+        Args:
+            metric: 指标名
+            n: 样本数
+
+        Returns:
+            List[Tuple[float, float]]: (时间戳, 数值) 列表，从旧到新排列
+        """
+        with self._lock:
+            buf = self._series.get(metric)
+            if buf is None:
+                return []
+            result = list(buf.iter_newest(n))
+        result.reverse()
+        return result
+
+    def window(self, metric: str, window: float) -> List[Tuple[float, float]]:
+        """
+        获取最近 window 秒内的样本
+
+        Args:
+            metric: 指标名
+            window: 窗口长度(秒)
+
+        Returns:
+            List[Tuple[float, float]]: (时间戳, 数值) 列表，从旧到新排列
+        """
+        with self._lock:
+            buf = self._series.get(metric)
+            if buf is None:
+                return []
+            newest = buf.newest_time()
+            if newest is None:
+                return []
+            return buf.since(newest - window)
+
+    def mean(self, metric: str, window: float = 60.0) -> Optional[float]:
+        """窗口内平均值，没有样本时返回 None"""
+        values = [v for _, v in self.window(metric, window)]
+        return sum(values) / len(values) if values else None
+
+    def max(self, metric: str, window: float = 60.0) -> Optional[float]:
+        """窗口内最大值，没有样本时返回 None"""
+        values = [v for _, v in self.window(metric, window)]
+        return max(values) if values else None
+
+    def min(self, metric: str, window: float = 60.0) -> Optional[float]:
+        """窗口内最小值，没有样本时返回 None"""
+        values = [v for _, v in self.window(metric, window)]
+        return min(values) if values else None
+
+    def percentile(self, metric: str, q: float, window: float = 60.0) -> Optional[float]:
+        """
+        窗口内分位数
+
+        Args:
+            metric: 指标名
+            q: 分位数，0-100
+            window: 窗口长度(秒)
+
+        Returns:
+            Optional[float]: 分位数值，没有样本时返回 None
+        """
+        values = sorted(v for _, v in self.window(metric, window))
+        return _percentile(values, q) if values else None
+
+    def rate(self, metric: str, window: float = 60.0) -> Optional[float]:
+        """
+        累计计数指标在窗口内的每秒变化率
+
+        Args:
+            metric: 指标名，例如 "net.bytes_recv:eth0"
+            window: 窗口长度(秒)
+
+        Returns:
+            Optional[float]: 每秒变化率，样本不足时返回 None
+        """
+        return _rate(self.window(metric, window))
+
+    def summary(self, metric: str, window: float = 60.0) -> SeriesSummary:
+        """
+        窗口内统计汇总，只遍历一次窗口数据
+
+        Args:
+            metric: 指标名
+            window: 窗口长度(秒)
+
+        Returns:
+            SeriesSummary: 统计汇总对象
+        """
+        samples = self.window(metric, window)
+        if not samples:
+            return SeriesSummary(metric=metric)
+        values = sorted(v for _, v in samples)
+        return SeriesSummary(
+            metric=metric,
+            count=len(values),
+            last=samples[-1][1],
+            mean=sum(values) / len(values),
+            min=values[0],
+            max=values[-1],
+            p50=_percentile(values, 50),
+            p95=_percentile(values, 95),
+            p99=_percentile(values, 99),
+            rate=_rate(samples),
+        )
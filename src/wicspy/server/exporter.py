@@ -0,0 +1,335 @@
+"""
+指标导出模块 - 以 OpenMetrics 文本格式通过 HTTP 提供监控与进程指标，供 Prometheus 抓取
+"""
+
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from loguru import logger
+
+from .monitor import CPUSampler, _CPU_FIELDS, _read_meminfo, _read_uptime, get_snapshot
+from .process import (
+    _CLK_TCK,
+    _IS_LINUX,
+    _PAGE_SIZE,
+    _iter_pids,
+    _read_pid_stat,
+    _read_pid_uid,
+    _username,
+    list_processes,
+)
+
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# 指标名前缀
+PREFIX = "wicspy"
+
+# 响应体按此大小分块编码和写出
+_CHUNK_SIZE = 64 * 1024
+
+
+def _escape(value: str) -> str:
+    """转义标签值中的反斜杠、双引号和换行"""
+    if "\\" in value or '"' in value or "\n" in value:
+        value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return value
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    """格式化标签集合"""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _value(value: float) -> str:
+    """格式化样本值"""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _family(name: str, metric_type: str, help_text: str, unit: str = "") -> str:
+    """生成指标族的元数据行"""
+    lines = f"# TYPE {name} {metric_type}\n"
+    if unit:
+        lines += f"# UNIT {name} {unit}\n"
+    return lines + f"# HELP {name} {help_text}\n"
+
+
+def _process_samples() -> List[Tuple[int, str, str, float, float]]:
+    """
+    读取每个进程导出所需的值，Linux 上直接使用 stat 记录而不构建 Process 模型
+
+    Returns:
+        List[Tuple[int, str, str, float, float]]: (进程ID, 名称, 用户, CPU 百分比, 内存百分比)
+    """
+    if not _IS_LINUX:
+        return [
+            (p.pid, p.name, p.user, p.cpu_percent, p.memory_percent)
+            for p in list_processes(["pid", "name", "user", "cpu_percent", "memory_percent"])
+        ]
+    uptime = _read_uptime()
+    mem_total = _read_meminfo().total
+    samples = []
+    for pid in _iter_pids():
+        try:
+            st = _read_pid_stat(pid)
+            user = _username(_read_pid_uid(pid))
+        except OSError:
+            # 进程在扫描期间退出
+            continue
+        except (ValueError, IndexError) as e:
+            logger.debug(f"解析进程 {pid} 信息失败: {e}")
+            continue
+        # 与 list_processes 一致：CPU 使用率为进程生命周期内的平均值
+        elapsed = uptime - st.starttime / _CLK_TCK
+        cpu_percent = (st.utime + st.stime) / _CLK_TCK / elapsed * 100.0 if elapsed > 0 else 0.0
+        memory_percent = st.rss_pages * _PAGE_SIZE / mem_total * 100.0 if mem_total else 0.0
+        samples.append((pid, st.comm, user, cpu_percent, memory_percent))
+    return samples
+
+
+def _encode_chunks(parts: Iterable[str]) -> List[bytes]:
+    """将文本片段合并为约 _CHUNK_SIZE 大小的块并编码，不会同时持有完整的文本和字节两份副本"""
+    chunks: List[bytes] = []
+    buffer: List[str] = []
+    size = 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= _CHUNK_SIZE:
+            chunks.append("".join(buffer).encode("utf-8"))
+            buffer, size = [], 0
+    if buffer:
+        chunks.append("".join(buffer).encode("utf-8"))
+    return chunks
+
+
+def generate_metrics(
+    processes: bool = True,
+    cpu_sampler: Optional[CPUSampler] = None,
+) -> Iterator[str]:
+    """
+    逐段生成 OpenMetrics 文本
+
+    每个指标族单独产出一段文本，调用方可边生成边写出，进程数很多时也无需拼接大量中间对象。
+
+    Args:
+        processes: 是否包含每个进程的指标
+        cpu_sampler: CPU 采样器，为 None 时使用默认采样器
+
+    Yields:
+        str: OpenMetrics 文本片段，最后一段为 "# EOF"
+    """
+    snapshot = get_snapshot(cpu_sampler=cpu_sampler)
+    cpu = snapshot.cpu
+
+    name = f"{PREFIX}_cpu_usage_percent"
+    yield _family(name, "gauge", "Overall CPU usage since the previous scrape") + f"{name} {_value(cpu.percent)}\n"
+
+    if cpu.times:
+        name = f"{PREFIX}_cpu_mode_percent"
+        yield _family(name, "gauge", "CPU time share by mode since the previous scrape") + "".join(
+            f'{name}{{mode="{mode}"}} {_value(v)}\n' for mode, v in zip(_CPU_FIELDS, cpu.times)
+        )
+
+    if cpu.cores:
+        name = f"{PREFIX}_cpu_core_usage_percent"
+        yield _family(name, "gauge", "Per-core CPU usage since the previous scrape") + "".join(
+            f'{name}{{core="{i}"}} {_value(v)}\n' for i, v in enumerate(cpu.cores)
+        )
+
+    name = f"{PREFIX}_load_average"
+    yield _family(name, "gauge", "System load average") + "".join(
+        f'{name}{{period="{period}"}} {_value(v)}\n' for period, v in zip(("1m", "5m", "15m"), snapshot.load_avg)
+    )
+
+    memory = snapshot.memory
+    for field, help_text in (("total", "Total memory"), ("available", "Available memory"), ("used", "Used memory")):
+        name = f"{PREFIX}_memory_{field}_bytes"
+        yield _family(name, "gauge", help_text, "bytes") + f"{name} {_value(getattr(memory, field))}\n"
+
+    if snapshot.uptime is not None:
+        name = f"{PREFIX}_uptime_seconds"
+        yield _family(name, "gauge", "System uptime", "seconds") + f"{name} {_value(snapshot.uptime)}\n"
+
+    disk_families: Tuple[Tuple[str, str, str, str], ...] = (
+        ("filesystem_size_bytes", "total", "Filesystem size", "bytes"),
+        ("filesystem_used_bytes", "used", "Filesystem used space", "bytes"),
+        ("filesystem_free_bytes", "free", "Filesystem space available to unprivileged users", "bytes"),
+        ("filesystem_inodes", "inodes_total", "Filesystem inode count", ""),
+        ("filesystem_inodes_free", "inodes_free", "Filesystem free inodes", ""),
+        ("filesystem_stale", "stale", "Filesystem did not respond within the deadline", ""),
+    )
+    # 同一挂载点上叠加挂载时只有最后一次挂载可见，也只导出它，避免重复的标签集合
+    disks = list({d.mountpoint: d for d in snapshot.disks}.values())
+    disk_labels = [
+        _labels({"device": d.device, "mountpoint": d.mountpoint, "fstype": d.filesystem})
+        for d in disks
+    ]
+    for suffix, field, help_text, unit in disk_families:
+        name = f"{PREFIX}_{suffix}"
+        yield _family(name, "gauge", help_text, unit) + "".join(
+            f"{name}{labels} {_value(getattr(d, field))}\n" for d, labels in zip(disks, disk_labels)
+        )
+
+    net_families = (
+        ("network_receive_bytes", "bytes_recv", "Bytes received", "bytes"),
+        ("network_transmit_bytes", "bytes_sent", "Bytes transmitted", "bytes"),
+        ("network_receive_packets", "packets_recv", "Packets received", ""),
+        ("network_transmit_packets", "packets_sent", "Packets transmitted", ""),
+        ("network_receive_errors", "errin", "Receive errors", ""),
+        ("network_transmit_errors", "errout", "Transmit errors", ""),
+        ("network_receive_drop", "dropin", "Dropped incoming packets", ""),
+        ("network_transmit_drop", "dropout", "Dropped outgoing packets", ""),
+    )
+    net_labels = [_labels({"interface": n.interface}) for n in snapshot.network]
+    for suffix, field, help_text, unit in net_families:
+        name = f"{PREFIX}_{suffix}"
+        # OpenMetrics 中 counter 的样本名为指标族名加 _total 后缀
+        yield _family(name, "counter", help_text, unit) + "".join(
+            f"{name}_total{labels} {_value(getattr(n, field))}\n" for n, labels in zip(snapshot.network, net_labels)
+        )
+
+    if processes:
+        # 只读取导出所需的 stat 和 status，不读取 cmdline
+        samples = _process_samples()
+        cpu_name = f"{PREFIX}_process_cpu_percent"
+        mem_name = f"{PREFIX}_process_memory_percent"
+        proc_labels = [
+            _labels({"pid": str(pid), "name": name, "user": user}) for pid, name, user, _, _ in samples
+        ]
+        yield _family(cpu_name, "gauge", "Process CPU usage as reported by the process collector")
+        for sample, labels in zip(samples, proc_labels):
+            yield f"{cpu_name}{labels} {_value(sample[3])}\n"
+        yield _family(mem_name, "gauge", "Process memory usage as a share of total memory")
+        for sample, labels in zip(samples, proc_labels):
+            yield f"{mem_name}{labels} {_value(sample[4])}\n"
+
+    yield "# EOF\n"
+
+
+class MetricsExporter:
+    """
+    OpenMetrics 指标导出服务
+
+    基于标准库 ThreadingHTTPServer，在 /metrics 路径提供指标。采集结果缓存 cache_ttl 秒，
+    缓存过期时多个并发抓取只会触发一次采集，其余请求等待并共享同一结果。结果以编码后的
+    分块缓存并逐块写出，不拼接成完整的响应体。
+
+    Example:
+        >>> exporter = MetricsExporter(port=9184)
+        >>> exporter.start()
+    """
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 9184,
+        cache_ttl: float = 1.0,
+        processes: bool = True,
+    ):
+        """
+        初始化指标导出服务
+
+        Args:
+            host: 监听地址
+            port: 监听端口，为 0 时由系统分配
+            cache_ttl: 采集结果缓存时间(秒)
+            processes: 是否导出每个进程的指标
+        """
+        self.host = host
+        self.port = port
+        self.cache_ttl = cache_ttl
+        self.processes = processes
+        # 导出服务使用独立的 CPU 采样器，CPU 使用率即两次采集之间的值
+        self._cpu_sampler = CPUSampler()
+        self._cache: Tuple[float, List[bytes]] = (0.0, [])
+        self._collect_lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def collect(self) -> List[bytes]:
+        """
+        获取编码后的指标，缓存未过期时直接返回缓存
+
+        Returns:
+            List[bytes]: OpenMetrics 文本按顺序分成的块，调用方不应修改
+        """
+        expires, chunks = self._cache
+        if chunks and time.monotonic() < expires:
+            return chunks
+        with self._collect_lock:
+            # 等锁期间可能已有其他线程完成采集
+            expires, chunks = self._cache
+            if chunks and time.monotonic() < expires:
+                return chunks
+            chunks = _encode_chunks(generate_metrics(self.processes, self._cpu_sampler))
+            self._cache = (time.monotonic() + self.cache_ttl, chunks)
+            return chunks
+
+    def _make_handler(self) -> type:
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                try:
+                    chunks = exporter.collect()
+                except Exception as e:
+                    logger.error(f"采集指标失败: {e}")
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(sum(len(chunk) for chunk in chunks)))
+                self.end_headers()
+                for chunk in chunks:
+                    self.wfile.write(chunk)
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug(f"{self.address_string()} - {format % args}")
+
+        return Handler
+
+    def _bind(self) -> ThreadingHTTPServer:
+        if self._server is None:
+            self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+            self._server.daemon_threads = True
+            self.port = self._server.server_address[1]
+            logger.info(f"指标导出服务监听于 http://{self.host}:{self.port}/metrics")
+        return self._server
+
+    def serve_forever(self) -> None:
+        """在当前线程中运行服务，直到调用 stop()"""
+        self._bind().serve_forever()
+
+    def start(self) -> None:
+        """在后台守护线程中启动服务"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        server = self._bind()
+        self._thread = threading.Thread(target=server.serve_forever, name="wicspy-exporter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止服务并释放端口"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
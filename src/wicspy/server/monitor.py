@@ -2,16 +2,27 @@
 服务器监控模块 - 提供系统信息、资源使用情况等监控功能
 """
 
+import asyncio
+import functools
 import os
 import platform
+import select
 import socket
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Any, Tuple, Union
+from datetime import datetime, timedelta
 import subprocess
 import json
 from pydantic import BaseModel, Field
 from loguru import logger
 
+from wicspy.config import get_config
+
+
+_IS_LINUX = platform.system() == "Linux"
+
 
 class SystemInfo(BaseModel):
     """系统信息模型"""
@@ -43,6 +54,23 @@ class DiskUsage(BaseModel):
     free: int = Field(..., description="可用容量(字节)")
     percent: float = Field(..., description="使用百分比")
     filesystem: str = Field(..., description="文件系统类型")
+    inodes_total: int = Field(0, description="inode 总数")
+    inodes_used: int = Field(0, description="已用 inode 数")
+    inodes_free: int = Field(0, description="空闲 inode 数")
+    inodes_percent: float = Field(0.0, description="inode 使用百分比")
+    stale: bool = Field(False, description="挂载点无响应，数据为上次结果或空值")
+
+
+class CPUTimesPercent(BaseModel):
+    """CPU 各状态时间占比模型"""
+    user: float = Field(0.0, description="用户态百分比")
+    nice: float = Field(0.0, description="低优先级用户态百分比")
+    system: float = Field(0.0, description="内核态百分比")
+    idle: float = Field(0.0, description="空闲百分比")
+    iowait: float = Field(0.0, description="等待 I/O 百分比")
+    irq: float = Field(0.0, description="硬中断百分比")
+    softirq: float = Field(0.0, description="软中断百分比")
+    steal: float = Field(0.0, description="被虚拟化宿主占用百分比")
 
 
 class CPUUsage(BaseModel):
@@ -50,29 +78,500 @@ class CPUUsage(BaseModel):
     percent: float = Field(..., description="CPU使用百分比")
     cores: List[float] = Field(..., description="每个核心的使用百分比")
     load_avg: List[float] = Field(..., description="1分钟、5分钟、15分钟负载")
+    times: Optional[CPUTimesPercent] = Field(None, description="总体各状态时间占比")
+    core_times: List[CPUTimesPercent] = Field(default_factory=list, description="每个核心各状态时间占比")
+
+
+class NetworkIO(BaseModel):
+    """网络接口累计计数模型"""
+    interface: str = Field(..., description="接口名")
+    bytes_recv: int = Field(0, description="累计接收字节数")
+    packets_recv: int = Field(0, description="累计接收包数")
+    errin: int = Field(0, description="累计接收错误数")
+    dropin: int = Field(0, description="累计接收丢包数")
+    bytes_sent: int = Field(0, description="累计发送字节数")
+    packets_sent: int = Field(0, description="累计发送包数")
+    errout: int = Field(0, description="累计发送错误数")
+    dropout: int = Field(0, description="累计发送丢包数")
+
+
+class NetworkIORate(BaseModel):
+    """网络接口吞吐速率模型"""
+    interface: str = Field(..., description="接口名")
+    bytes_recv_per_sec: float = Field(0.0, description="每秒接收字节数")
+    bytes_sent_per_sec: float = Field(0.0, description="每秒发送字节数")
+    packets_recv_per_sec: float = Field(0.0, description="每秒接收包数")
+    packets_sent_per_sec: float = Field(0.0, description="每秒发送包数")
+    errin_per_sec: float = Field(0.0, description="每秒接收错误数")
+    errout_per_sec: float = Field(0.0, description="每秒发送错误数")
+    dropin_per_sec: float = Field(0.0, description="每秒接收丢包数")
+    dropout_per_sec: float = Field(0.0, description="每秒发送丢包数")
+
+
+class DiskIORate(BaseModel):
+    """块设备吞吐速率模型"""
+    device: str = Field(..., description="设备名")
+    read_iops: float = Field(0.0, description="每秒读次数")
+    write_iops: float = Field(0.0, description="每秒写次数")
+    read_bytes_per_sec: float = Field(0.0, description="每秒读字节数")
+    write_bytes_per_sec: float = Field(0.0, description="每秒写字节数")
+    read_latency_ms: float = Field(0.0, description="平均读延迟(毫秒)")
+    write_latency_ms: float = Field(0.0, description="平均写延迟(毫秒)")
+    utilization: float = Field(0.0, description="设备繁忙时间百分比")
+
+
+class IORates(BaseModel):
+    """网络与块设备吞吐速率模型"""
+    interval: float = Field(..., description="采样区间(秒)")
+    network: List[NetworkIORate] = Field(default_factory=list, description="各网络接口速率")
+    disks: List[DiskIORate] = Field(default_factory=list, description="各块设备速率")
+
+
+class SystemSnapshot(BaseModel):
+    """系统快照模型"""
+    timestamp: datetime = Field(..., description="采样时间")
+    cpu: CPUUsage = Field(..., description="CPU使用情况")
+    memory: MemoryUsage = Field(..., description="内存使用情况")
+    load_avg: List[float] = Field(..., description="1分钟、5分钟、15分钟负载")
+    uptime: Optional[float] = Field(None, description="系统运行时间(秒)")
+    disks: List[DiskUsage] = Field(default_factory=list, description="磁盘使用情况")
+    network: List[NetworkIO] = Field(default_factory=list, description="网络接口累计计数")
+
+
+class CPURecord(NamedTuple):
+    """CPU 采样记录，轻量且不做校验，按需转换为 CPUUsage"""
+    percent: float
+    cores: Tuple[float, ...]
+    times: Tuple[float, ...]
+    core_times: Tuple[Tuple[float, ...], ...]
+
+    def to_model(self, load_avg: List[float]) -> CPUUsage:
+        """转换为 CPUUsage 模型"""
+        return CPUUsage(
+            percent=self.percent,
+            cores=list(self.cores),
+            load_avg=load_avg,
+            times=CPUTimesPercent(**dict(zip(_CPU_FIELDS, self.times))),
+            core_times=[CPUTimesPercent(**dict(zip(_CPU_FIELDS, t))) for t in self.core_times],
+        )
+
+
+class MemoryRecord(NamedTuple):
+    """内存采样记录"""
+    total: int
+    available: int
+    used: int
+    percent: float
+
+    def to_model(self) -> MemoryUsage:
+        """转换为 MemoryUsage 模型"""
+        return MemoryUsage(**self._asdict())
+
+
+class DiskRecord(NamedTuple):
+    """磁盘采样记录"""
+    device: str
+    mountpoint: str
+    total: int
+    used: int
+    free: int
+    percent: float
+    filesystem: str
+    inodes_total: int = 0
+    inodes_used: int = 0
+    inodes_free: int = 0
+    inodes_percent: float = 0.0
+    stale: bool = False
+
+    def to_model(self) -> DiskUsage:
+        """转换为 DiskUsage 模型"""
+        return DiskUsage(**self._asdict())
+
+
+class NetIORecord(NamedTuple):
+    """网络接口累计计数记录"""
+    interface: str
+    bytes_recv: int
+    packets_recv: int
+    errin: int
+    dropin: int
+    bytes_sent: int
+    packets_sent: int
+    errout: int
+    dropout: int
+
+    def to_model(self) -> NetworkIO:
+        """转换为 NetworkIO 模型"""
+        return NetworkIO(**self._asdict())
+
+
+class _ProcFile:
+    """
+    保持打开的 /proc 文件
+
+    /proc 下的文件在每次从偏移 0 读取时都会重新生成内容，保持描述符打开并用 pread 读取，
+    可以省去每次采样的 open/close 开销。
+    """
+    __slots__ = ("path", "_fd", "_bufsize")
+
+    def __init__(self, path: str, bufsize: int = 8192):
+        self.path = path
+        self._fd: Optional[int] = None
+        self._bufsize = bufsize
+
+    def read(self) -> bytes:
+        """从头读取文件完整内容"""
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+        while True:
+            data = os.pread(self._fd, self._bufsize, 0)
+            if len(data) < self._bufsize:
+                return data
+            # 缓冲区被填满，说明内容可能被截断，扩大后重读
+            self._bufsize *= 2
+
+
+_proc_files: Dict[str, _ProcFile] = {}
+
+
+def _read_proc_file(path: str) -> bytes:
+    """
+    读取 /proc 文件，描述符在进程内复用
+
+    Args:
+        path: 文件路径，不应包含 /proc/self 等随进程变化的路径
+
+    Returns:
+        bytes: 文件内容
+    """
+    proc_file = _proc_files.get(path)
+    if proc_file is None:
+        proc_file = _proc_files.setdefault(path, _ProcFile(path))
+    return proc_file.read()
+
+
+# /proc/stat 中 cpu 行参与计算的字段（guest 已计入 user，不重复累加）
+_CPU_FIELDS = ("user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal")
+_CPU_IDLE = 3
+_CPU_IOWAIT = 4
+
+
+def _read_cpu_times(path: str = "/proc/stat") -> List[Tuple[str, Tuple[int, ...]]]:
+    """
+    一次性读取 /proc/stat 中所有 cpu 行
+
+    Returns:
+        List[Tuple[str, Tuple[int, ...]]]: (名称, 计数器) 列表，第一项为总体 "cpu"
+    """
+    data = _read_proc_file(path)
+
+    result = []
+    nfields = len(_CPU_FIELDS)
+    for line in data.split(b"\n"):
+        if not line.startswith(b"cpu"):
+            # cpu 行总在文件开头，之后无需继续扫描
+            if result:
+                break
+            continue
+        parts = line.split()
+        counters = tuple(int(x) for x in parts[1:nfields + 1])
+        if len(counters) < nfields:
+            counters += (0,) * (nfields - len(counters))
+        result.append((parts[0].decode(), counters))
+    return result
+
+
+def _read_load_avg(path: str = "/proc/loadavg") -> List[float]:
+    """读取 1、5、15 分钟负载"""
+    parts = _read_proc_file(path).split()
+    return [float(parts[0]), float(parts[1]), float(parts[2])]
+
+
+def _cpu_percents(
+    cur: Tuple[int, ...], prev: Optional[Tuple[int, ...]]
+) -> Optional[Tuple[float, Tuple[float, ...]]]:
+    """
+    根据两次计数器计算使用率
+
+    Returns:
+        Optional[Tuple[float, Tuple[float, ...]]]: (繁忙百分比, 各字段百分比)，
+        两次采样间无计数变化时返回 None
+    """
+    if prev is None:
+        deltas = cur
+    else:
+        # 计数器偶尔会因 CPU 热插拔等原因回退，负值按 0 处理
+        deltas = tuple(c - p if c >= p else 0 for c, p in zip(cur, prev))
+    total = sum(deltas)
+    if total <= 0:
+        return None
+    scale = 100.0 / total
+    fields = tuple(d * scale for d in deltas)
+    busy = 100.0 - fields[_CPU_IDLE] - fields[_CPU_IOWAIT]
+    return busy, fields
+
+
+class CPUSampler:
+    """
+    基于 /proc/stat 差值的 CPU 采样器
+
+    每次 sample() 只读取一次 /proc/stat，与上一次保存的计数器做差，
+    得到两次采样之间真实的总体及每个核心使用率。首次采样没有上一次计数器，
+    返回开机以来的平均值。
+    """
+
+    def __init__(self, proc_stat: str = "/proc/stat", proc_loadavg: str = "/proc/loadavg"):
+        """
+        初始化 CPU 采样器
+
+        Args:
+            proc_stat: /proc/stat 路径
+            proc_loadavg: /proc/loadavg 路径
+        """
+        self._proc_stat = proc_stat
+        self._proc_loadavg = proc_loadavg
+        self._prev: Dict[str, Tuple[int, ...]] = {}
+        self._last: Dict[str, Tuple[float, Tuple[float, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def sample_raw(self) -> List[Tuple[str, float, Tuple[float, ...]]]:
+        """
+        采样并返回原始结果，不构建 pydantic 模型
+
+        Returns:
+            List[Tuple[str, float, Tuple[float, ...]]]: (名称, 繁忙百分比, 各字段百分比) 列表，
+            第一项为总体 "cpu"
+        """
+        times = _read_cpu_times(self._proc_stat)
+        with self._lock:
+            prev = self._prev
+            last = self._last
+            result = []
+            for name, counters in times:
+                computed = _cpu_percents(counters, prev.get(name))
+                if computed is None:
+                    # 两次采样间隔过短，沿用上一次结果
+                    computed = last.get(name) or (0.0, (0.0,) * len(_CPU_FIELDS))
+                else:
+                    last[name] = computed
+                result.append((name, computed[0], computed[1]))
+            self._prev = dict(times)
+        return result
+
+    def sample_record(self) -> CPURecord:
+        """
+        采样并返回轻量记录
+
+        Returns:
+            CPURecord: 自上次采样以来的 CPU 使用记录
+        """
+        raw = self.sample_raw()
+        cores = raw[1:]
+        return CPURecord(
+            percent=raw[0][1],
+            cores=tuple(busy for _, busy, _ in cores),
+            times=raw[0][2],
+            core_times=tuple(fields for _, _, fields in cores),
+        )
+
+    def sample(self) -> CPUUsage:
+        """
+        采样 CPU 使用情况
+
+        Returns:
+            CPUUsage: 自上次采样以来的 CPU 使用情况对象
+        """
+        record = self.sample_record()
+        try:
+            load_avg = _read_load_avg(self._proc_loadavg)
+        except Exception:
+            load_avg = [0.0, 0.0, 0.0]
+        return record.to_model(load_avg)
+
+
+_default_cpu_sampler: Optional[CPUSampler] = None
+
+
+def get_cpu_sampler() -> CPUSampler:
+    """
+    获取默认 CPU 采样器实例
+
+    Returns:
+        CPUSampler: CPU 采样器实例
+    """
+    global _default_cpu_sampler
+    if _default_cpu_sampler is None:
+        _default_cpu_sampler = CPUSampler()
+    return _default_cpu_sampler
+
+
+def _read_meminfo(path: str = "/proc/meminfo") -> MemoryRecord:
+    """
+    读取 /proc/meminfo 中的总内存和可用内存
+
+    Returns:
+        MemoryRecord: 内存采样记录
+    """
+    data = _read_proc_file(path)
+
+    mem_total = 0
+    mem_available = 0
+    for line in data.split(b"\n"):
+        if line.startswith(b"MemTotal:"):
+            mem_total = int(line.split()[1]) * 1024  # KB to bytes
+        elif line.startswith(b"MemAvailable:"):
+            mem_available = int(line.split()[1]) * 1024  # KB to bytes
+            # MemAvailable 位于 MemTotal 之后，之后的行无需解析
+            break
+
+    mem_used = mem_total - mem_available
+    mem_percent = (mem_used / mem_total) * 100.0 if mem_total else 0.0
+    return MemoryRecord(total=mem_total, available=mem_available, used=mem_used, percent=mem_percent)
+
+
+def _read_uptime(path: str = "/proc/uptime") -> float:
+    """读取系统运行时间(秒)"""
+    return float(_read_proc_file(path).split()[0])
+
+
+def _read_net_dev(path: str = "/proc/net/dev") -> List[NetIORecord]:
+    """
+    解析 /proc/net/dev 中各网络接口的累计计数
+
+    Returns:
+        List[NetIORecord]: 网络接口累计计数记录列表
+    """
+    data = _read_proc_file(path)
+
+    result = []
+    # 前两行为标题
+    for line in data.split(b"\n")[2:]:
+        name, sep, rest = line.partition(b":")
+        if not sep:
+            continue
+        v = rest.split()
+        if len(v) < 12:
+            continue
+        result.append(NetIORecord(
+            interface=name.strip().decode(),
+            bytes_recv=int(v[0]),
+            packets_recv=int(v[1]),
+            errin=int(v[2]),
+            dropin=int(v[3]),
+            bytes_sent=int(v[8]),
+            packets_sent=int(v[9]),
+            errout=int(v[10]),
+            dropout=int(v[11]),
+        ))
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _static_host_facts() -> Dict[str, str]:
+    """
+    获取进程生命周期内不会变化的主机信息，只计算一次
+
+    Returns:
+        Dict[str, str]: 平台、版本、架构、处理器和 Python 版本
+    """
+    return {
+        "platform": platform.system(),
+        "platform_version": platform.version(),
+        "architecture": platform.machine(),
+        # Linux 上 platform.processor() 会启动 uname 子进程
+        "processor": platform.processor(),
+        "python_version": platform.python_version(),
+    }
+
+
+# SIOCGIFADDR ioctl 请求号（Linux）
+_SIOCGIFADDR = 0x8915
+
+
+def _route_ip() -> Optional[str]:
+    """通过 UDP 套接字的路由选择获取出口 IP，connect 不会发送任何数据包，也不查询 DNS"""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        try:
+            s.connect(("192.0.2.1", 9))  # TEST-NET-1 文档地址
+            ip = s.getsockname()[0]
+        except OSError:
+            return None
+    return ip if ip and ip != "0.0.0.0" else None
+
+
+def _interface_ip() -> Optional[str]:
+    """枚举网络接口，返回第一个非回环接口的 IPv4 地址"""
+    if not _IS_LINUX:
+        return None
+    import fcntl
+    import struct
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for _, name in socket.if_nameindex():
+            if name == "lo":
+                continue
+            try:
+                packed = fcntl.ioctl(s.fileno(), _SIOCGIFADDR, struct.pack("256s", name[:15].encode()))
+            except OSError:
+                # 接口没有 IPv4 地址
+                continue
+            return socket.inet_ntoa(packed[20:24])
+    return None
+
+
+_ip_cache: Tuple[float, str] = (0.0, "")
+_ip_lock = threading.Lock()
+
+
+def _get_ip_address() -> str:
+    """
+    获取本机 IP 地址，结果按 ip_cache_ttl 配置缓存
+
+    不再调用 gethostbyname，避免解析器异常时阻塞数秒。
+
+    Returns:
+        str: IP 地址，无法获取时返回 "unknown"
+    """
+    global _ip_cache
+    now = time.monotonic()
+    expires, ip = _ip_cache
+    if ip and now < expires:
+        return ip
+
+    with _ip_lock:
+        expires, ip = _ip_cache
+        if ip and now < expires:
+            return ip
+        try:
+            ip = _route_ip() or _interface_ip() or "unknown"
+        except Exception as e:
+            logger.debug(f"获取IP地址失败: {e}")
+            ip = "unknown"
+        _ip_cache = (now + get_config("ip_cache_ttl", 300), ip)
+    return ip
 
 
 def get_system_info() -> SystemInfo:
     """
     获取系统信息
+
+    平台、版本、架构等静态信息只计算一次并缓存，IP 地址按 TTL 缓存，
+    每次调用只刷新主机名、当前时间和运行时间。
     
     Returns:
         SystemInfo: 系统信息对象
     """
     try:
         hostname = socket.gethostname()
-        ip_address = socket.gethostbyname(hostname)
     except Exception:
         hostname = "unknown"
-        ip_address = "unknown"
+    ip_address = _get_ip_address()
         
     # 获取系统运行时间
     uptime = None
-    if platform.system() == "Linux":
+    if _IS_LINUX:
         try:
-            with open("/proc/uptime", "r") as f:
-                uptime_seconds = float(f.readline().split()[0])
-                uptime = str(datetime.timedelta(seconds=uptime_seconds))
+            uptime = str(timedelta(seconds=int(_read_uptime())))
         except Exception:
             uptime = None
     elif platform.system() == "Darwin":  # macOS
@@ -85,14 +584,10 @@ def get_system_info() -> SystemInfo:
             
     return SystemInfo(
         hostname=hostname,
-        platform=platform.system(),
-        platform_version=platform.version(),
-        architecture=platform.machine(),
-        processor=platform.processor(),
         ip_address=ip_address,
-        python_version=platform.python_version(),
         current_time=datetime.now(),
-        uptime=uptime
+        uptime=uptime,
+        **_static_host_facts(),
     )
 
 
@@ -105,27 +600,7 @@ def get_memory_usage() -> MemoryUsage:
     """
     if platform.system() == "Linux":
         try:
-            with open("/proc/meminfo", "r") as f:
-                meminfo = f.readlines()
-                
-            mem_total = 0
-            mem_available = 0
-            
-            for line in meminfo:
-                if "MemTotal" in line:
-                    mem_total = int(line.split()[1]) * 1024  # KB to bytes
-                elif "MemAvailable" in line:
-                    mem_available = int(line.split()[1]) * 1024  # KB to bytes
-                    
-            mem_used = mem_total - mem_available
-            mem_percent = (mem_used / mem_total) * 100.0
-            
-            return MemoryUsage(
-                total=mem_total,
-                available=mem_available,
-                used=mem_used,
-                percent=mem_percent
-            )
+            return _read_meminfo().to_model()
         except Exception as e:
             logger.error(f"获取内存信息失败: {e}")
             
@@ -171,12 +646,460 @@ def get_memory_usage() -> MemoryUsage:
     )
 
 
-def get_disk_usage(path: str = "/") -> List[DiskUsage]:
+# 伪文件系统类型，exclude_pseudo=True 时过滤
+PSEUDO_FILESYSTEMS = frozenset({
+    "autofs", "binfmt_misc", "bpf", "cgroup", "cgroup2", "configfs", "debugfs",
+    "devpts", "devtmpfs", "efivarfs", "fusectl", "hugetlbfs", "mqueue", "nsfs",
+    "overlay", "proc", "pstore", "ramfs", "rpc_pipefs", "securityfs", "selinuxfs",
+    "squashfs", "sysfs", "tmpfs", "tracefs",
+})
+
+
+class MountEntry(NamedTuple):
+    """挂载点记录"""
+    device: str
+    mountpoint: str
+    fstype: str
+    # 挂载的是文件系统中的哪个目录，bind mount 和 cgroup 命名空间中不为 "/"
+    root: str = "/"
+
+
+def _unescape_mount_field(value: str) -> str:
+    """还原 mountinfo 中以八进制转义的空格、制表符等字符"""
+    if "\\" not in value:
+        return value
+    return value.encode("latin-1").decode("unicode_escape").encode("latin-1").decode(
+        "utf-8", errors="surrogateescape"
+    )
+
+
+def _parse_mountinfo(data: str) -> List[MountEntry]:
+    """
+    解析 /proc/self/mountinfo 内容
+
+    Args:
+        data: mountinfo 文件内容
+
+    Returns:
+        List[MountEntry]: 挂载点记录列表
+    """
+    result = []
+    for line in data.splitlines():
+        parts = line.split()
+        try:
+            # 可选字段数量不定，以 "-" 分隔
+            sep = parts.index("-", 6)
+            root = _unescape_mount_field(parts[3])
+            mountpoint = _unescape_mount_field(parts[4])
+            fstype = parts[sep + 1]
+            device = _unescape_mount_field(parts[sep + 2])
+        except (ValueError, IndexError):
+            continue
+        result.append(MountEntry(device=device, mountpoint=mountpoint, fstype=fstype, root=root))
+    return result
+
+
+class MountTable:
+    """
+    带缓存的挂载表
+
+    解析结果会被缓存，内核在挂载表变化时会对 mountinfo 文件描述符触发 POLLPRI，
+    只有收到该事件时才重新读取文件。
+    """
+
+    def __init__(self, path: str = "/proc/self/mountinfo"):
+        """
+        初始化挂载表
+
+        Args:
+            path: mountinfo 路径
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._mounts: Optional[List[MountEntry]] = None
+        self._fd: Optional[int] = None
+        self._poller: Optional[Any] = None
+
+    def _changed(self) -> bool:
+        """检查挂载表自上次读取后是否变化"""
+        if self._poller is None:
+            return True
+        return bool(self._poller.poll(0))
+
+    def _reload(self) -> List[MountEntry]:
+        """重新读取并解析 mountinfo"""
+        if self._fd is None and hasattr(select, "poll"):
+            try:
+                self._fd = os.open(self._path, os.O_RDONLY)
+                self._poller = select.poll()
+                self._poller.register(self._fd, select.POLLPRI | select.POLLERR)
+            except OSError:
+                self._fd = None
+                self._poller = None
+
+        if self._fd is not None:
+            # POLLPRI 由 poll() 消费：内核为每个打开的文件描述记录已见的挂载事件计数，
+            # poll() 时发现计数变化才报告并更新记录，读取不会清除它，因此每次都重新 poll()；
+            # 这里只需回到开头，用同一个描述符重新读取内容
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            chunks = []
+            while True:
+                chunk = os.read(self._fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks).decode("utf-8", errors="surrogateescape")
+        else:
+            with open(self._path, "r", errors="surrogateescape") as f:
+                data = f.read()
+
+        self._mounts = _parse_mountinfo(data)
+        return self._mounts
+
+    def mounts(self) -> List[MountEntry]:
+        """
+        获取当前挂载点列表
+
+        Returns:
+            List[MountEntry]: 挂载点记录列表
+        """
+        with self._lock:
+            if self._mounts is None or self._changed():
+                return self._reload()
+            return self._mounts
+
+    def find(self, path: str) -> Optional[MountEntry]:
+        """
+        查找包含指定路径的挂载点
+
+        只按挂载点前缀对规范化后的路径做字符串匹配，不访问文件系统：realpath() 需要逐级
+        lstat，在无响应的 NFS、FUSE 挂载上会永久阻塞调用线程。因此路径中的符号链接不会被
+        解析，按链接本身所在的挂载点匹配。
+
+        Args:
+            path: 文件系统路径
+
+        Returns:
+            Optional[MountEntry]: 最深的匹配挂载点，未找到时返回 None
+        """
+        path = os.path.abspath(path)
+        best: Optional[MountEntry] = None
+        for mount in self.mounts():
+            mp = mount.mountpoint
+            if path == mp or path.startswith(mp.rstrip("/") + "/"):
+                # 同一挂载点被多次挂载时，后出现的覆盖先出现的
+                if best is None or len(mp) >= len(best.mountpoint):
+                    best = mount
+        return best
+
+    def close(self) -> None:
+        """关闭持有的文件描述符"""
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+            self._fd = None
+            self._poller = None
+            self._mounts = None
+
+
+_default_mount_table: Optional[MountTable] = None
+
+
+def get_mount_table() -> MountTable:
+    """
+    获取默认挂载表实例
+
+    Returns:
+        MountTable: 挂载表实例
+    """
+    global _default_mount_table
+    if _default_mount_table is None:
+        _default_mount_table = MountTable()
+    return _default_mount_table
+
+
+def _statvfs_usage(mount: MountEntry) -> DiskRecord:
+    """
+    通过 statvfs 获取单个挂载点的使用情况
+
+    Args:
+        mount: 挂载点记录
+
+    Returns:
+        DiskRecord: 磁盘采样记录
+    """
+    st = os.statvfs(mount.mountpoint)
+    total = st.f_blocks * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    # 与 df 一致：百分比以普通用户可用空间为基准
+    usable = used + free
+    percent = used / usable * 100.0 if usable else 0.0
+
+    # 与 df -i 一致：已用和空闲 inode 都以 f_ffree 计算，保证 used + free == total
+    inodes_total = st.f_files
+    inodes_free = st.f_ffree
+    inodes_used = inodes_total - inodes_free
+    inodes_percent = inodes_used / inodes_total * 100.0 if inodes_total else 0.0
+
+    return DiskRecord(
+        device=mount.device,
+        mountpoint=mount.mountpoint,
+        total=total,
+        used=used,
+        free=free,
+        percent=percent,
+        filesystem=mount.fstype,
+        inodes_total=inodes_total,
+        inodes_used=inodes_used,
+        inodes_free=inodes_free,
+        inodes_percent=inodes_percent,
+    )
+
+
+def _select_mounts(path: Optional[str], exclude_pseudo: bool, table: MountTable) -> List[MountEntry]:
+    """根据路径和过滤条件选择要采集的挂载点"""
+    if path is not None:
+        mount = table.find(path)
+        return [mount] if mount is not None else []
+    mounts = table.mounts()
+    if exclude_pseudo:
+        mounts = [m for m in mounts if m.fstype not in PSEUDO_FILESYSTEMS]
+    return mounts
+
+
+class _DiskCall:
+    """单个挂载点的 statvfs 调用，记录工作线程实际开始执行的时间"""
+    __slots__ = ("mount", "started", "future")
+
+    def __init__(self, mount: MountEntry):
+        self.mount = mount
+        # 仍在线程池队列中时为 None
+        self.started: Optional[float] = None
+        self.future: Optional["Future[DiskRecord]"] = None
+
+    def run(self) -> DiskRecord:
+        self.started = time.monotonic()
+        return _statvfs_usage(self.mount)
+
+    def hung(self, now: float, timeout: float) -> bool:
+        """已经开始执行且超过截止时间仍未返回；排队中的调用不算卡住"""
+        return not self.future.done() and self.started is not None and now - self.started >= timeout
+
+
+class DiskCollector:
+    """
+    带超时保护的磁盘使用情况采集器
+
+    每个挂载点的 statvfs 在有界线程池中并行执行，超过截止时间仍未返回的挂载点
+    （例如无响应的 NFS、FUSE）标记为 stale，不会阻塞其他挂载点。截止时间从工作线程
+    实际开始执行时算起，只有开始执行后超时的挂载点进入退避；仍在排队的调用只在本次
+    标记为 stale，下次采集时继续等待。同一挂载点最多只有一个调用在执行，卡住的调用
+    占满全部线程时改用新的线程池，其余挂载点不会一直排在卡住的线程后面。
+    """
+
+    def __init__(
+        self,
+        mount_table: Optional[MountTable] = None,
+        max_workers: int = 8,
+        timeout: float = 2.0,
+        backoff: float = 60.0,
+    ):
+        """
+        初始化磁盘采集器
+
+        Args:
+            mount_table: 挂载表，为 None 时使用默认挂载表
+            max_workers: 线程池最大线程数
+            timeout: 单次采集的截止时间(秒)
+            backoff: 超时挂载点的跳过时间(秒)
+        """
+        self._table = mount_table
+        self._timeout = timeout
+        self._backoff = backoff
+        self._max_workers = max_workers
+        self._executor = self._new_executor()
+        self._lock = threading.Lock()
+        # 挂载点 -> 仍在排队或执行的 statvfs 调用
+        self._pending: Dict[str, _DiskCall] = {}
+        # 挂载点 -> 退避截止时间(monotonic)
+        self._hung_until: Dict[str, float] = {}
+        # 挂载点 -> 上一次成功的结果
+        self._last: Dict[str, DiskRecord] = {}
+
+    def _new_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="wicspy-disk")
+
+    def _stale(self, mount: MountEntry) -> DiskRecord:
+        """构造无响应挂载点的结果"""
+        last = self._last.get(mount.mountpoint)
+        if last is not None:
+            return last._replace(stale=True)
+        return DiskRecord(
+            device=mount.device,
+            mountpoint=mount.mountpoint,
+            total=0,
+            used=0,
+            free=0,
+            percent=0.0,
+            filesystem=mount.fstype,
+            stale=True,
+        )
+
+    def collect(self, path: Optional[str] = None, exclude_pseudo: bool = False) -> List[DiskUsage]:
+        """
+        采集磁盘使用情况
+
+        Args:
+            path: 要检查的路径，指定时只返回包含该路径的挂载点
+            exclude_pseudo: 是否过滤伪文件系统
+
+        Returns:
+            List[DiskUsage]: 磁盘使用情况对象列表，顺序与挂载表一致
+        """
+        return [r.to_model() for r in self.collect_records(path, exclude_pseudo)]
+
+    def collect_records(self, path: Optional[str] = None, exclude_pseudo: bool = False) -> List[DiskRecord]:
+        """
+        采集磁盘使用情况，返回轻量记录
+
+        Args:
+            path: 要检查的路径，指定时只返回包含该路径的挂载点
+            exclude_pseudo: 是否过滤伪文件系统
+
+        Returns:
+            List[DiskRecord]: 磁盘采样记录列表，顺序与挂载表一致
+        """
+        submitted = self._submit(path, exclude_pseudo)
+        futures = [c.future for _, c in submitted if c is not None]
+        if futures:
+            wait(futures, timeout=self._timeout)
+        return self._finish(submitted)
+
+    async def collect_records_async(
+        self, path: Optional[str] = None, exclude_pseudo: bool = False
+    ) -> List[DiskRecord]:
+        """
+        异步采集磁盘使用情况，等待期间不阻塞事件循环
+
+        Args:
+            path: 要检查的路径，指定时只返回包含该路径的挂载点
+            exclude_pseudo: 是否过滤伪文件系统
+
+        Returns:
+            List[DiskRecord]: 磁盘采样记录列表，顺序与挂载表一致
+        """
+        submitted = self._submit(path, exclude_pseudo)
+        futures = [asyncio.wrap_future(c.future) for _, c in submitted if c is not None]
+        if futures:
+            await asyncio.wait(futures, timeout=self._timeout)
+        return self._finish(submitted)
+
+    def _submit(
+        self, path: Optional[str], exclude_pseudo: bool
+    ) -> List[Tuple[MountEntry, Optional[_DiskCall]]]:
+        """向线程池提交各挂载点的 statvfs 调用，卡住或退避中的挂载点不提交"""
+        mounts = _select_mounts(path, exclude_pseudo, self._table or get_mount_table())
+        now = time.monotonic()
+
+        submitted: List[Tuple[MountEntry, Optional[_DiskCall]]] = []
+        with self._lock:
+            hung = sum(1 for c in self._pending.values() if c.hung(now, self._timeout))
+            if hung >= self._max_workers:
+                # 全部线程都卡在系统调用里，排队的调用永远不会执行；卡住的线程无法中断，
+                # 放弃旧线程池（取消其中排队的调用），之后的调用提交到新线程池
+                logger.warning(f"{hung} 个挂载点的 statvfs 卡住，占满全部磁盘采集线程，改用新的线程池")
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._new_executor()
+            for mount in mounts:
+                mp = mount.mountpoint
+                call = self._pending.get(mp)
+                if call is not None and not call.future.done():
+                    # 卡住的调用不再等待；仍在排队或刚开始的调用继续等待，不重复提交
+                    submitted.append((mount, None if call.hung(now, self._timeout) else call))
+                    continue
+                if self._hung_until.get(mp, 0.0) > now:
+                    submitted.append((mount, None))
+                    continue
+                call = _DiskCall(mount)
+                call.future = self._executor.submit(call.run)
+                self._pending[mp] = call
+                submitted.append((mount, call))
+        return submitted
+
+    def _finish(self, submitted: List[Tuple[MountEntry, Optional[_DiskCall]]]) -> List[DiskRecord]:
+        """收集已完成的结果，未完成的挂载点标记为 stale，开始执行后超时的挂载点进入退避"""
+        result = []
+        now = time.monotonic()
+        with self._lock:
+            for mount, call in submitted:
+                mp = mount.mountpoint
+                if call is None:
+                    result.append(self._stale(mount))
+                    continue
+                if not call.future.done():
+                    if call.hung(now, self._timeout) and self._hung_until.get(mp, 0.0) <= now:
+                        logger.warning(f"挂载点 {mp} 在 {self._timeout} 秒内无响应，{self._backoff} 秒内跳过")
+                        self._hung_until[mp] = now + self._backoff
+                    result.append(self._stale(mount))
+                    continue
+                if self._pending.get(mp) is call:
+                    del self._pending[mp]
+                if call.future.cancelled():
+                    # 线程池被替换时仍在排队，下次采集重新提交
+                    result.append(self._stale(mount))
+                    continue
+                self._hung_until.pop(mp, None)
+                try:
+                    usage = call.future.result()
+                except OSError as e:
+                    logger.debug(f"获取挂载点 {mp} 信息失败: {e}")
+                    continue
+                self._last[mp] = usage
+                result.append(usage)
+        return result
+
+    def _stale_records(self, path: Optional[str], exclude_pseudo: bool) -> List[DiskRecord]:
+        """不等待采集，返回各挂载点上次的结果并标记为 stale"""
+        mounts = _select_mounts(path, exclude_pseudo, self._table or get_mount_table())
+        with self._lock:
+            return [self._stale(mount) for mount in mounts]
+
+    def close(self) -> None:
+        """关闭线程池，不等待仍卡住的任务"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_default_disk_collector: Optional[DiskCollector] = None
+
+
+def get_disk_collector() -> DiskCollector:
+    """
+    获取默认磁盘采集器实例
+
+    Returns:
+        DiskCollector: 磁盘采集器实例
+    """
+    global _default_disk_collector
+    if _default_disk_collector is None:
+        _default_disk_collector = DiskCollector(
+            max_workers=get_config("disk_max_workers", 8),
+            timeout=get_config("disk_timeout", 2.0),
+            backoff=get_config("disk_backoff", 60.0),
+        )
+    return _default_disk_collector
+
+
+def get_disk_usage(path: Optional[str] = None, exclude_pseudo: bool = False) -> List[DiskUsage]:
     """
     获取磁盘使用情况
+
+    Linux 上直接解析 /proc/self/mountinfo 并对每个挂载点调用 statvfs，不再启动 df 子进程。
+    采集由默认的 DiskCollector 完成，无响应的挂载点标记为 stale 而不会阻塞调用。
     
     Args:
-        path: 要检查的路径
+        path: 要检查的路径，指定时只返回包含该路径的挂载点；为 None 时返回全部挂载点
+        exclude_pseudo: 是否过滤 tmpfs、overlay、proc 等伪文件系统
         
     Returns:
         List[DiskUsage]: 磁盘使用情况对象列表
@@ -184,7 +1107,9 @@ def get_disk_usage(path: str = "/") -> List[DiskUsage]:
     result = []
     
     try:
-        if platform.system() == "Linux" or platform.system() == "Darwin":
+        if platform.system() == "Linux":
+            result = get_disk_collector().collect(path, exclude_pseudo)
+        elif platform.system() == "Darwin":
             output = subprocess.run(["df", "-k"], capture_output=True, text=True)
             if output.returncode == 0:
                 lines = output.stdout.strip().split("\n")
@@ -218,39 +1143,16 @@ def get_disk_usage(path: str = "/") -> List[DiskUsage]:
 def get_cpu_usage() -> CPUUsage:
     """
     获取CPU使用情况
+
+    Linux 上使用默认的 CPUSampler，返回自上次调用以来的使用率。
     
     Returns:
         CPUUsage: CPU使用情况对象
     """
     try:
         if platform.system() == "Linux":
-            # 获取CPU使用率
-            with open("/proc/stat", "r") as f:
-                cpu_line = f.readline()
-            
-            # 计算总CPU使用率
-            cpu_parts = cpu_line.split()[1:]
-            idle = float(cpu_parts[3])
-            total = sum(float(x) for x in cpu_parts)
-            cpu_percent = 100.0 - (idle / total * 100.0)
-            
-            # 获取每个核心的使用率
-            cores = []
-            for i in range(os.cpu_count() or 1):
-                subprocess.run(f"grep 'cpu{i}' /proc/stat", shell=True, capture_output=True, text=True)
-                # 简化示例，实际需要解析输出
-                cores.append(cpu_percent)  # 示例中使用相同的值
-                
-            # 获取负载情况
-            with open("/proc/loadavg", "r") as f:
-                load = f.readline().split()[:3]
-                load_avg = [float(x) for x in load]
-                
-            return CPUUsage(
-                percent=cpu_percent,
-                cores=cores,
-                load_avg=load_avg
-            )
+            # 基于 /proc/stat 差值计算，首次调用返回开机以来的平均值
+            return get_cpu_sampler().sample()
             
         elif platform.system() == "Darwin":  # macOS
             # 使用系统命令获取CPU使用率
@@ -293,4 +1195,470 @@ def get_cpu_usage() -> CPUUsage:
         percent=0.0,
         cores=[0.0] * (os.cpu_count() or 1),
         load_avg=[0.0, 0.0, 0.0]
-    ) 
\ No newline at end of file
+    ) 
+
+class DiskIOCounters(NamedTuple):
+    """块设备累计计数记录（/proc/diskstats）"""
+    device: str
+    reads: int
+    read_sectors: int
+    read_ms: int
+    writes: int
+    write_sectors: int
+    write_ms: int
+    io_ms: int
+
+
+def _read_diskstats(path: str = "/proc/diskstats") -> List[DiskIOCounters]:
+    """
+    解析 /proc/diskstats 中各块设备的累计计数
+
+    Returns:
+        List[DiskIOCounters]: 块设备累计计数记录列表
+    """
+    data = _read_proc_file(path)
+    result = []
+    for line in data.split(b"\n"):
+        v = line.split()
+        if len(v) < 14:
+            continue
+        result.append(DiskIOCounters(
+            device=v[2].decode(),
+            reads=int(v[3]),
+            read_sectors=int(v[5]),
+            read_ms=int(v[6]),
+            writes=int(v[7]),
+            write_sectors=int(v[9]),
+            write_ms=int(v[10]),
+            io_ms=int(v[12]),
+        ))
+    return result
+
+
+# /proc/diskstats 中的扇区固定为 512 字节，与设备实际扇区大小无关
+_SECTOR_SIZE = 512
+_WRAP_32 = 1 << 32
+
+
+def _counter_delta(cur: int, prev: int) -> int:
+    """
+    计算累计计数的增量，处理计数器回绕
+
+    32 位计数器回绕时按 2^32 补偿；无法解释为回绕的回退（例如设备被重新创建）视为计数器重置，
+    增量取当前值。
+    """
+    if cur >= prev:
+        return cur - prev
+    if prev < _WRAP_32:
+        wrapped = cur + _WRAP_32 - prev
+        if wrapped < _WRAP_32 // 2:
+            return wrapped
+    return cur
+
+
+class IOSampler:
+    """
+    网络接口与块设备吞吐采样器
+
+    每次 sample() 只读取一次 /proc/net/dev 和 /proc/diskstats，与上一次的计数器做差，
+    得到两次采样之间的速率。首次采样没有上一次计数器，所有速率为 0。
+    """
+
+    def __init__(self, skip_partitions: bool = True, skip_virtual: bool = True):
+        """
+        初始化吞吐采样器
+
+        Args:
+            skip_partitions: 是否跳过分区，只保留 /sys/block 下的整块设备
+            skip_virtual: 是否跳过 loop、ram 等虚拟块设备
+        """
+        self._skip_partitions = skip_partitions
+        self._skip_virtual = skip_virtual
+        self._prev_time: Optional[float] = None
+        self._prev_net: Dict[str, NetIORecord] = {}
+        self._prev_disk: Dict[str, DiskIOCounters] = {}
+        # 设备名 -> 是否采集，避免每次检查 /sys/block
+        self._disk_filter: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def _want_disk(self, device: str) -> bool:
+        """判断块设备是否需要采集"""
+        wanted = self._disk_filter.get(device)
+        if wanted is None:
+            wanted = True
+            if self._skip_virtual and device.startswith(("loop", "ram", "zram")):
+                wanted = False
+            elif self._skip_partitions and not os.path.exists(f"/sys/block/{device}"):
+                wanted = False
+            self._disk_filter[device] = wanted
+        return wanted
+
+    def sample(self) -> IORates:
+        """
+        采样网络接口和块设备吞吐
+
+        Returns:
+            IORates: 自上次采样以来的吞吐速率对象
+        """
+        now = time.monotonic()
+        try:
+            net = _read_net_dev()
+        except Exception as e:
+            logger.error(f"获取网络信息失败: {e}")
+            net = []
+        try:
+            disks = [d for d in _read_diskstats() if self._want_disk(d.device)]
+        except Exception as e:
+            logger.error(f"获取块设备信息失败: {e}")
+            disks = []
+
+        with self._lock:
+            elapsed = now - self._prev_time if self._prev_time is not None else 0.0
+            per_sec = 1.0 / elapsed if elapsed > 0 else 0.0
+            prev_net = self._prev_net
+            prev_disk = self._prev_disk
+
+            net_rates = []
+            for n in net:
+                p = prev_net.get(n.interface, n)
+                net_rates.append(NetworkIORate(
+                    interface=n.interface,
+                    bytes_recv_per_sec=_counter_delta(n.bytes_recv, p.bytes_recv) * per_sec,
+                    bytes_sent_per_sec=_counter_delta(n.bytes_sent, p.bytes_sent) * per_sec,
+                    packets_recv_per_sec=_counter_delta(n.packets_recv, p.packets_recv) * per_sec,
+                    packets_sent_per_sec=_counter_delta(n.packets_sent, p.packets_sent) * per_sec,
+                    errin_per_sec=_counter_delta(n.errin, p.errin) * per_sec,
+                    errout_per_sec=_counter_delta(n.errout, p.errout) * per_sec,
+                    dropin_per_sec=_counter_delta(n.dropin, p.dropin) * per_sec,
+                    dropout_per_sec=_counter_delta(n.dropout, p.dropout) * per_sec,
+                ))
+
+            disk_rates = []
+            for d in disks:
+                p2 = prev_disk.get(d.device, d)
+                reads = _counter_delta(d.reads, p2.reads)
+                writes = _counter_delta(d.writes, p2.writes)
+                read_ms = _counter_delta(d.read_ms, p2.read_ms)
+                write_ms = _counter_delta(d.write_ms, p2.write_ms)
+                io_ms = _counter_delta(d.io_ms, p2.io_ms)
+                disk_rates.append(DiskIORate(
+                    device=d.device,
+                    read_iops=reads * per_sec,
+                    write_iops=writes * per_sec,
+                    read_bytes_per_sec=_counter_delta(d.read_sectors, p2.read_sectors) * _SECTOR_SIZE * per_sec,
+                    write_bytes_per_sec=_counter_delta(d.write_sectors, p2.write_sectors) * _SECTOR_SIZE * per_sec,
+                    read_latency_ms=read_ms / reads if reads else 0.0,
+                    write_latency_ms=write_ms / writes if writes else 0.0,
+                    utilization=min(io_ms * per_sec / 10.0, 100.0),
+                ))
+
+            self._prev_time = now
+            self._prev_net = {n.interface: n for n in net}
+            self._prev_disk = {d.device: d for d in disks}
+
+        return IORates(interval=elapsed, network=net_rates, disks=disk_rates)
+
+
+_default_io_sampler: Optional[IOSampler] = None
+
+
+def get_io_sampler() -> IOSampler:
+    """
+    获取默认吞吐采样器实例
+
+    Returns:
+        IOSampler: 吞吐采样器实例
+    """
+    global _default_io_sampler
+    if _default_io_sampler is None:
+        _default_io_sampler = IOSampler()
+    return _default_io_sampler
+
+
+def get_io_rates() -> IORates:
+    """
+    获取网络接口和块设备吞吐速率
+
+    使用默认的 IOSampler，返回自上次调用以来的速率，首次调用所有速率为 0。
+    仅支持 Linux，其他系统返回空结果。
+
+    Returns:
+        IORates: 吞吐速率对象
+    """
+    if not _IS_LINUX:
+        return IORates(interval=0.0)
+    return get_io_sampler().sample()
+
+
+class Snapshot(NamedTuple):
+    """
+    系统快照记录
+
+    所有字段在同一次采集中获得，共享同一个时间戳。各部分均为轻量记录，
+    调用 to_model() 时才转换为 pydantic 模型。
+    """
+    timestamp: float
+    cpu: CPURecord
+    memory: MemoryRecord
+    load_avg: Tuple[float, float, float]
+    uptime: Optional[float]
+    disks: List[DiskRecord]
+    network: List[NetIORecord]
+
+    def to_model(self) -> SystemSnapshot:
+        """转换为 SystemSnapshot 模型"""
+        load_avg = list(self.load_avg)
+        return SystemSnapshot(
+            timestamp=datetime.fromtimestamp(self.timestamp),
+            cpu=self.cpu.to_model(load_avg),
+            memory=self.memory.to_model(),
+            load_avg=load_avg,
+            uptime=self.uptime,
+            disks=[d.to_model() for d in self.disks],
+            network=[n.to_model() for n in self.network],
+        )
+
+
+def get_snapshot(
+    disks: bool = True,
+    exclude_pseudo: bool = True,
+    cpu_sampler: Optional[CPUSampler] = None,
+) -> Snapshot:
+    """
+    一次性采集 CPU、内存、负载、运行时间、磁盘和网络信息
+
+    Linux 上每个 /proc 文件只读取一次，结果为轻量记录，需要模型时调用 Snapshot.to_model()。
+    其他系统上退化为调用各个 get_* 函数。
+
+    Args:
+        disks: 是否采集磁盘使用情况
+        exclude_pseudo: 是否过滤伪文件系统
+        cpu_sampler: CPU 采样器，为 None 时使用默认采样器；独立的调用方应使用自己的采样器，
+            以免相互缩短彼此的采样区间
+
+    Returns:
+        Snapshot: 系统快照记录
+    """
+    timestamp = time.time()
+
+    if not _IS_LINUX:
+        cpu_usage = get_cpu_usage()
+        memory_usage = get_memory_usage()
+        return Snapshot(
+            timestamp=timestamp,
+            cpu=CPURecord(
+                percent=cpu_usage.percent,
+                cores=tuple(cpu_usage.cores),
+                times=(),
+                core_times=(),
+            ),
+            memory=MemoryRecord(**memory_usage.model_dump()),
+            load_avg=tuple(cpu_usage.load_avg),  # type: ignore[arg-type]
+            uptime=None,
+            disks=[DiskRecord(**d.model_dump()) for d in get_disk_usage(exclude_pseudo=exclude_pseudo)] if disks else [],
+            network=[],
+        )
+
+    disk_records: List[DiskRecord] = []
+    if disks:
+        try:
+            disk_records = get_disk_collector().collect_records(exclude_pseudo=exclude_pseudo)
+        except Exception as e:
+            logger.error(f"获取磁盘信息失败: {e}")
+
+    return _linux_snapshot(timestamp, disk_records, cpu_sampler)
+
+
+def _linux_snapshot(
+    timestamp: float, disk_records: List[DiskRecord], cpu_sampler: Optional[CPUSampler]
+) -> Snapshot:
+    """读取 /proc 中的 CPU、内存、负载、运行时间和网络信息并组装快照"""
+    cpu = (cpu_sampler or get_cpu_sampler()).sample_record()
+
+    try:
+        memory = _read_meminfo()
+    except Exception as e:
+        logger.error(f"获取内存信息失败: {e}")
+        memory = MemoryRecord(total=0, available=0, used=0, percent=0.0)
+
+    try:
+        la = _read_load_avg()
+        load_avg = (la[0], la[1], la[2])
+    except Exception:
+        load_avg = (0.0, 0.0, 0.0)
+
+    try:
+        uptime: Optional[float] = _read_uptime()
+    except Exception:
+        uptime = None
+
+    try:
+        network = _read_net_dev()
+    except Exception as e:
+        logger.error(f"获取网络信息失败: {e}")
+        network = []
+
+    return Snapshot(
+        timestamp=timestamp,
+        cpu=cpu,
+        memory=memory,
+        load_avg=load_avg,
+        uptime=uptime,
+        disks=disk_records,
+        network=network,
+    )
+
+
+async def get_system_info_async(timeout: Optional[float] = None) -> SystemInfo:
+    """
+    异步获取系统信息
+
+    Args:
+        timeout: 超时时间(秒)，为 None 时不限制
+
+    Returns:
+        SystemInfo: 系统信息对象
+    """
+    # 首次调用可能需要计算静态信息（会启动 uname 子进程），放到线程中执行
+    return await asyncio.wait_for(asyncio.to_thread(get_system_info), timeout)
+
+
+async def get_memory_usage_async(timeout: Optional[float] = None) -> MemoryUsage:
+    """
+    异步获取内存使用情况
+
+    Linux 上读取 /proc/meminfo 不会阻塞，直接在事件循环中执行；其他系统放到线程中执行。
+
+    Args:
+        timeout: 超时时间(秒)，为 None 时不限制
+
+    Returns:
+        MemoryUsage: 内存使用情况对象
+    """
+    if _IS_LINUX:
+        return get_memory_usage()
+    return await asyncio.wait_for(asyncio.to_thread(get_memory_usage), timeout)
+
+
+async def get_cpu_usage_async(timeout: Optional[float] = None) -> CPUUsage:
+    """
+    异步获取CPU使用情况
+
+    Linux 上读取 /proc/stat 不会阻塞，直接在事件循环中执行；其他系统放到线程中执行。
+
+    Args:
+        timeout: 超时时间(秒)，为 None 时不限制
+
+    Returns:
+        CPUUsage: CPU使用情况对象
+    """
+    if _IS_LINUX:
+        return get_cpu_usage()
+    return await asyncio.wait_for(asyncio.to_thread(get_cpu_usage), timeout)
+
+
+async def get_disk_usage_async(
+    path: Optional[str] = None,
+    exclude_pseudo: bool = False,
+    timeout: Optional[float] = None,
+) -> List[DiskUsage]:
+    """
+    异步获取磁盘使用情况
+
+    Linux 上 statvfs 在采集器线程池中执行，协程只等待结果，无响应的挂载点标记为 stale。
+
+    Args:
+        path: 要检查的路径，指定时只返回包含该路径的挂载点
+        exclude_pseudo: 是否过滤伪文件系统
+        timeout: 超时时间(秒)，为 None 时不限制
+
+    Returns:
+        List[DiskUsage]: 磁盘使用情况对象列表
+    """
+    if _IS_LINUX:
+        records = await asyncio.wait_for(
+            get_disk_collector().collect_records_async(path, exclude_pseudo), timeout
+        )
+        return [r.to_model() for r in records]
+    return await asyncio.wait_for(asyncio.to_thread(get_disk_usage, path, exclude_pseudo), timeout)
+
+
+async def get_snapshot_async(
+    disks: bool = True,
+    exclude_pseudo: bool = True,
+    cpu_sampler: Optional[CPUSampler] = None,
+    timeout: Optional[float] = None,
+) -> Snapshot:
+    """
+    异步获取系统快照
+
+    磁盘采集受 DiskCollector 自身截止时间保护，无响应的挂载点标记为 stale；timeout 只限制
+    等待磁盘结果的时间，超时时磁盘返回上次的结果并标记为 stale，快照本身仍然返回。
+
+    Args:
+        disks: 是否采集磁盘使用情况
+        exclude_pseudo: 是否过滤伪文件系统
+        cpu_sampler: CPU 采样器，为 None 时使用默认采样器
+        timeout: 等待磁盘结果的超时时间(秒)，为 None 时只受采集器截止时间限制
+
+    Returns:
+        Snapshot: 系统快照记录
+    """
+    if not _IS_LINUX:
+        return await asyncio.wait_for(
+            asyncio.to_thread(get_snapshot, disks, exclude_pseudo, cpu_sampler), timeout
+        )
+
+    timestamp = time.time()
+    disk_records: List[DiskRecord] = []
+    if disks:
+        collector = get_disk_collector()
+        try:
+            disk_records = await asyncio.wait_for(
+                collector.collect_records_async(exclude_pseudo=exclude_pseudo), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"磁盘信息在 {timeout} 秒内未采集完成，使用上次的结果")
+            disk_records = collector._stale_records(None, exclude_pseudo)
+        except Exception as e:
+            logger.error(f"获取磁盘信息失败: {e}")
+    return _linux_snapshot(timestamp, disk_records, cpu_sampler)
+
+
+async def iter_snapshots_async(
+    interval: float = 1.0,
+    disks: bool = True,
+    exclude_pseudo: bool = True,
+) -> AsyncIterator[Snapshot]:
+    """
+    按固定节奏持续产生系统快照
+
+    采样时刻按绝对时间排期，采样耗时不会累积成漂移；处理过慢错过的周期会被跳过。
+    迭代器使用独立的 CPUSampler，CPU 使用率即为相邻两次快照之间的值。无响应的挂载点由
+    DiskCollector 的截止时间标记为 stale，不会中断迭代；采集耗时超过间隔时跳过错过的周期。
+
+    Args:
+        interval: 采样间隔(秒)
+        disks: 是否采集磁盘使用情况
+        exclude_pseudo: 是否过滤伪文件系统
+
+    Yields:
+        Snapshot: 系统快照记录
+
+    Example:
+        >>> async for snapshot in iter_snapshots_async(5.0):
+        ...     print(snapshot.cpu.percent)
+    """
+    loop = asyncio.get_running_loop()
+    sampler = CPUSampler()
+    next_tick = loop.time()
+    while True:
+        yield await get_snapshot_async(disks, exclude_pseudo, sampler)
+        next_tick += interval
+        delay = next_tick - loop.time()
+        if delay < 0:
+            # 跳过已经错过的周期，保持与起始时刻对齐
+            missed = int(-delay // interval) + 1
+            next_tick += missed * interval
+            delay = next_tick - loop.time()
+        await asyncio.sleep(delay)
@@ -2,14 +2,32 @@
 进程管理模块 - 提供进程查询、管理等功能
 """
 
+import asyncio
+import fnmatch
+import functools
 import os
 import platform
+import re
+import select
 import subprocess
 import signal
-from typing import Dict, List, Optional, Any, Union
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Any, Union
 from pydantic import BaseModel, Field
 from loguru import logger
 
+from .monitor import _read_meminfo, _read_uptime
+
+try:
+    import pwd
+except ImportError:
+    # Windows 没有 pwd 模块，用户名退化为数字形式的用户ID
+    pwd = None
+
+if TYPE_CHECKING:
+    from .proctable import ProcessTable
+
 
 class Process(BaseModel):
     """进程信息模型"""
@@ -21,50 +39,229 @@ class Process(BaseModel):
     status: str = Field("", description="进程状态")
     user: str = Field("", description="用户")
     created: Optional[str] = Field(None, description="创建时间")
+    ppid: int = Field(0, description="父进程ID")
+    threads: int = Field(0, description="线程数")
+    rss: int = Field(0, description="常驻内存(字节)")
+    start_time: Optional[float] = Field(None, description="启动时间(Unix 时间戳)")
+    state: str = Field("", description="内核进程状态码(R/S/D/Z/T/...)")
+    exe: str = Field("", description="可执行文件路径")
+
+
+# 所有可选择的字段
+PROCESS_FIELDS = frozenset(Process.model_fields)
+# 需要读取 /proc/[pid]/status 的字段
+_STATUS_FIELDS = frozenset({"user"})
+# 需要读取 /proc/[pid]/cmdline 的字段
+_CMDLINE_FIELDS = frozenset({"cmd"})
+# 需要读取 /proc/[pid]/exe 的字段
+_EXE_FIELDS = frozenset({"exe"})
+
+_STATE_NAMES = {
+    "R": "running",
+    "S": "sleeping",
+    "D": "disk-sleep",
+    "Z": "zombie",
+    "T": "stopped",
+    "t": "tracing-stop",
+    "X": "dead",
+    "x": "dead",
+    "I": "idle",
+    "K": "wakekill",
+    "W": "waking",
+    "P": "parked",
+}
 
+_IS_LINUX = platform.system() == "Linux"
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class PidStat(NamedTuple):
+    """/proc/[pid]/stat 中的常用字段"""
+    pid: int
+    comm: str
+    state: str
+    ppid: int
+    utime: int
+    stime: int
+    num_threads: int
+    starttime: int
+    rss_pages: int
+
+
+def _read_pid_stat(pid: int) -> PidStat:
+    """
+    读取并解析 /proc/[pid]/stat
 
-def list_processes() -> List[Process]:
+    Raises:
+        OSError: 进程已退出或无权访问
+    """
+    with open(f"/proc/{pid}/stat", "rb") as f:
+        data = f.read()
+    # comm 可能包含空格和括号，以最后一个 ")" 为界
+    lparen = data.index(b"(")
+    rparen = data.rindex(b")")
+    comm = data[lparen + 1:rparen].decode("utf-8", errors="replace")
+    v = data[rparen + 2:].split()
+    return PidStat(
+        pid=pid,
+        comm=comm,
+        state=v[0].decode(),
+        ppid=int(v[1]),
+        utime=int(v[11]),
+        stime=int(v[12]),
+        num_threads=int(v[17]),
+        starttime=int(v[19]),
+        rss_pages=int(v[21]),
+    )
+
+
+def _read_pid_uid(pid: int) -> int:
+    """读取 /proc/[pid]/status 中的有效用户ID"""
+    with open(f"/proc/{pid}/status", "rb") as f:
+        for line in f:
+            if line.startswith(b"Uid:"):
+                return int(line.split()[2])
+    raise ProcessLookupError(pid)
+
+
+def _read_pid_cmdline(pid: int) -> str:
+    """读取 /proc/[pid]/cmdline，参数以空格连接；内核线程返回空字符串"""
+    with open(f"/proc/{pid}/cmdline", "rb") as f:
+        data = f.read()
+    return data.rstrip(b"\0").replace(b"\0", b" ").decode("utf-8", errors="replace")
+
+
+def _read_pid_exe(pid: int) -> str:
+    """读取 /proc/[pid]/exe 链接目标；内核线程或无权访问时返回空字符串"""
+    try:
+        return os.readlink(f"/proc/{pid}/exe")
+    except PermissionError:
+        return ""
+    except FileNotFoundError:
+        # 内核线程没有 exe，进程是否已退出由调用方读取 stat 判断
+        if os.path.exists(f"/proc/{pid}"):
+            return ""
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def _username(uid: int) -> str:
+    """将用户ID转换为用户名，无对应用户时返回数字形式"""
+    if pwd is None:
+        return str(uid)
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+def _iter_pids() -> Iterator[int]:
+    """遍历 /proc 中的进程ID"""
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            yield int(entry)
+
+
+def _proc_process(
+    st: PidStat,
+    fields: FrozenSet[str],
+    boot_time: float,
+    uptime: float,
+    mem_total: int,
+    static: Optional[Dict[str, Any]] = None,
+) -> Process:
+    """
+    根据 stat 记录构建 Process
+
+    user、cmd、exe 优先取自 static（调用方已读取或缓存的值），缺失时按需读取 status、cmdline 和 exe。
+    """
+    pid = st.pid
+    values: Dict[str, Any] = {"pid": pid}
+    if "name" in fields:
+        values["name"] = st.comm
+    if "ppid" in fields:
+        values["ppid"] = st.ppid
+    if "state" in fields:
+        values["state"] = st.state
+    if "status" in fields:
+        values["status"] = _STATE_NAMES.get(st.state, st.state)
+    if "threads" in fields:
+        values["threads"] = st.num_threads
+    rss = st.rss_pages * _PAGE_SIZE
+    if "rss" in fields:
+        values["rss"] = rss
+    if "memory_percent" in fields and mem_total:
+        values["memory_percent"] = rss / mem_total * 100.0
+    start = st.starttime / _CLK_TCK
+    if "start_time" in fields or "created" in fields:
+        start_time = boot_time + start
+        values["start_time"] = start_time
+        if "created" in fields:
+            values["created"] = datetime.fromtimestamp(start_time).isoformat(timespec="seconds")
+    if "cpu_percent" in fields:
+        # 与 ps 一致：进程生命周期内的平均 CPU 使用率
+        elapsed = uptime - start
+        if elapsed > 0:
+            values["cpu_percent"] = (st.utime + st.stime) / _CLK_TCK / elapsed * 100.0
+    static = static or {}
+    if fields & _STATUS_FIELDS:
+        values["user"] = static["user"] if "user" in static else _username(_read_pid_uid(pid))
+    if fields & _CMDLINE_FIELDS:
+        values["cmd"] = static["cmd"] if "cmd" in static else _read_pid_cmdline(pid)
+    if fields & _EXE_FIELDS:
+        values["exe"] = static["exe"] if "exe" in static else _read_pid_exe(pid)
+    return Process(**values)
+
+
+def _list_proc_processes(fields: FrozenSet[str]) -> List[Process]:
+    """扫描 /proc 获取进程列表，扫描期间退出的进程会被跳过"""
+    uptime = _read_uptime()
+    boot_time = time.time() - uptime
+    mem_total = _read_meminfo().total if "memory_percent" in fields else 0
+
+    result = []
+    for pid in _iter_pids():
+        try:
+            st = _read_pid_stat(pid)
+            result.append(_proc_process(st, fields, boot_time, uptime, mem_total))
+        except (FileNotFoundError, ProcessLookupError):
+            # 进程在扫描期间退出
+            continue
+        except PermissionError:
+            continue
+        except (ValueError, IndexError) as e:
+            logger.debug(f"解析进程 {pid} 信息失败: {e}")
+            continue
+    return result
+
+
+def list_processes(fields: Optional[Iterable[str]] = None) -> List[Process]:
     """
     列出系统进程
+
+    Linux 上直接扫描 /proc/[pid]/stat、status 和 cmdline，不再启动 ps 子进程。
+    只请求不依赖 status/cmdline/exe 的字段（例如 pid、name）时，这些文件不会被读取。
     
+    Args:
+        fields: 需要填充的 Process 字段名，为 None 时填充全部字段；未请求的字段保留默认值
+
     Returns:
         List[Process]: 进程信息列表
+
+    Raises:
+        ValueError: fields 中包含未知字段
     """
+    selected = PROCESS_FIELDS if fields is None else frozenset(fields)
+    unknown = selected - PROCESS_FIELDS
+    if unknown:
+        raise ValueError(f"未知的进程字段: {', '.join(sorted(unknown))}")
+
     result = []
     
     try:
-        if platform.system() == "Linux":
-            # 使用 ps 命令获取进程信息
-            output = subprocess.run(
-                ["ps", "aux"], 
-                capture_output=True, 
-                text=True
-            )
-            if output.returncode == 0:
-                lines = output.stdout.strip().split("\n")
-                # 跳过标题行
-                for line in lines[1:]:
-                    parts = line.split(None, 10)
-                    if len(parts) >= 11:
-                        user = parts[0]
-                        pid = int(parts[1])
-                        cpu = float(parts[2])
-                        mem = float(parts[3])
-                        status = parts[7]
-                        created = parts[8]
-                        cmd = parts[10]
-                        name = cmd.split()[0] if cmd else ""
-                        
-                        result.append(Process(
-                            pid=pid,
-                            name=name,
-                            cmd=cmd,
-                            cpu_percent=cpu,
-                            memory_percent=mem,
-                            status=status,
-                            user=user,
-                            created=created
-                        ))
+        if _IS_LINUX:
+            return _list_proc_processes(selected)
                         
         elif platform.system() == "Darwin":  # macOS
             # 使用 ps 命令获取进程信息
@@ -104,9 +301,221 @@ def list_processes() -> List[Process]:
     return result
 
 
+# comm 在内核中被截断为 15 个字符
+_COMM_LEN = 15
+
+
+class ProcessMatcher:
+    """
+    进程匹配条件
+
+    条件按代价由低到高检查：名称、父进程、状态只需 /proc/[pid]/stat；用户需要 status；
+    命令行条件最后检查，只有前面的条件都满足时才读取 cmdline。所有条件之间为"与"关系。
+    名称条件匹配内核记录的 comm（最多 15 个字符），精确匹配更长的名称时会用命令行的
+    argv[0] 补充判断。
+    """
+    __slots__ = ("name", "pattern", "regex", "keyword", "cmd", "uid", "ppid", "states")
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        pattern: Optional[str] = None,
+        regex: Optional[str] = None,
+        keyword: Optional[str] = None,
+        cmd: Optional[str] = None,
+        user: Union[str, int, None] = None,
+        ppid: Optional[int] = None,
+        state: Optional[str] = None,
+    ):
+        """
+        初始化匹配条件
+
+        Args:
+            name: 进程名精确匹配
+            pattern: 进程名通配符匹配，例如 "nginx*"
+            regex: 进程名正则匹配（re.search）
+            keyword: 进程名或命令行包含该字符串（不区分大小写），即 find_process 的语义
+            cmd: 命令行包含该字符串
+            user: 用户名或用户ID
+            ppid: 父进程ID
+            state: 进程状态码，多个状态可写在一起，例如 "RD"
+        """
+        self.name = name
+        self.pattern = pattern
+        self.regex = re.compile(regex) if regex is not None else None
+        self.keyword = keyword.lower() if keyword is not None else None
+        self.cmd = cmd
+        self.uid: Optional[int] = None
+        if isinstance(user, int):
+            self.uid = user
+        elif user is not None:
+            # 不存在的用户（或没有 pwd 模块时按名称指定的用户）不会匹配任何进程
+            self.uid = -1
+            if pwd is not None:
+                try:
+                    self.uid = pwd.getpwnam(user).pw_uid
+                except KeyError:
+                    pass
+        self.ppid = ppid
+        self.states = state
+
+    @property
+    def needs_cmd(self) -> bool:
+        """是否可能需要读取命令行"""
+        return self.cmd is not None or self.keyword is not None or (
+            self.name is not None and len(self.name) > _COMM_LEN
+        )
+
+    def match_name(self, comm: str) -> bool:
+        """
+        只根据 comm 判断名称条件
+
+        精确匹配超过 15 个字符的名称时，comm 与前缀相同即视为可能匹配，需要再用
+        match_cmd() 确认。
+        """
+        if self.name is not None:
+            if len(self.name) > _COMM_LEN:
+                if comm != self.name[:_COMM_LEN]:
+                    return False
+            elif comm != self.name:
+                return False
+        if self.pattern is not None and not fnmatch.fnmatchcase(comm, self.pattern):
+            return False
+        if self.regex is not None and not self.regex.search(comm):
+            return False
+        return True
+
+    def match_stat(self, st: PidStat) -> bool:
+        """检查只依赖 /proc/[pid]/stat 的条件"""
+        if self.ppid is not None and st.ppid != self.ppid:
+            return False
+        if self.states is not None and st.state not in self.states:
+            return False
+        return self.match_name(st.comm)
+
+    def match_cmd(self, comm: str, cmd: str) -> bool:
+        """检查依赖命令行的条件"""
+        if self.cmd is not None and self.cmd not in cmd:
+            return False
+        if self.name is not None and len(self.name) > _COMM_LEN:
+            argv0 = cmd.split(" ", 1)[0]
+            if os.path.basename(argv0) != self.name:
+                return False
+        if self.keyword is not None and self.keyword not in comm.lower() and self.keyword not in cmd.lower():
+            return False
+        return True
+
+    def match_process(self, p: "Process") -> bool:
+        """检查完整的 Process 对象，用于无法读取 /proc 的系统"""
+        if self.ppid is not None and p.ppid != self.ppid:
+            return False
+        if self.states is not None and (p.state or p.status[:1]) not in self.states:
+            return False
+        if self.uid is not None and p.user not in (_username(self.uid), str(self.uid)):
+            return False
+        if not self.match_name(p.name) and not (
+            self.name is not None and os.path.basename(p.name) == self.name
+        ):
+            return False
+        return self.match_cmd(p.name, p.cmd)
+
+
+def _find_proc_processes(matcher: ProcessMatcher, fields: FrozenSet[str]) -> List[Process]:
+    """扫描 /proc 查找匹配的进程，只为通过廉价条件的进程读取其他文件"""
+    uptime = _read_uptime()
+    boot_time = time.time() - uptime
+    mem_total = 0
+
+    result = []
+    for pid in _iter_pids():
+        try:
+            st = _read_pid_stat(pid)
+            if not matcher.match_stat(st):
+                continue
+            static: Dict[str, Any] = {}
+            if matcher.uid is not None:
+                uid = _read_pid_uid(pid)
+                if uid != matcher.uid:
+                    continue
+                static["user"] = _username(uid)
+            if matcher.needs_cmd:
+                cmd = _read_pid_cmdline(pid)
+                if not matcher.match_cmd(st.comm, cmd):
+                    continue
+                static["cmd"] = cmd
+            if "memory_percent" in fields and not mem_total:
+                mem_total = _read_meminfo().total
+            result.append(_proc_process(st, fields, boot_time, uptime, mem_total, static))
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            continue
+        except (ValueError, IndexError) as e:
+            logger.debug(f"解析进程 {pid} 信息失败: {e}")
+            continue
+    return result
+
+
+def find_processes(
+    name: Optional[str] = None,
+    pattern: Optional[str] = None,
+    regex: Optional[str] = None,
+    keyword: Optional[str] = None,
+    cmd: Optional[str] = None,
+    user: Union[str, int, None] = None,
+    ppid: Optional[int] = None,
+    state: Optional[str] = None,
+    fields: Optional[Iterable[str]] = None,
+    table: Optional["ProcessTable"] = None,
+) -> List[Process]:
+    """
+    按条件查找进程
+
+    Linux 上逐个进程先检查 stat 中的名称、父进程和状态，只有通过的进程才读取 status 和
+    cmdline，也只为匹配的进程构建 Process。传入 ProcessTable 时直接使用其名称索引，
+    不读取任何 /proc 文件（数据截至该进程表上次刷新）。
+
+    Args:
+        name: 进程名精确匹配
+        pattern: 进程名通配符匹配，例如 "nginx*"
+        regex: 进程名正则匹配（re.search）
+        keyword: 进程名或命令行包含该字符串（不区分大小写）
+        cmd: 命令行包含该字符串
+        user: 用户名或用户ID
+        ppid: 父进程ID
+        state: 进程状态码，例如 "R" 或 "RD"
+        fields: 需要填充的 Process 字段名，为 None 时填充全部字段
+        table: 长期维护的进程表，提供时使用其索引查询
+
+    Returns:
+        List[Process]: 匹配的进程列表
+
+    Raises:
+        ValueError: fields 中包含未知字段
+    """
+    selected = PROCESS_FIELDS if fields is None else frozenset(fields)
+    unknown = selected - PROCESS_FIELDS
+    if unknown:
+        raise ValueError(f"未知的进程字段: {', '.join(sorted(unknown))}")
+
+    matcher = ProcessMatcher(
+        name=name, pattern=pattern, regex=regex, keyword=keyword,
+        cmd=cmd, user=user, ppid=ppid, state=state,
+    )
+    if table is not None:
+        return table.find(matcher, selected)
+    if _IS_LINUX:
+        try:
+            return _find_proc_processes(matcher, selected)
+        except Exception as e:
+            logger.error(f"获取进程信息失败: {e}")
+            return []
+    return [p for p in list_processes() if matcher.match_process(p)]
+
+
 def find_process(name: str) -> List[Process]:
     """
     根据进程名查找进程
+
+    等价于 find_processes(keyword=name)：先比较进程名，不匹配时才读取命令行。
     
     Args:
         name: 进程名称（部分匹配）
@@ -114,8 +523,7 @@ def find_process(name: str) -> List[Process]:
     Returns:
         List[Process]: 匹配的进程列表
     """
-    processes = list_processes()
-    return [p for p in processes if name.lower() in p.name.lower() or name.lower() in p.cmd.lower()]
+    return find_processes(keyword=name)
 
 
 def kill_process(pid: int, force: bool = False) -> bool:
@@ -142,4 +550,290 @@ def kill_process(pid: int, force: bool = False) -> bool:
         return False
     except Exception as e:
         logger.error(f"终止进程 {pid} 失败: {e}")
-        return False 
\ No newline at end of file
+        return False
+
+
+# kill_processes() 的结果
+KILL_TERMINATED = "terminated"
+KILL_KILLED = "killed"
+KILL_NOT_FOUND = "not_found"
+KILL_DENIED = "denied"
+KILL_SURVIVED = "survived"
+
+# 无法使用 pidfd 时检查进程是否存活的间隔(秒)
+_KILL_POLL_INTERVAL = 0.05
+
+
+class KillResult(BaseModel):
+    """批量终止进程的单个进程结果"""
+    pid: int = Field(..., description="进程ID")
+    outcome: str = Field(
+        ..., description="结果(terminated: SIGTERM 后退出/killed: SIGKILL 后退出/not_found/denied/survived)"
+    )
+    signal: Optional[str] = Field(None, description="最后发送的信号")
+    elapsed: Optional[float] = Field(None, description="从发送 SIGTERM 到确认退出的秒数")
+
+
+class _KillTarget:
+    """单个待终止进程的状态，pidfd 在发送信号前打开，避免 PID 被复用后误杀"""
+    __slots__ = ("pid", "fd", "outcome", "signal", "started", "elapsed")
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.fd: Optional[int] = None
+        self.outcome: Optional[str] = None
+        self.signal: Optional[signal.Signals] = None
+        self.started = time.monotonic()
+        self.elapsed: Optional[float] = None
+        if hasattr(os, "pidfd_open"):
+            try:
+                self.fd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                self.outcome = KILL_NOT_FOUND
+            except OSError:
+                # 内核不支持或文件描述符耗尽时退回按 PID 发送信号
+                self.fd = None
+
+    def send(self, sig: signal.Signals) -> bool:
+        """发送信号，进程已不存在或无权限时记录结果并返回 False"""
+        try:
+            if self.fd is not None:
+                signal.pidfd_send_signal(self.fd, sig)
+            else:
+                os.kill(self.pid, sig)
+        except ProcessLookupError:
+            if self.signal is None:
+                self.outcome = KILL_NOT_FOUND
+            else:
+                self.exited()
+            return False
+        except PermissionError:
+            self.outcome = KILL_DENIED
+            return False
+        self.signal = sig
+        return True
+
+    def alive(self) -> bool:
+        """没有 pidfd 时按 PID 检查进程是否存活，僵尸进程视为已退出"""
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        # 僵尸进程已经退出，只是尚未被父进程回收，kill(pid, 0) 仍然成功
+        try:
+            return _read_pid_stat(self.pid).state != "Z"
+        except (OSError, ValueError, IndexError):
+            # 刚好退出或无法读取 stat 时保守视为存活，下一轮再检查
+            return True
+
+    def exited(self) -> None:
+        self.outcome = KILL_KILLED if self.signal == signal.SIGKILL else KILL_TERMINATED
+        self.elapsed = time.monotonic() - self.started
+
+    def close(self) -> None:
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def result(self) -> KillResult:
+        return KillResult(
+            pid=self.pid,
+            outcome=self.outcome or KILL_SURVIVED,
+            signal=self.signal.name if self.signal is not None else None,
+            elapsed=self.elapsed,
+        )
+
+
+def _wait_exit(targets: List[_KillTarget], timeout: float) -> List[_KillTarget]:
+    """用 poll 等待 pidfd 可读（进程退出），返回超时后仍存活的进程"""
+    deadline = time.monotonic() + timeout
+    poller = select.poll()
+    by_fd: Dict[int, _KillTarget] = {}
+    fallback: List[_KillTarget] = []
+    for t in targets:
+        if t.fd is not None:
+            poller.register(t.fd, select.POLLIN)
+            by_fd[t.fd] = t
+        else:
+            fallback.append(t)
+
+    while by_fd or fallback:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        if fallback:
+            remaining = min(remaining, _KILL_POLL_INTERVAL)
+        for fd, _ in poller.poll(remaining * 1000):
+            poller.unregister(fd)
+            by_fd.pop(fd).exited()
+        for t in [t for t in fallback if not t.alive()]:
+            fallback.remove(t)
+            t.exited()
+    return list(by_fd.values()) + fallback
+
+
+async def _wait_exit_async(targets: List[_KillTarget], timeout: float) -> List[_KillTarget]:
+    """在事件循环中监听 pidfd 可读（进程退出），返回超时后仍存活的进程"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    waiters: Dict[int, asyncio.Future] = {}
+    fallback: List[_KillTarget] = []
+
+    def on_exit(t: _KillTarget) -> None:
+        loop.remove_reader(t.fd)
+        t.exited()
+        waiter = waiters.pop(t.fd)
+        if not waiter.done():
+            waiter.set_result(None)
+
+    for t in targets:
+        if t.fd is not None:
+            waiters[t.fd] = loop.create_future()
+            loop.add_reader(t.fd, on_exit, t)
+        else:
+            fallback.append(t)
+
+    async def poll_fallback() -> None:
+        while fallback:
+            for t in [t for t in fallback if not t.alive()]:
+                fallback.remove(t)
+                t.exited()
+            remaining = deadline - loop.time()
+            if not fallback or remaining <= 0:
+                return
+            await asyncio.sleep(min(_KILL_POLL_INTERVAL, remaining))
+
+    pending = list(waiters.values())
+    if fallback:
+        pending.append(asyncio.ensure_future(poll_fallback()))
+    try:
+        if pending:
+            _, not_done = await asyncio.wait(pending, timeout=timeout)
+            for fut in not_done:
+                fut.cancel()
+    finally:
+        for fd in waiters:
+            loop.remove_reader(fd)
+    return [t for t in targets if t.outcome is None]
+
+
+def _kill_targets(pids: Iterable[int], tree: bool) -> List[_KillTarget]:
+    """展开进程树并为每个进程打开 pidfd"""
+    pids = list(dict.fromkeys(pids))
+    if tree:
+        from .proctree import process_tree
+
+        ptree = process_tree()
+        # 父进程在前，子进程随后，同一进程只出现一次
+        expanded = (ptree.descendants(pid, include_self=True) or [pid] for pid in pids)
+        pids = list(dict.fromkeys(p for group in expanded for p in group))
+    return [_KillTarget(pid) for pid in pids]
+
+
+def _kill_report(targets: List[_KillTarget]) -> Dict[int, KillResult]:
+    for t in targets:
+        t.close()
+    report = {t.pid: t.result() for t in targets}
+    counts: Dict[str, int] = {}
+    for r in report.values():
+        counts[r.outcome] = counts.get(r.outcome, 0) + 1
+    logger.info(f"批量终止 {len(report)} 个进程: {counts}")
+    return report
+
+
+def kill_processes(
+    pids: Iterable[int],
+    grace: float = 10.0,
+    kill_timeout: float = 5.0,
+    tree: bool = False,
+) -> Dict[int, KillResult]:
+    """
+    批量终止进程
+
+    先向所有进程同时发送 SIGTERM，通过 pidfd 和 poll 等待退出（不轮询睡眠），宽限期后
+    仍存活的进程收到 SIGKILL。pidfd 在发送信号前打开，进程退出后 PID 被复用也不会误杀
+    新进程。内核不支持 pidfd 或文件描述符不足时，该进程退回按 PID 发送信号并定期检查。
+
+    Args:
+        pids: 进程ID
+        grace: SIGTERM 后等待退出的宽限期(秒)
+        kill_timeout: SIGKILL 后等待退出的时间(秒)
+        tree: 是否同时终止所有后代进程
+
+    Returns:
+        Dict[int, KillResult]: 进程ID -> 结果
+    """
+    targets = _kill_targets(pids, tree)
+    try:
+        alive = [t for t in targets if t.outcome is None and t.send(signal.SIGTERM)]
+        alive = _wait_exit(alive, grace)
+        alive = [t for t in alive if t.send(signal.SIGKILL)]
+        _wait_exit(alive, kill_timeout)
+    finally:
+        report = _kill_report(targets)
+    return report
+
+
+async def kill_processes_async(
+    pids: Iterable[int],
+    grace: float = 10.0,
+    kill_timeout: float = 5.0,
+    tree: bool = False,
+) -> Dict[int, KillResult]:
+    """
+    异步批量终止进程
+
+    与 kill_processes() 相同，但在事件循环中通过 add_reader 监听 pidfd，等待期间不占用线程。
+
+    Args:
+        pids: 进程ID
+        grace: SIGTERM 后等待退出的宽限期(秒)
+        kill_timeout: SIGKILL 后等待退出的时间(秒)
+        tree: 是否同时终止所有后代进程
+
+    Returns:
+        Dict[int, KillResult]: 进程ID -> 结果
+    """
+    if tree:
+        targets = await asyncio.to_thread(_kill_targets, pids, tree)
+    else:
+        targets = _kill_targets(pids, tree)
+    try:
+        alive = [t for t in targets if t.outcome is None and t.send(signal.SIGTERM)]
+        alive = await _wait_exit_async(alive, grace)
+        alive = [t for t in alive if t.send(signal.SIGKILL)]
+        await _wait_exit_async(alive, kill_timeout)
+    finally:
+        report = _kill_report(targets)
+    return report
+
+
+async def list_processes_async(timeout: Optional[float] = None) -> List[Process]:
+    """
+    异步列出系统进程
+
+    采集在线程中执行，不阻塞事件循环；协程被取消或超时后立即返回。
+
+    Args:
+        timeout: 超时时间(秒)，为 None 时不限制
+
+    Returns:
+        List[Process]: 进程信息列表
+    """
+    return await asyncio.wait_for(asyncio.to_thread(list_processes), timeout)
+
+
+async def find_process_async(name: str, timeout: Optional[float] = None) -> List[Process]:
+    """
+    异步根据进程名查找进程
+
+    Args:
+        name: 进程名称（部分匹配）
+        timeout: 超时时间(秒)，为 None 时不限制
+
+    Returns:
+        List[Process]: 匹配的进程列表
+    """
+    return await asyncio.wait_for(asyncio.to_thread(find_process, name), timeout)
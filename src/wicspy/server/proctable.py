@@ -0,0 +1,286 @@
+"""
+进程表模块 - 长期维护的增量进程表，每次刷新产生进程创建、退出和变化事件
+"""
+
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from pydantic import BaseModel, Field
+
+from .columns import ProcessColumns
+from .monitor import _read_meminfo, _read_uptime
+from .process import (
+    PROCESS_FIELDS,
+    PidStat,
+    Process,
+    ProcessMatcher,
+    _iter_pids,
+    _proc_process,
+    _read_pid_cmdline,
+    _read_pid_exe,
+    _read_pid_stat,
+    _read_pid_uid,
+    _username,
+)
+
+
+SPAWNED = "spawned"
+EXITED = "exited"
+CHANGED = "changed"
+
+# 默认跟踪变化的字段，CPU 时间和 RSS 几乎每次都会变化，默认不产生事件
+DEFAULT_TRACKED = ("name", "state", "ppid", "threads")
+
+# 跟踪字段 -> PidStat 属性
+_TRACKABLE = {
+    "name": "comm",
+    "state": "state",
+    "ppid": "ppid",
+    "threads": "num_threads",
+    "rss": "rss_pages",
+}
+
+
+class ProcessEvent(BaseModel):
+    """进程事件模型"""
+    kind: str = Field(..., description="事件类型(spawned/exited/changed)")
+    pid: int = Field(..., description="进程ID")
+    process: Process = Field(..., description="事件发生时的进程信息，退出事件为最后一次观测到的信息")
+    changes: Dict[str, Tuple[Any, Any]] = Field(default_factory=dict, description="变化的字段 -> (旧值, 新值)")
+
+
+class _Entry:
+    """进程表中的一项，静态信息在进程首次出现和 exec 后读取"""
+    __slots__ = ("stat", "static")
+
+    def __init__(self, stat: PidStat, static: Dict[str, Any]):
+        self.stat = stat
+        self.static = static
+
+
+class ProcessTable:
+    """
+    增量进程表
+
+    进程以 (pid, starttime) 标识，PID 被复用时会产生旧进程的退出事件和新进程的创建事件。
+    每次 refresh() 只读取各进程的 /proc/[pid]/stat，cmdline、用户和可执行文件路径只在
+    进程首次出现时读取一次。execve 不改变 pid 和 starttime，因此进程名(comm)变化时视为
+    exec 并重新读取这些信息；exec 同名程序时不会重新读取。首次 refresh() 会为所有现存进程
+    产生创建事件。
+
+    Example:
+        >>> table = ProcessTable()
+        >>> table.refresh()
+        >>> for event in table.refresh():
+        ...     print(event.kind, event.pid, event.process.name)
+    """
+
+    def __init__(self, track: Optional[Iterable[str]] = None):
+        """
+        初始化进程表
+
+        Args:
+            track: 需要产生变化事件的字段，可选 name、state、ppid、threads、rss，
+                为 None 时使用 DEFAULT_TRACKED
+
+        Raises:
+            ValueError: track 中包含不支持的字段
+        """
+        tracked = tuple(DEFAULT_TRACKED if track is None else track)
+        unknown = set(tracked) - set(_TRACKABLE)
+        if unknown:
+            raise ValueError(f"不支持跟踪的字段: {', '.join(sorted(unknown))}")
+        self._tracked = tuple((name, _TRACKABLE[name]) for name in tracked)
+        self._entries: Dict[int, _Entry] = {}
+        # 进程名(comm) -> PID 集合
+        self._by_name: Dict[str, Set[int]] = {}
+        self._lock = threading.RLock()
+        self._boot_time = 0.0
+        self._uptime = 0.0
+        self._mem_total = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, pid: object) -> bool:
+        return pid in self._entries
+
+    @staticmethod
+    def _read_static(pid: int) -> Dict[str, Any]:
+        """读取只在 exec 时才会变化的信息"""
+        return {
+            "user": _username(_read_pid_uid(pid)),
+            "cmd": _read_pid_cmdline(pid),
+            "exe": _read_pid_exe(pid),
+        }
+
+    def _materialize(self, entry: _Entry, fields: FrozenSet[str] = PROCESS_FIELDS) -> Process:
+        return _proc_process(
+            entry.stat, fields, self._boot_time, self._uptime, self._mem_total, entry.static
+        )
+
+    def _index(self, pid: int, name: str) -> None:
+        self._by_name.setdefault(name, set()).add(pid)
+
+    def _unindex(self, pid: int, name: str) -> None:
+        pids = self._by_name.get(name)
+        if pids is not None:
+            pids.discard(pid)
+            if not pids:
+                del self._by_name[name]
+
+    def refresh(self) -> List[ProcessEvent]:
+        """
+        刷新进程表
+
+        Returns:
+            List[ProcessEvent]: 自上次刷新以来的进程事件
+        """
+        events: List[ProcessEvent] = []
+        with self._lock:
+            self._uptime = _read_uptime()
+            self._boot_time = time.time() - self._uptime
+            self._mem_total = _read_meminfo().total
+
+            entries = self._entries
+            seen = set()
+            for pid in _iter_pids():
+                try:
+                    st = _read_pid_stat(pid)
+                except (OSError, ValueError, IndexError):
+                    # 进程在扫描期间退出或无法解析
+                    continue
+
+                entry = entries.get(pid)
+                if entry is not None and entry.stat.starttime != st.starttime:
+                    # PID 被复用：旧进程已退出
+                    del entries[pid]
+                    self._unindex(pid, entry.stat.comm)
+                    events.append(ProcessEvent(kind=EXITED, pid=pid, process=self._materialize(entry)))
+                    entry = None
+
+                if entry is None:
+                    try:
+                        entry = _Entry(st, self._read_static(pid))
+                    except OSError:
+                        continue
+                    entries[pid] = entry
+                    self._index(pid, st.comm)
+                    events.append(ProcessEvent(kind=SPAWNED, pid=pid, process=self._materialize(entry)))
+                else:
+                    old = entry.stat
+                    entry.stat = st
+                    if old.comm != st.comm:
+                        self._unindex(pid, old.comm)
+                        self._index(pid, st.comm)
+                        # 进程名变化通常意味着 exec（包括 fork 后 exec 的子进程），命令行、
+                        # 可执行文件和（setuid 程序的）用户都可能已经改变
+                        try:
+                            entry.static = self._read_static(pid)
+                        except OSError:
+                            pass
+                    changes = {
+                        name: (getattr(old, attr), getattr(st, attr))
+                        for name, attr in self._tracked
+                        if getattr(old, attr) != getattr(st, attr)
+                    }
+                    if changes:
+                        events.append(ProcessEvent(
+                            kind=CHANGED, pid=pid, process=self._materialize(entry), changes=changes
+                        ))
+                seen.add(pid)
+
+            for pid in [pid for pid in entries if pid not in seen]:
+                entry = entries.pop(pid)
+                self._unindex(pid, entry.stat.comm)
+                events.append(ProcessEvent(kind=EXITED, pid=pid, process=self._materialize(entry)))
+
+        return events
+
+    def pids(self) -> List[int]:
+        """
+        获取进程表中的所有进程ID
+
+        Returns:
+            List[int]: 进程ID列表
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def get(self, pid: int) -> Optional[Process]:
+        """
+        获取单个进程的信息（截至上次刷新）
+
+        Args:
+            pid: 进程ID
+
+        Returns:
+            Optional[Process]: 进程信息，不存在时返回 None
+        """
+        with self._lock:
+            entry = self._entries.get(pid)
+            return self._materialize(entry) if entry is not None else None
+
+    def processes(self) -> List[Process]:
+        """
+        获取进程表中所有进程的信息（截至上次刷新）
+
+        Returns:
+            List[Process]: 进程信息列表
+        """
+        with self._lock:
+            return [self._materialize(entry) for entry in self._entries.values()]
+
+    def columns(self) -> ProcessColumns:
+        """
+        将进程表转换为列式表示（截至上次刷新），不构建 Process 对象
+
+        Returns:
+            ProcessColumns: 列式进程表，按行访问时使用进程表缓存的 cmd 和 exe
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            cols = ProcessColumns({entry.stat.pid: entry.static for entry in entries})
+            for entry in entries:
+                cols._append(entry.stat, entry.static["user"], self._boot_time, self._uptime, self._mem_total)
+        return cols
+
+    def _candidates(self, matcher: ProcessMatcher) -> Iterable[int]:
+        """根据名称条件从索引中取出候选 PID"""
+        by_name = self._by_name
+        if matcher.name is not None:
+            return list(by_name.get(matcher.name[:15], ()))
+        if matcher.pattern is None and matcher.regex is None:
+            return list(self._entries)
+        # 通配符和正则只需对不同的进程名各匹配一次
+        return [pid for name, pids in by_name.items() if matcher.match_name(name) for pid in pids]
+
+    def find(self, matcher: ProcessMatcher, fields: FrozenSet[str] = PROCESS_FIELDS) -> List[Process]:
+        """
+        在进程表中查找匹配的进程（截至上次刷新），不读取任何 /proc 文件
+
+        通常通过 find_processes(..., table=table) 调用。
+
+        Args:
+            matcher: 匹配条件
+            fields: 需要填充的 Process 字段名
+
+        Returns:
+            List[Process]: 匹配的进程列表
+        """
+        result = []
+        with self._lock:
+            entries = self._entries
+            for pid in self._candidates(matcher):
+                entry = entries[pid]
+                if not matcher.match_stat(entry.stat):
+                    continue
+                static = entry.static
+                if matcher.uid is not None and static["user"] not in (
+                    _username(matcher.uid), str(matcher.uid)
+                ):
+                    continue
+                if matcher.needs_cmd and not matcher.match_cmd(entry.stat.comm, static["cmd"]):
+                    continue
+                result.append(self._materialize(entry, fields))
+        return result
@@ -0,0 +1,254 @@
+"""
+进程采样模块 - 基于相邻两次采样的差值计算每个进程当前的 CPU 使用率、I/O 和上下文切换速率
+"""
+
+import asyncio
+import heapq
+import threading
+import time
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+from pydantic import BaseModel, Field
+from loguru import logger
+
+from .monitor import _read_uptime
+from .process import _CLK_TCK, _PAGE_SIZE, PidStat, _iter_pids, _read_pid_stat
+
+
+class ProcessRate(BaseModel):
+    """进程实时速率模型"""
+    pid: int = Field(..., description="进程ID")
+    name: str = Field("", description="进程名称")
+    interval: float = Field(0.0, description="计算速率所用的时间间隔(秒)")
+    cpu_percent: float = Field(0.0, description="区间内 CPU 使用百分比，多核时可超过 100")
+    read_bytes_per_sec: float = Field(0.0, description="每秒从存储层读取的字节数")
+    write_bytes_per_sec: float = Field(0.0, description="每秒写入存储层的字节数")
+    ctx_switches_per_sec: float = Field(0.0, description="每秒上下文切换次数(自愿+非自愿)")
+    rss: int = Field(0, description="常驻内存(字节)")
+
+
+class ProcessRateRecord(NamedTuple):
+    """进程实时速率记录，需要时再转换为 pydantic 模型"""
+    pid: int
+    name: str
+    interval: float
+    cpu_percent: float
+    read_bytes_per_sec: float
+    write_bytes_per_sec: float
+    ctx_switches_per_sec: float
+    rss: int
+
+    def to_model(self) -> ProcessRate:
+        return ProcessRate(**self._asdict())
+
+
+class _Counters(NamedTuple):
+    """单个进程在某一时刻的累计计数"""
+    starttime: int
+    at: float
+    cpu_ticks: int
+    read_bytes: int
+    write_bytes: int
+    ctx_switches: int
+
+
+# top() 中 by 参数 -> 排序键
+_SORT_KEYS = {
+    "cpu": lambda r: r.cpu_percent,
+    "read": lambda r: r.read_bytes_per_sec,
+    "write": lambda r: r.write_bytes_per_sec,
+    "io": lambda r: r.read_bytes_per_sec + r.write_bytes_per_sec,
+    "ctx": lambda r: r.ctx_switches_per_sec,
+    "memory": lambda r: r.rss,
+}
+
+
+def _boot_clock() -> float:
+    """开机以来的秒数，与 /proc/[pid]/stat 的 starttime 同一时钟；CLOCK_BOOTTIME 精度高于 /proc/uptime"""
+    if hasattr(time, "CLOCK_BOOTTIME"):
+        return time.clock_gettime(time.CLOCK_BOOTTIME)
+    return _read_uptime()
+
+
+def _read_pid_io(pid: int) -> Tuple[int, int]:
+    """
+    读取 /proc/[pid]/io 中的 read_bytes 和 write_bytes
+
+    Raises:
+        OSError: 进程已退出或无权访问（其他用户的进程需要 ptrace 权限）
+    """
+    read_bytes = write_bytes = 0
+    with open(f"/proc/{pid}/io", "rb") as f:
+        for line in f:
+            if line.startswith(b"read_bytes:"):
+                read_bytes = int(line[11:])
+            elif line.startswith(b"write_bytes:"):
+                write_bytes = int(line[12:])
+    return read_bytes, write_bytes
+
+
+def _read_pid_ctx_switches(pid: int) -> int:
+    """读取 /proc/[pid]/status 中自愿与非自愿上下文切换次数之和"""
+    total = 0
+    with open(f"/proc/{pid}/status", "rb") as f:
+        for line in f:
+            if line.startswith(b"voluntary_ctxt_switches:"):
+                total += int(line[24:])
+            elif line.startswith(b"nonvoluntary_ctxt_switches:"):
+                total += int(line[27:])
+    return total
+
+
+class ProcessSampler:
+    """
+    进程速率采样器
+
+    保存每个进程上一次采样的 utime+stime、/proc/[pid]/io 和上下文切换计数，
+    与本次采样做差得到区间内的速率，而不是 ps 给出的生命周期平均值。进程以
+    (pid, starttime) 标识，PID 被复用时不会与旧进程做差。没有上一次计数的进程
+    （包括首次采样）以进程启动时刻为起点，得到启动以来的平均值。
+
+    每次采样只构建轻量的 ProcessRateRecord，top() 用堆选出前 n 个后才转换为
+    pydantic 模型。无权读取 /proc/[pid]/io 的进程 I/O 速率为 0。
+
+    Example:
+        >>> sampler = ProcessSampler()
+        >>> sampler.sample()
+        >>> time.sleep(1)
+        >>> for p in sampler.top(5, by="cpu"):
+        ...     print(p.pid, p.name, p.cpu_percent)
+    """
+
+    def __init__(self, io: bool = True, ctx_switches: bool = True):
+        """
+        初始化进程速率采样器
+
+        Args:
+            io: 是否采集 /proc/[pid]/io
+            ctx_switches: 是否采集上下文切换次数（需要读取 /proc/[pid]/status）
+        """
+        self._io = io
+        self._ctx_switches = ctx_switches
+        self._prev: Dict[int, _Counters] = {}
+        self._lock = threading.Lock()
+
+    def sample(self) -> List[ProcessRateRecord]:
+        """
+        采样所有进程
+
+        Returns:
+            List[ProcessRateRecord]: 每个进程自上次采样以来的速率记录
+        """
+        return self._sample()[0]
+
+    def _sample(self) -> Tuple[List[ProcessRateRecord], Dict[int, PidStat]]:
+        """采样所有进程，同时返回本次读取的 stat，供需要其他字段的调用方复用同一次扫描"""
+        now = _boot_clock()
+        result = []
+        stats: Dict[int, PidStat] = {}
+        current: Dict[int, _Counters] = {}
+        with self._lock:
+            prev = self._prev
+            for pid in _iter_pids():
+                try:
+                    st = _read_pid_stat(pid)
+                except OSError:
+                    continue
+                except (ValueError, IndexError) as e:
+                    logger.debug(f"解析进程 {pid} 信息失败: {e}")
+                    continue
+                stats[pid] = st
+
+                read_bytes = write_bytes = ctx = 0
+                if self._io:
+                    try:
+                        read_bytes, write_bytes = _read_pid_io(pid)
+                    except OSError:
+                        pass
+                if self._ctx_switches:
+                    try:
+                        ctx = _read_pid_ctx_switches(pid)
+                    except OSError:
+                        continue
+
+                counters = _Counters(st.starttime, now, st.utime + st.stime, read_bytes, write_bytes, ctx)
+                current[pid] = counters
+                base = prev.get(pid)
+                if base is None or base.starttime != st.starttime:
+                    base = _Counters(st.starttime, st.starttime / _CLK_TCK, 0, 0, 0, 0)
+                elapsed = now - base.at
+                if elapsed <= 0:
+                    continue
+                result.append(ProcessRateRecord(
+                    pid=pid,
+                    name=st.comm,
+                    interval=elapsed,
+                    cpu_percent=(counters.cpu_ticks - base.cpu_ticks) / _CLK_TCK / elapsed * 100.0,
+                    # 无权读取 io 时计数为 0，与上一次的差值可能为负
+                    read_bytes_per_sec=max(read_bytes - base.read_bytes, 0) / elapsed,
+                    write_bytes_per_sec=max(write_bytes - base.write_bytes, 0) / elapsed,
+                    ctx_switches_per_sec=max(ctx - base.ctx_switches, 0) / elapsed,
+                    rss=st.rss_pages * _PAGE_SIZE,
+                ))
+            # 只保留本次仍存在的进程，已退出进程的计数随之释放
+            self._prev = current
+        return result, stats
+
+    def top(self, n: int = 10, by: str = "cpu") -> List[ProcessRate]:
+        """
+        采样并返回速率最高的 n 个进程
+
+        Args:
+            n: 进程数
+            by: 排序依据，可选 cpu、read、write、io、ctx、memory
+
+        Returns:
+            List[ProcessRate]: 按 by 降序排列的进程速率列表
+
+        Raises:
+            ValueError: 不支持的排序依据
+        """
+        key = _SORT_KEYS.get(by)
+        if key is None:
+            raise ValueError(f"不支持的排序依据: {by}，可选 {', '.join(_SORT_KEYS)}")
+        return [r.to_model() for r in heapq.nlargest(n, self.sample(), key=key)]
+
+
+async def iter_top_async(
+    n: int = 10,
+    interval: float = 1.0,
+    by: str = "cpu",
+    sampler: Optional[ProcessSampler] = None,
+) -> AsyncIterator[List[ProcessRate]]:
+    """
+    按固定节奏持续产生速率最高的 n 个进程，类似 top
+
+    第一次立即采样，结果为各进程启动以来的平均值，之后每个结果都是相邻两次采样之间的速率。
+    采样在线程中执行，不阻塞事件循环；处理过慢错过的周期会被跳过。
+
+    Args:
+        n: 每次产生的进程数
+        interval: 采样间隔(秒)
+        by: 排序依据，可选 cpu、read、write、io、ctx、memory
+        sampler: 进程速率采样器，为 None 时创建独立的采样器
+
+    Yields:
+        List[ProcessRate]: 按 by 降序排列的进程速率列表
+
+    Example:
+        >>> async for top in iter_top_async(5, interval=2.0):
+        ...     print([(p.name, p.cpu_percent) for p in top])
+    """
+    if by not in _SORT_KEYS:
+        raise ValueError(f"不支持的排序依据: {by}，可选 {', '.join(_SORT_KEYS)}")
+    loop = asyncio.get_running_loop()
+    sampler = sampler or ProcessSampler()
+    next_tick = loop.time()
+    while True:
+        yield await asyncio.to_thread(sampler.top, n, by)
+        next_tick += interval
+        delay = next_tick - loop.time()
+        if delay < 0:
+            missed = int(-delay // interval) + 1
+            next_tick += missed * interval
+            delay = next_tick - loop.time()
+        await asyncio.sleep(delay)
@@ -0,0 +1,290 @@
+"""
+进程树模块 - 一次扫描构建父子进程关系，并汇总每棵子树的内存、CPU 和线程数
+"""
+
+from typing import Dict, Iterator, List, Optional
+from pydantic import BaseModel, Field
+from loguru import logger
+
+from .monitor import _read_uptime
+from .process import _CLK_TCK, _PAGE_SIZE, _iter_pids, _read_pid_stat
+from .proctop import ProcessSampler
+from .smaps import get_smaps_collector
+
+
+class SubtreeUsage(BaseModel):
+    """进程子树资源汇总模型"""
+    pid: int = Field(..., description="子树根进程ID")
+    name: str = Field("", description="子树根进程名称")
+    processes: int = Field(0, description="子树中的进程数(含根进程)")
+    threads: int = Field(0, description="子树线程总数")
+    rss: int = Field(0, description="子树常驻内存之和(字节)，共享页会被重复计算")
+    pss: Optional[int] = Field(None, description="子树按比例分摊的内存之和(字节)，未采集时为 None")
+    cpu_time: float = Field(0.0, description="子树累计 CPU 时间(秒)")
+    cpu_percent: float = Field(0.0, description="子树 CPU 使用百分比之和")
+    children: List[int] = Field(default_factory=list, description="直接子进程ID")
+
+
+class ProcessNode:
+    """进程树节点，total_* 为包含自身在内的整棵子树的汇总值"""
+    __slots__ = (
+        "pid", "ppid", "name", "threads", "rss", "pss", "cpu_time", "cpu_percent", "children",
+        "total_processes", "total_threads", "total_rss", "total_pss", "total_cpu_time", "total_cpu_percent",
+    )
+
+    def __init__(
+        self,
+        pid: int,
+        ppid: int,
+        name: str,
+        threads: int,
+        rss: int,
+        pss: Optional[int],
+        cpu_time: float,
+        cpu_percent: float,
+    ):
+        self.pid = pid
+        self.ppid = ppid
+        self.name = name
+        self.threads = threads
+        self.rss = rss
+        self.pss = pss
+        self.cpu_time = cpu_time
+        self.cpu_percent = cpu_percent
+        self.reset()
+
+    def reset(self) -> None:
+        """清空子节点并将汇总值重置为自身的值"""
+        self.children: List["ProcessNode"] = []
+        self.total_processes = 1
+        self.total_threads = self.threads
+        self.total_rss = self.rss
+        self.total_pss = self.pss or 0
+        self.total_cpu_time = self.cpu_time
+        self.total_cpu_percent = self.cpu_percent
+
+    def __repr__(self) -> str:
+        return f"ProcessNode(pid={self.pid}, name={self.name!r}, children={len(self.children)})"
+
+
+class ProcessTree:
+    """
+    进程树
+
+    节点按 ppid 挂到父进程下，父进程不存在的进程（init、kthreadd 以及扫描期间父进程已退出的
+    进程）作为根节点。子树汇总在构建时按拓扑逆序一次完成，总复杂度 O(N)。
+
+    Example:
+        >>> tree = process_tree()
+        >>> usage = tree.usage(master_pid)
+        >>> print(usage.processes, usage.rss, usage.cpu_percent)
+        >>> tree.descendants(master_pid)
+    """
+
+    def __init__(self, nodes: Dict[int, ProcessNode]):
+        """
+        根据节点构建进程树，通常通过 process_tree() 创建
+
+        Args:
+            nodes: 进程ID -> 节点，节点的 children 和 total_* 会被清空后重新计算，
+                因此可以复用上一棵树的节点（进程被重新挂靠或退出后不会残留旧的关系和汇总）
+        """
+        self._build(nodes)
+
+    def _build(self, nodes: Dict[int, ProcessNode]) -> None:
+        """重置节点关系并重新挂靠、汇总"""
+        self.nodes = nodes
+        self.roots: List[ProcessNode] = []
+        for node in nodes.values():
+            node.reset()
+        for node in nodes.values():
+            parent = nodes.get(node.ppid) if node.ppid != node.pid else None
+            if parent is None:
+                self.roots.append(node)
+            else:
+                parent.children.append(node)
+
+        # 先序遍历的逆序保证子节点先于父节点汇总
+        order = list(self._preorder(self.roots))
+        self._has_pss = any(node.pss is not None for node in order)
+        for node in reversed(order):
+            parent = nodes.get(node.ppid) if node.ppid != node.pid else None
+            if parent is not None:
+                parent.total_processes += node.total_processes
+                parent.total_threads += node.total_threads
+                parent.total_rss += node.total_rss
+                parent.total_pss += node.total_pss
+                parent.total_cpu_time += node.total_cpu_time
+                parent.total_cpu_percent += node.total_cpu_percent
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def refresh(self, pss: bool = False, sampler: Optional[ProcessSampler] = None) -> None:
+        """
+        重新扫描 /proc 并原地重建进程树，children 和 total_* 全部重新计算
+
+        Args:
+            pss: 是否采集 PSS
+            sampler: 进程速率采样器，参见 process_tree()
+        """
+        self._build(_scan_nodes(pss, sampler))
+
+    def __contains__(self, pid: object) -> bool:
+        return pid in self.nodes
+
+    @staticmethod
+    def _preorder(roots: List[ProcessNode]) -> Iterator[ProcessNode]:
+        """非递归先序遍历，避免深层进程链超过递归深度"""
+        stack = list(reversed(roots))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def get(self, pid: int) -> Optional[ProcessNode]:
+        """
+        获取进程节点
+
+        Args:
+            pid: 进程ID
+
+        Returns:
+            Optional[ProcessNode]: 节点，不存在时返回 None
+        """
+        return self.nodes.get(pid)
+
+    def walk(self, pid: Optional[int] = None) -> Iterator[ProcessNode]:
+        """
+        先序遍历子树
+
+        Args:
+            pid: 子树根进程ID，为 None 时遍历整棵树
+
+        Yields:
+            ProcessNode: 进程节点，父节点先于子节点
+        """
+        if pid is None:
+            yield from self._preorder(self.roots)
+            return
+        node = self.nodes.get(pid)
+        if node is not None:
+            yield from self._preorder([node])
+
+    def descendants(self, pid: int, include_self: bool = False) -> List[int]:
+        """
+        获取进程的所有后代进程ID
+
+        Args:
+            pid: 进程ID
+            include_self: 结果是否包含 pid 自身
+
+        Returns:
+            List[int]: 后代进程ID，父进程在前；进程不存在时返回空列表
+        """
+        pids = [node.pid for node in self.walk(pid)]
+        return pids if include_self else pids[1:]
+
+    def ancestors(self, pid: int) -> List[int]:
+        """
+        获取进程的所有祖先进程ID
+
+        Args:
+            pid: 进程ID
+
+        Returns:
+            List[int]: 祖先进程ID，从父进程到根进程
+        """
+        result = []
+        node = self.nodes.get(pid)
+        while node is not None and node.ppid != node.pid:
+            node = self.nodes.get(node.ppid)
+            if node is not None:
+                result.append(node.pid)
+        return result
+
+    def usage(self, pid: int) -> Optional[SubtreeUsage]:
+        """
+        获取子树资源汇总
+
+        Args:
+            pid: 子树根进程ID
+
+        Returns:
+            Optional[SubtreeUsage]: 汇总信息，进程不存在时返回 None
+        """
+        node = self.nodes.get(pid)
+        if node is None:
+            return None
+        return SubtreeUsage(
+            pid=node.pid,
+            name=node.name,
+            processes=node.total_processes,
+            threads=node.total_threads,
+            rss=node.total_rss,
+            pss=node.total_pss if self._has_pss else None,
+            cpu_time=node.total_cpu_time,
+            cpu_percent=node.total_cpu_percent,
+            children=[child.pid for child in node.children],
+        )
+
+
+def _scan_nodes(pss: bool, sampler: Optional[ProcessSampler]) -> Dict[int, ProcessNode]:
+    """扫描 /proc 创建进程节点，不建立父子关系，参数见 process_tree()"""
+    rates: Dict[int, float] = {}
+    if sampler is not None:
+        records, stats = sampler._sample()
+        rates = {r.pid: r.cpu_percent for r in records}
+    else:
+        stats = {}
+        for pid in _iter_pids():
+            try:
+                stats[pid] = _read_pid_stat(pid)
+            except OSError:
+                continue
+            except (ValueError, IndexError) as e:
+                logger.debug(f"解析进程 {pid} 信息失败: {e}")
+    uptime = _read_uptime()
+
+    nodes: Dict[int, ProcessNode] = {}
+    for pid, st in stats.items():
+        cpu_time = (st.utime + st.stime) / _CLK_TCK
+        if sampler is not None:
+            cpu_percent = rates.get(pid, 0.0)
+        else:
+            elapsed = uptime - st.starttime / _CLK_TCK
+            cpu_percent = cpu_time / elapsed * 100.0 if elapsed > 0 else 0.0
+        nodes[pid] = ProcessNode(
+            pid=pid,
+            ppid=st.ppid,
+            name=st.comm,
+            threads=st.num_threads,
+            rss=st.rss_pages * _PAGE_SIZE,
+            pss=None,
+            cpu_time=cpu_time,
+            cpu_percent=cpu_percent,
+        )
+    if pss:
+        for record in get_smaps_collector().collect_records(list(nodes)):
+            node = nodes.get(record.pid)
+            if node is not None:
+                node.pss = record.pss
+    return nodes
+
+
+def process_tree(pss: bool = False, sampler: Optional[ProcessSampler] = None) -> ProcessTree:
+    """
+    扫描 /proc 构建进程树
+
+    每个进程只读取 /proc/[pid]/stat，提供 sampler 时直接复用其采样时读取的 stat，不再重复扫描；
+    pss 为 True 时通过默认的 SmapsCollector 读取 /proc/[pid]/smaps_rollup，RSS 未变化的进程使用缓存。
+
+    Args:
+        pss: 是否采集 PSS
+        sampler: 进程速率采样器，提供时 CPU 使用率为自该采样器上次采样以来的值，
+            否则为进程生命周期内的平均值
+
+    Returns:
+        ProcessTree: 进程树
+    """
+    return ProcessTree(_scan_nodes(pss, sampler))
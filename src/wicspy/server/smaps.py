@@ -0,0 +1,222 @@
+"""
+进程内存明细模块 - 读取 /proc/[pid]/smaps_rollup，按 PSS/USS 统计进程实际占用的内存
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from pydantic import BaseModel, Field
+from loguru import logger
+
+from wicspy.config import get_config
+from .process import _iter_pids, _read_pid_stat
+
+
+class MemoryDetail(BaseModel):
+    """进程内存明细模型，单位均为字节"""
+    pid: int = Field(..., description="进程ID")
+    name: str = Field("", description="进程名称")
+    rss: int = Field(0, description="常驻内存，共享页按完整大小计入每个进程")
+    pss: int = Field(0, description="按比例分摊的内存，共享页按共享进程数均摊")
+    uss: int = Field(0, description="独占内存(Private_Clean + Private_Dirty)，进程退出即可释放")
+    swap: int = Field(0, description="被换出的内存")
+    swap_pss: int = Field(0, description="按比例分摊的换出内存")
+    shared_clean: int = Field(0, description="共享的干净页")
+    shared_dirty: int = Field(0, description="共享的脏页")
+    private_clean: int = Field(0, description="独占的干净页")
+    private_dirty: int = Field(0, description="独占的脏页")
+    anonymous: int = Field(0, description="匿名内存")
+
+
+class SmapsRecord(NamedTuple):
+    """进程内存明细记录，需要时再转换为 pydantic 模型"""
+    pid: int
+    name: str
+    rss: int
+    pss: int
+    uss: int
+    swap: int
+    swap_pss: int
+    shared_clean: int
+    shared_dirty: int
+    private_clean: int
+    private_dirty: int
+    anonymous: int
+
+    def to_model(self) -> MemoryDetail:
+        return MemoryDetail(**self._asdict())
+
+
+# smaps_rollup 字段 -> SmapsRecord 字段
+_SMAPS_FIELDS = {
+    b"Rss:": "rss",
+    b"Pss:": "pss",
+    b"Swap:": "swap",
+    b"SwapPss:": "swap_pss",
+    b"Shared_Clean:": "shared_clean",
+    b"Shared_Dirty:": "shared_dirty",
+    b"Private_Clean:": "private_clean",
+    b"Private_Dirty:": "private_dirty",
+    b"Anonymous:": "anonymous",
+}
+
+
+def _read_smaps_rollup(pid: int, name: str) -> Optional[SmapsRecord]:
+    """
+    读取并解析 /proc/[pid]/smaps_rollup
+
+    Returns:
+        Optional[SmapsRecord]: 内存明细，内核线程（没有用户态内存）返回 None
+
+    Raises:
+        OSError: 进程已退出或无权访问
+    """
+    values = dict.fromkeys(_SMAPS_FIELDS.values(), 0)
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "rb") as f:
+            data = f.read()
+    except ProcessLookupError:
+        # 内核线程读取时返回 ESRCH
+        return None
+    if not data:
+        return None
+    for line in data.splitlines()[1:]:
+        parts = line.split()
+        field = _SMAPS_FIELDS.get(parts[0]) if parts else None
+        if field is not None:
+            values[field] = int(parts[1]) * 1024
+    return SmapsRecord(
+        pid=pid,
+        name=name,
+        uss=values["private_clean"] + values["private_dirty"],
+        **values,
+    )
+
+
+class SmapsCollector:
+    """
+    进程内存明细采集器
+
+    smaps_rollup 需要内核遍历进程的全部内存映射，进程多、映射多时开销远大于读取 stat。
+    采集器先读取每个进程的 stat（很便宜），只有新进程、RSS 发生变化或缓存超过 max_age
+    的进程才在线程池中并行读取 smaps_rollup，其余直接使用缓存。
+
+    注意：其他进程退出会改变共享页的分摊，使 PSS 变化而 RSS 不变，这类变化最多延迟 max_age 秒。
+    """
+
+    def __init__(self, max_workers: int = 4, max_age: float = 30.0):
+        """
+        初始化内存明细采集器
+
+        Args:
+            max_workers: 线程池最大线程数
+            max_age: 缓存的最长使用时间(秒)，超过后即使 RSS 不变也重新读取
+        """
+        self._max_age = max_age
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wicspy-smaps")
+        self._lock = threading.Lock()
+        # 进程ID -> ((starttime, rss 页数), 读取时间(monotonic), 记录)
+        self._cache: Dict[int, Tuple[Tuple[int, int], float, Optional[SmapsRecord]]] = {}
+
+    def collect_records(self, pids: Optional[Iterable[int]] = None) -> List[SmapsRecord]:
+        """
+        采集进程内存明细，返回轻量记录
+
+        Args:
+            pids: 进程ID，为 None 时采集全部进程
+
+        Returns:
+            List[SmapsRecord]: 内存明细记录，已退出、无权访问的进程和内核线程不包含在内
+        """
+        now = time.monotonic()
+        with self._lock:
+            cache = self._cache
+            keep: Dict[int, Tuple[Tuple[int, int], float, Optional[SmapsRecord]]] = {}
+            stale: List[Tuple[int, str, Tuple[int, int]]] = []
+            for pid in (_iter_pids() if pids is None else pids):
+                try:
+                    st = _read_pid_stat(pid)
+                except OSError:
+                    # 进程已退出，指定 pids 时从缓存中移除
+                    cache.pop(pid, None)
+                    continue
+                except (ValueError, IndexError) as e:
+                    logger.debug(f"解析进程 {pid} 信息失败: {e}")
+                    continue
+                key = (st.starttime, st.rss_pages)
+                cached = cache.get(pid)
+                if cached is not None and cached[0] == key and now - cached[1] < self._max_age:
+                    keep[pid] = cached
+                else:
+                    stale.append((pid, st.comm, key))
+
+            futures = [
+                (pid, key, self._executor.submit(_read_smaps_rollup, pid, name))
+                for pid, name, key in stale
+            ]
+            for pid, key, future in futures:
+                try:
+                    keep[pid] = (key, now, future.result())
+                except OSError:
+                    # 进程已退出或无权访问
+                    continue
+            if pids is None:
+                self._cache = keep
+            else:
+                cache.update(keep)
+        return [entry[2] for entry in keep.values() if entry[2] is not None]
+
+    def collect(self, pids: Optional[Iterable[int]] = None) -> List[MemoryDetail]:
+        """
+        采集进程内存明细
+
+        Args:
+            pids: 进程ID，为 None 时采集全部进程
+
+        Returns:
+            List[MemoryDetail]: 内存明细列表
+        """
+        return [record.to_model() for record in self.collect_records(pids)]
+
+    def close(self) -> None:
+        """关闭线程池"""
+        self._executor.shutdown(wait=False)
+
+
+_default_smaps_collector: Optional[SmapsCollector] = None
+
+
+def get_smaps_collector() -> SmapsCollector:
+    """
+    获取默认内存明细采集器实例
+
+    Returns:
+        SmapsCollector: 内存明细采集器实例
+    """
+    global _default_smaps_collector
+    if _default_smaps_collector is None:
+        _default_smaps_collector = SmapsCollector(
+            max_workers=get_config("smaps_max_workers", 4),
+            max_age=get_config("smaps_max_age", 30.0),
+        )
+    return _default_smaps_collector
+
+
+def get_memory_details(pids: Optional[Iterable[int]] = None) -> List[MemoryDetail]:
+    """
+    获取进程内存明细（RSS、PSS、USS、swap、共享/独占页）
+
+    仅支持 Linux，使用默认的 SmapsCollector，重复调用时 RSS 未变化的进程直接使用缓存。
+
+    Args:
+        pids: 进程ID，为 None 时采集全部进程
+
+    Returns:
+        List[MemoryDetail]: 内存明细列表
+    """
+    try:
+        return get_smaps_collector().collect(pids)
+    except Exception as e:
+        logger.error(f"获取进程内存明细失败: {e}")
+        return []
@@ -0,0 +1,385 @@
+"""
+套接字模块 - 解析 /proc/net 中的 TCP/UDP/Unix 套接字，并通过 inode 关联到所属进程
+"""
+
+import os
+import socket
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from pydantic import BaseModel, Field
+from loguru import logger
+
+from .process import _iter_pids, _read_pid_stat
+
+
+# 协议 -> /proc/net 文件
+_INET_FILES = {
+    "tcp": "/proc/net/tcp",
+    "tcp6": "/proc/net/tcp6",
+    "udp": "/proc/net/udp",
+    "udp6": "/proc/net/udp6",
+}
+PROTOCOLS = tuple(_INET_FILES) + ("unix",)
+
+_TCP_STATES = {
+    "01": "ESTABLISHED",
+    "02": "SYN_SENT",
+    "03": "SYN_RECV",
+    "04": "FIN_WAIT1",
+    "05": "FIN_WAIT2",
+    "06": "TIME_WAIT",
+    "07": "CLOSE",
+    "08": "CLOSE_WAIT",
+    "09": "LAST_ACK",
+    "0A": "LISTEN",
+    "0B": "CLOSING",
+    "0C": "NEW_SYN_RECV",
+}
+# UDP 复用 TCP 的状态码：07 为未连接（已绑定端口即可接收数据），01 为已 connect()
+_UDP_STATES = {"01": "ESTABLISHED", "07": "UNCONN"}
+_UNIX_STATES = {"01": "UNCONN", "02": "CONNECTING", "03": "CONNECTED", "04": "DISCONNECTING"}
+# Unix 套接字 Flags 中的 __SO_ACCEPTCON，表示正在 listen()
+_SO_ACCEPTCON = 0x10000
+
+
+def _is_listener(protocol: str, state: str) -> bool:
+    """
+    是否为监听套接字
+
+    TCP 和 Unix 套接字只看 LISTEN（Unix 由 __SO_ACCEPTCON 判断）；UDP 没有 listen()，
+    已绑定未连接(UNCONN)即可接收数据。Unix 的 UNCONN 只是未连接的客户端或数据报套接字。
+    """
+    return state == "LISTEN" or (state == "UNCONN" and protocol.startswith("udp"))
+
+
+class SocketInfo(BaseModel):
+    """套接字信息模型"""
+    protocol: str = Field(..., description="协议(tcp/tcp6/udp/udp6/unix)")
+    state: str = Field("", description="状态，例如 LISTEN、ESTABLISHED、UNCONN")
+    local_address: str = Field("", description="本地地址，Unix 套接字为路径")
+    local_port: int = Field(0, description="本地端口")
+    remote_address: str = Field("", description="远端地址")
+    remote_port: int = Field(0, description="远端端口")
+    inode: int = Field(0, description="套接字 inode")
+    uid: Optional[int] = Field(None, description="创建套接字的用户ID")
+    tx_queue: int = Field(0, description="发送队列字节数")
+    rx_queue: int = Field(0, description="接收队列字节数")
+    pids: List[int] = Field(default_factory=list, description="持有该套接字的进程ID")
+    names: List[str] = Field(default_factory=list, description="持有该套接字的进程名称")
+
+
+class SocketRecord(NamedTuple):
+    """套接字记录，需要时再转换为 pydantic 模型"""
+    protocol: str
+    state: str
+    local_address: str
+    local_port: int
+    remote_address: str
+    remote_port: int
+    inode: int
+    uid: Optional[int]
+    tx_queue: int
+    rx_queue: int
+
+
+def _decode_address(value: str, family: int) -> Tuple[str, int]:
+    """解码 /proc/net/tcp 中 "十六进制地址:十六进制端口" 形式的地址，地址按主机字节序的 32 位字存储"""
+    host, port = value.split(":")
+    raw = bytes.fromhex(host)
+    if sys.byteorder == "little":
+        raw = b"".join(raw[i:i + 4][::-1] for i in range(0, len(raw), 4))
+    return socket.inet_ntop(family, raw), int(port, 16)
+
+
+def _read_inet_sockets(protocol: str) -> List[SocketRecord]:
+    """解析 /proc/net/{tcp,tcp6,udp,udp6}，文件不存在（例如禁用了 IPv6）时返回空列表"""
+    family = socket.AF_INET6 if protocol.endswith("6") else socket.AF_INET
+    states = _TCP_STATES if protocol.startswith("tcp") else _UDP_STATES
+    try:
+        with open(_INET_FILES[protocol], "r") as f:
+            lines = f.readlines()[1:]
+    except FileNotFoundError:
+        return []
+    result = []
+    for line in lines:
+        v = line.split()
+        try:
+            local, local_port = _decode_address(v[1], family)
+            remote, remote_port = _decode_address(v[2], family)
+            tx_queue, rx_queue = v[4].split(":")
+            result.append(SocketRecord(
+                protocol=protocol,
+                state=states.get(v[3], v[3]),
+                local_address=local,
+                local_port=local_port,
+                remote_address=remote,
+                remote_port=remote_port,
+                inode=int(v[9]),
+                uid=int(v[7]),
+                tx_queue=int(tx_queue, 16),
+                rx_queue=int(rx_queue, 16),
+            ))
+        except (ValueError, IndexError) as e:
+            logger.debug(f"解析 {protocol} 套接字失败: {e}")
+    return result
+
+
+def _read_unix_sockets() -> List[SocketRecord]:
+    """解析 /proc/net/unix"""
+    try:
+        with open("/proc/net/unix", "r", errors="replace") as f:
+            lines = f.readlines()[1:]
+    except FileNotFoundError:
+        return []
+    result = []
+    for line in lines:
+        # 路径可能包含空格，最多拆分 7 次
+        v = line.rstrip("\n").split(None, 7)
+        try:
+            flags = int(v[3], 16)
+            state = "LISTEN" if flags & _SO_ACCEPTCON else _UNIX_STATES.get(v[5], v[5])
+            result.append(SocketRecord(
+                protocol="unix",
+                state=state,
+                local_address=v[7] if len(v) > 7 else "",
+                local_port=0,
+                remote_address="",
+                remote_port=0,
+                inode=int(v[6]),
+                uid=None,
+                tx_queue=0,
+                rx_queue=0,
+            ))
+        except (ValueError, IndexError) as e:
+            logger.debug(f"解析 unix 套接字失败: {e}")
+    return result
+
+
+def _scan_socket_inodes(wanted: Optional[Set[int]] = None) -> Dict[int, List[int]]:
+    """
+    遍历所有进程的 /proc/[pid]/fd，建立套接字 inode -> 进程ID 索引
+
+    Args:
+        wanted: 只记录这些 inode，为 None 时记录全部
+    """
+    index: Dict[int, List[int]] = {}
+    for pid in _iter_pids():
+        try:
+            with os.scandir(f"/proc/{pid}/fd") as it:
+                for entry in it:
+                    try:
+                        link = os.readlink(entry.path)
+                    except OSError:
+                        continue
+                    if not link.startswith("socket:["):
+                        continue
+                    inode = int(link[8:-1])
+                    if wanted is not None and inode not in wanted:
+                        continue
+                    pids = index.setdefault(inode, [])
+                    # 同一进程可能通过 dup() 持有多个 fd
+                    if not pids or pids[-1] != pid:
+                        pids.append(pid)
+        except OSError:
+            # 进程已退出或无权访问
+            continue
+    return index
+
+
+class SocketTable:
+    """
+    套接字表
+
+    一次性读取 /proc/net 中的套接字，并遍历一次所有进程的 /proc/[pid]/fd 建立 inode -> 进程索引，
+    之后的查询都只在内存中完成，不再为每个查询调用 ss 或 lsof。只包含调用者所在网络命名空间中的
+    套接字；其他用户进程的 fd 需要 root 权限才能关联，关联不到的套接字 pids 为空。
+
+    Example:
+        >>> table = SocketTable.collect()
+        >>> for s in table.listeners(port=8080):
+        ...     print(s.protocol, s.local_address, s.pids, s.names)
+        >>> table.state_counts()
+    """
+
+    def __init__(self, records: List[SocketRecord], owners: Dict[int, List[int]]):
+        """
+        初始化套接字表，通常通过 SocketTable.collect() 创建
+
+        Args:
+            records: 套接字记录
+            owners: 套接字 inode -> 进程ID 列表
+        """
+        self.records = records
+        self.owners = owners
+        self._names: Dict[int, str] = {}
+
+    @classmethod
+    def collect(
+        cls,
+        protocols: Optional[Iterable[str]] = None,
+        processes: bool = True,
+    ) -> "SocketTable":
+        """
+        采集套接字
+
+        Args:
+            protocols: 需要采集的协议，可选 tcp、tcp6、udp、udp6、unix，为 None 时采集全部
+            processes: 是否关联所属进程（需要遍历所有进程的 fd 目录）
+
+        Returns:
+            SocketTable: 套接字表
+
+        Raises:
+            ValueError: 不支持的协议
+        """
+        selected = PROTOCOLS if protocols is None else tuple(protocols)
+        unknown = set(selected) - set(PROTOCOLS)
+        if unknown:
+            raise ValueError(f"不支持的协议: {', '.join(sorted(unknown))}")
+        records: List[SocketRecord] = []
+        for protocol in selected:
+            records.extend(_read_unix_sockets() if protocol == "unix" else _read_inet_sockets(protocol))
+        owners: Dict[int, List[int]] = {}
+        if processes:
+            # inode 0 表示套接字已没有关联的文件（例如 TIME_WAIT）
+            owners = _scan_socket_inodes({r.inode for r in records if r.inode})
+        return cls(records, owners)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _name(self, pid: int) -> str:
+        name = self._names.get(pid)
+        if name is None:
+            try:
+                name = _read_pid_stat(pid).comm
+            except (OSError, ValueError, IndexError):
+                name = ""
+            self._names[pid] = name
+        return name
+
+    def _to_model(self, record: SocketRecord) -> SocketInfo:
+        pids = self.owners.get(record.inode, []) if record.inode else []
+        return SocketInfo(**record._asdict(), pids=pids, names=[self._name(pid) for pid in pids])
+
+    def sockets(
+        self,
+        protocol: Optional[str] = None,
+        state: Optional[str] = None,
+        pid: Optional[int] = None,
+    ) -> List[SocketInfo]:
+        """
+        按条件筛选套接字
+
+        Args:
+            protocol: 协议，为 None 时不限制
+            state: 状态，例如 ESTABLISHED，为 None 时不限制
+            pid: 持有套接字的进程ID，为 None 时不限制
+
+        Returns:
+            List[SocketInfo]: 套接字列表
+        """
+        result = []
+        for r in self.records:
+            if protocol is not None and r.protocol != protocol:
+                continue
+            if state is not None and r.state != state:
+                continue
+            if pid is not None and pid not in self.owners.get(r.inode, ()):
+                continue
+            result.append(self._to_model(r))
+        return result
+
+    def listeners(self, port: Optional[int] = None, protocol: Optional[str] = None) -> List[SocketInfo]:
+        """
+        查找监听中的套接字：TCP 的 LISTEN、UDP 的已绑定未连接套接字和 Unix 的 listen() 套接字
+
+        Args:
+            port: 本地端口，为 None 时返回所有监听套接字（指定端口时不包含 Unix 套接字）
+            protocol: 协议，为 None 时不限制
+
+        Returns:
+            List[SocketInfo]: 监听中的套接字，包含所属进程
+        """
+        result = []
+        for r in self.records:
+            if not _is_listener(r.protocol, r.state):
+                continue
+            if port is not None and (r.protocol == "unix" or r.local_port != port):
+                continue
+            if protocol is not None and r.protocol != protocol:
+                continue
+            result.append(self._to_model(r))
+        return result
+
+    def state_counts(self, protocol: Optional[str] = None) -> Dict[int, Dict[str, int]]:
+        """
+        统计每个进程各状态的套接字数
+
+        Args:
+            protocol: 协议，为 None 时统计全部协议
+
+        Returns:
+            Dict[int, Dict[str, int]]: 进程ID -> {状态: 数量}；共享同一套接字的进程各计一次
+        """
+        counts: Dict[int, Dict[str, int]] = {}
+        for r in self.records:
+            if protocol is not None and r.protocol != protocol:
+                continue
+            for pid in self.owners.get(r.inode, ()):
+                by_state = counts.setdefault(pid, {})
+                by_state[r.state] = by_state.get(r.state, 0) + 1
+        return counts
+
+
+def find_listeners(port: int, protocol: Optional[str] = None) -> List[SocketInfo]:
+    """
+    查找监听指定端口的套接字及其所属进程
+
+    只读取 TCP/UDP 套接字，fd 扫描时只记录监听该端口的套接字 inode。
+
+    Args:
+        port: 本地端口
+        protocol: 协议，可选 tcp、tcp6、udp、udp6，为 None 时不限制
+
+    Returns:
+        List[SocketInfo]: 监听中的套接字
+
+    Raises:
+        ValueError: 不支持的协议
+    """
+    if protocol is not None and protocol not in _INET_FILES:
+        raise ValueError(f"不支持的协议: {protocol}")
+    protocols = tuple(_INET_FILES) if protocol is None else (protocol,)
+    try:
+        records = [
+            r for p in protocols for r in _read_inet_sockets(p)
+            if r.local_port == port and _is_listener(r.protocol, r.state)
+        ]
+        owners = _scan_socket_inodes({r.inode for r in records if r.inode}) if records else {}
+        return SocketTable(records, owners).listeners(port)
+    except Exception as e:
+        logger.error(f"查找端口 {port} 的监听进程失败: {e}")
+        return []
+
+
+def get_socket_counts(protocol: Optional[str] = None) -> Dict[int, Dict[str, int]]:
+    """
+    统计每个进程各状态的套接字数
+
+    Args:
+        protocol: 协议，可选 tcp、tcp6、udp、udp6、unix，为 None 时统计全部协议
+
+    Returns:
+        Dict[int, Dict[str, int]]: 进程ID -> {状态: 数量}
+
+    Raises:
+        ValueError: 不支持的协议
+    """
+    if protocol is not None and protocol not in PROTOCOLS:
+        raise ValueError(f"不支持的协议: {protocol}")
+    try:
+        return SocketTable.collect(None if protocol is None else [protocol]).state_counts()
+    except Exception as e:
+        logger.error(f"统计套接字失败: {e}")
+        return {}
@@ -0,0 +1,336 @@
+"""
+进程守护模块 - 启动并守护子进程，通过 pidfd 在事件循环中接收退出通知并按退避策略重启
+"""
+
+import asyncio
+import os
+import shlex
+import signal
+import subprocess
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Union
+from pydantic import BaseModel, Field
+from loguru import logger
+
+
+# 子进程状态
+STARTING = "starting"
+RUNNING = "running"
+BACKOFF = "backoff"
+EXITED = "exited"
+STOPPED = "stopped"
+FATAL = "fatal"
+
+# 重启策略
+RESTART_ALWAYS = "always"
+RESTART_ON_FAILURE = "on-failure"
+RESTART_NEVER = "never"
+
+
+class ChildSpec(BaseModel):
+    """子进程配置模型"""
+    name: str = Field(..., description="子进程名称，在同一守护器中唯一")
+    cmd: Union[str, List[str]] = Field(..., description="命令，字符串会按 shell 语法拆分但不经过 shell 执行")
+    cwd: Optional[str] = Field(None, description="工作目录")
+    env: Dict[str, str] = Field(default_factory=dict, description="追加的环境变量")
+    restart: str = Field(RESTART_ALWAYS, description="重启策略(always/on-failure/never)")
+    backoff: float = Field(1.0, description="首次重启前的等待时间(秒)，连续失败时翻倍")
+    max_backoff: float = Field(60.0, description="重启等待时间上限(秒)")
+    min_uptime: float = Field(10.0, description="运行超过该时间(秒)后退出不计为连续失败，退避时间重置")
+    max_restarts: int = Field(10, description="restart_window 内允许的最大重启次数，超过后不再重启")
+    restart_window: float = Field(60.0, description="统计重启风暴的时间窗口(秒)")
+    stop_grace: float = Field(10.0, description="停止时 SIGTERM 后等待退出的时间(秒)，超时发送 SIGKILL")
+
+
+class ChildStats(BaseModel):
+    """子进程运行统计模型"""
+    name: str = Field(..., description="子进程名称")
+    state: str = Field(..., description="状态(starting/running/backoff/exited/stopped/fatal)")
+    pid: Optional[int] = Field(None, description="当前进程ID")
+    restarts: int = Field(0, description="累计重启次数")
+    uptime: Optional[float] = Field(None, description="本次运行时长(秒)")
+    started_at: Optional[float] = Field(None, description="本次启动时间(Unix 时间戳)")
+    last_exit_code: Optional[int] = Field(None, description="上次退出码，被信号终止时为负的信号值")
+    last_exit_at: Optional[float] = Field(None, description="上次退出时间(Unix 时间戳)")
+    next_start_in: Optional[float] = Field(None, description="距离下次重启的秒数")
+
+
+class _Child:
+    """单个子进程的运行状态"""
+    __slots__ = (
+        "spec", "proc", "pidfd", "state", "restarts", "failures", "started", "started_at",
+        "exit_code", "exited_at", "restart_times", "timer", "exited",
+    )
+
+    def __init__(self, spec: ChildSpec):
+        self.spec = spec
+        self.proc: Optional[subprocess.Popen] = None
+        self.pidfd: Optional[int] = None
+        self.state = STOPPED
+        self.restarts = 0
+        # 连续失败次数，决定退避时间
+        self.failures = 0
+        self.started = 0.0
+        self.started_at: Optional[float] = None
+        self.exit_code: Optional[int] = None
+        self.exited_at: Optional[float] = None
+        self.restart_times: Deque[float] = deque()
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.exited: Optional[asyncio.Future] = None
+
+
+class Supervisor:
+    """
+    进程守护器
+
+    所有子进程由同一个事件循环管理：每个子进程的 pidfd 注册到事件循环，退出时才被唤醒，
+    空闲时不占用 CPU，也不为每个子进程创建线程。内核不支持 pidfd 时改为监听 SIGCHLD。
+    子进程退出后按 ChildSpec 的策略以指数退避重启；restart_window 内重启超过
+    max_restarts 次时进入 fatal 状态，不再重启。
+
+    Example:
+        >>> supervisor = Supervisor([
+        ...     ChildSpec(name="worker", cmd="python worker.py"),
+        ... ])
+        >>> async with supervisor:
+        ...     await asyncio.sleep(60)
+        ...     print(supervisor.stats())
+    """
+
+    def __init__(self, specs: Iterable[ChildSpec] = ()):
+        """
+        初始化守护器
+
+        Args:
+            specs: 子进程配置
+
+        Raises:
+            ValueError: 子进程名称重复或重启策略无效
+        """
+        self._children: Dict[str, _Child] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running = False
+        self._use_pidfd = hasattr(os, "pidfd_open")
+        self._stopped: Optional[asyncio.Event] = None
+        for spec in specs:
+            self.add(spec)
+
+    async def __aenter__(self) -> "Supervisor":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    def add(self, spec: ChildSpec) -> None:
+        """
+        添加子进程，守护器已运行时立即启动
+
+        Args:
+            spec: 子进程配置
+
+        Raises:
+            ValueError: 名称重复或重启策略无效
+        """
+        if spec.name in self._children:
+            raise ValueError(f"子进程名称重复: {spec.name}")
+        if spec.restart not in (RESTART_ALWAYS, RESTART_ON_FAILURE, RESTART_NEVER):
+            raise ValueError(f"无效的重启策略: {spec.restart}")
+        child = self._children[spec.name] = _Child(spec)
+        if self._running:
+            self._spawn(child)
+
+    async def start(self) -> None:
+        """在当前事件循环中启动所有子进程"""
+        if self._running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        self._running = True
+        if not self._use_pidfd:
+            self._loop.add_signal_handler(signal.SIGCHLD, self._reap)
+        for child in self._children.values():
+            self._spawn(child)
+        logger.info(f"守护器已启动 {len(self._children)} 个子进程")
+
+    async def wait(self) -> None:
+        """等待守护器被 stop()"""
+        if self._stopped is not None:
+            await self._stopped.wait()
+
+    def _spawn(self, child: _Child) -> None:
+        """启动子进程并注册退出通知"""
+        spec = child.spec
+        child.timer = None
+        child.state = STARTING
+        args = shlex.split(spec.cmd) if isinstance(spec.cmd, str) else list(spec.cmd)
+        env = {**os.environ, **spec.env} if spec.env else None
+        try:
+            proc = subprocess.Popen(args, cwd=spec.cwd, env=env, start_new_session=True)
+        except OSError as e:
+            logger.error(f"启动子进程 {spec.name} 失败: {e}")
+            child.exit_code = None
+            child.exited_at = time.time()
+            self._schedule_restart(child)
+            return
+
+        child.proc = proc
+        child.started = time.monotonic()
+        child.started_at = time.time()
+        child.exited = self._loop.create_future()
+        child.state = RUNNING
+        if self._use_pidfd:
+            try:
+                # 子进程在被 wait() 回收前 PID 不会被复用，pidfd 一定指向该子进程
+                child.pidfd = os.pidfd_open(proc.pid)
+            except OSError:
+                # 内核不支持 pidfd，此后所有子进程改用 SIGCHLD
+                self._use_pidfd = False
+                self._loop.add_signal_handler(signal.SIGCHLD, self._reap)
+            if child.pidfd is not None:
+                self._loop.add_reader(child.pidfd, self._on_exit, child)
+        logger.info(f"子进程 {spec.name} 已启动 (PID: {proc.pid})")
+        if child.pidfd is None:
+            # 启动前可能已收到 SIGCHLD
+            self._reap()
+
+    def _reap(self) -> None:
+        """SIGCHLD 处理：检查所有没有 pidfd 的子进程"""
+        for child in self._children.values():
+            if child.proc is not None and child.pidfd is None and child.proc.poll() is not None:
+                self._on_exit(child)
+
+    def _on_exit(self, child: _Child) -> None:
+        """子进程退出：回收进程、更新统计并决定是否重启"""
+        if child.pidfd is not None:
+            self._loop.remove_reader(child.pidfd)
+            os.close(child.pidfd)
+            child.pidfd = None
+        proc = child.proc
+        child.proc = None
+        # pidfd 可读时进程已退出，wait() 只是回收，不会阻塞
+        child.exit_code = proc.wait()
+        child.exited_at = time.time()
+        uptime = time.monotonic() - child.started
+        if child.exited is not None and not child.exited.done():
+            child.exited.set_result(child.exit_code)
+
+        spec = child.spec
+        if child.state == STOPPED or not self._running:
+            child.state = STOPPED
+            return
+        logger.warning(f"子进程 {spec.name} 已退出 (PID: {proc.pid}, 退出码: {child.exit_code}, 运行 {uptime:.1f} 秒)")
+        if spec.restart == RESTART_NEVER or (spec.restart == RESTART_ON_FAILURE and child.exit_code == 0):
+            child.state = EXITED
+            return
+        if uptime >= spec.min_uptime:
+            child.failures = 0
+        self._schedule_restart(child)
+
+    def _schedule_restart(self, child: _Child) -> None:
+        """按退避策略安排重启，重启过于频繁时放弃"""
+        spec = child.spec
+        now = time.monotonic()
+        times = child.restart_times
+        while times and now - times[0] > spec.restart_window:
+            times.popleft()
+        if len(times) >= spec.max_restarts:
+            child.state = FATAL
+            logger.error(f"子进程 {spec.name} 在 {spec.restart_window:.0f} 秒内重启 {len(times)} 次，停止重启")
+            return
+        delay = min(spec.backoff * (2 ** child.failures), spec.max_backoff)
+        child.failures += 1
+        times.append(now)
+        child.state = BACKOFF
+        child.timer = self._loop.call_later(delay, self._restart, child)
+
+    def _restart(self, child: _Child) -> None:
+        child.restarts += 1
+        self._spawn(child)
+
+    async def _stop_child(self, child: _Child, grace: Optional[float]) -> None:
+        """停止单个子进程：SIGTERM，超时后 SIGKILL"""
+        if child.timer is not None:
+            child.timer.cancel()
+            child.timer = None
+        proc = child.proc
+        child.state = STOPPED
+        if proc is None:
+            return
+        grace = child.spec.stop_grace if grace is None else grace
+        for sig, timeout in ((signal.SIGTERM, grace), (signal.SIGKILL, None)):
+            try:
+                if child.pidfd is not None:
+                    signal.pidfd_send_signal(child.pidfd, sig)
+                else:
+                    proc.send_signal(sig)
+            except ProcessLookupError:
+                pass
+            try:
+                await asyncio.wait_for(asyncio.shield(child.exited), timeout)
+                return
+            except asyncio.TimeoutError:
+                logger.warning(f"子进程 {child.spec.name} 未在 {grace} 秒内退出，强制终止")
+
+    async def stop(self, grace: Optional[float] = None) -> None:
+        """
+        停止所有子进程并停止守护
+
+        Args:
+            grace: SIGTERM 后等待退出的时间(秒)，为 None 时使用各子进程的 stop_grace
+        """
+        if not self._running:
+            return
+        await asyncio.gather(*(self._stop_child(child, grace) for child in self._children.values()))
+        self._running = False
+        if not self._use_pidfd:
+            self._loop.remove_signal_handler(signal.SIGCHLD)
+        if self._stopped is not None:
+            self._stopped.set()
+        logger.info("守护器已停止")
+
+    async def restart(self, name: str) -> None:
+        """
+        手动重启子进程，重置其退避和重启风暴计数
+
+        Args:
+            name: 子进程名称
+
+        Raises:
+            KeyError: 子进程不存在
+        """
+        child = self._children[name]
+        await self._stop_child(child, None)
+        child.failures = 0
+        child.restart_times.clear()
+        if self._running:
+            child.restarts += 1
+            self._spawn(child)
+
+    def stats(self) -> List[ChildStats]:
+        """
+        获取所有子进程的运行统计
+
+        Returns:
+            List[ChildStats]: 子进程统计列表
+        """
+        now = time.monotonic()
+        result = []
+        for child in self._children.values():
+            proc = child.proc
+            next_start = None
+            if child.timer is not None:
+                next_start = max(child.timer.when() - self._loop.time(), 0.0)
+            result.append(ChildStats(
+                name=child.spec.name,
+                state=child.state,
+                pid=proc.pid if proc is not None else None,
+                restarts=child.restarts,
+                uptime=now - child.started if proc is not None else None,
+                started_at=child.started_at,
+                last_exit_code=child.exit_code,
+                last_exit_at=child.exited_at,
+                next_start_in=next_start,
+            ))
+        return result
@@ -2,4 +2,9 @@
 网页工具模块 - 提供网页抓取、API 客户端等功能
 """
 
-from .scraper import fetch_page, extract_text
+from .cache import ResponseCache, get_cache
+from .client import HttpClient, get_client, close_client
+from .parser import (
+    HtmlParser, get_parser, register_parser, available_parsers, get_parse_executor, close_parse_executor
+)
+from .scraper import fetch_page, fetch_page_async, fetch_many, fetch_many_async, FetchError, extract_text
@@ -0,0 +1,464 @@
+"""
+HTTP 响应缓存模块 - 按 Cache-Control 缓存解析后的网页，并用 ETag/Last-Modified 条件请求重新验证
+"""
+
+try:
+    import httpx
+except ImportError:
+    raise ImportError(
+        "To use the web module, you need to install the wicspy[web] extra.\n"
+    )
+import email.utils
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from loguru import logger
+
+from wicspy.config import get_config
+
+
+class CacheEntry:
+    """缓存项：解析后的网页内容以及验证和新鲜度信息"""
+    __slots__ = ("url", "vary", "etag", "last_modified", "stored_at", "expires_at", "page", "size")
+
+    def __init__(
+        self,
+        url: str,
+        vary: Dict[str, str],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        stored_at: float,
+        expires_at: float,
+        page: Any,
+        size: int,
+    ):
+        self.url = url
+        # Vary 中列出的请求头 -> 存储时请求中的值
+        self.vary = vary
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.page = page
+        self.size = size
+
+    def fresh(self, now: Optional[float] = None) -> bool:
+        """是否仍在新鲜期内，新鲜的缓存无需请求服务器"""
+        return (time.time() if now is None else now) < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """条件请求头"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @property
+    def key(self) -> str:
+        """缓存键：URL 加上 Vary 列出的请求头的值"""
+        return _cache_key(self.url, self.vary)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "vary": self.vary,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "stored_at": self.stored_at,
+            "expires_at": self.expires_at,
+            # 只保存 HTML，提取字段在读取后按需重新解析
+            "page": self.page.model_dump(exclude={"title", "text", "links", "metadata"}),
+        }
+
+
+def _cache_key(url: str, vary: Dict[str, str]) -> str:
+    """由 URL 和 Vary 请求头的值组成缓存键，没有 Vary 时即为 URL"""
+    if not vary:
+        return url
+    return url + "\n" + "\n".join(f"{name}: {value}" for name, value in sorted(vary.items()))
+
+
+def _parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """解析 Cache-Control 头，指令名统一为小写"""
+    directives: Dict[str, Optional[str]] = {}
+    for part in value.split(","):
+        name, sep, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if sep else None
+    return directives
+
+
+def _freshness_lifetime(headers: "httpx.Headers", now: float) -> Optional[float]:
+    """
+    根据响应头计算剩余新鲜时间(秒)
+
+    Returns:
+        Optional[float]: 剩余新鲜时间，响应不可存储时返回 None
+    """
+    cc = _parse_cache_control(headers.get("cache-control", ""))
+    if "no-store" in cc:
+        return None
+    if "no-cache" in cc:
+        return 0.0
+    age = 0.0
+    try:
+        age = float(headers.get("age", 0))
+    except ValueError:
+        pass
+    # 本缓存是私有缓存，s-maxage 只适用于共享缓存
+    if cc.get("max-age") is not None:
+        try:
+            return max(float(cc["max-age"]) - age, 0.0)
+        except ValueError:
+            return 0.0
+    expires = headers.get("expires")
+    if expires:
+        try:
+            expires_at = email.utils.parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            # 无效的 Expires 视为已过期
+            return 0.0
+        date = headers.get("date")
+        try:
+            base = email.utils.parsedate_to_datetime(date).timestamp() if date else now
+        except (TypeError, ValueError):
+            base = now
+        return max(expires_at - base - age, 0.0)
+    return 0.0
+
+
+def _page_size(page: Any) -> int:
+    """
+    估算网页内容占用的字节数（近似值），不触发解析
+
+    HTML 按 UTF-8 字节数计算，按需提取的字段（文本、链接、元数据）尚未提取时无法得知大小，
+    按与 HTML 相同的大小预留；Python 对象自身的开销不计入。
+    """
+    return 2 * len(page.html.encode("utf-8"))
+
+
+class ResponseCache:
+    """
+    HTTP 响应缓存
+
+    缓存的是解析后的 PageContent：新鲜期内直接返回，过期后带 If-None-Match/If-Modified-Since
+    重新请求，服务器返回 304 时不再下载和解析正文。新鲜度按 Cache-Control（max-age、no-cache、
+    no-store）、Expires 和 Age 计算；没有新鲜期也没有 ETag/Last-Modified 的响应不缓存。
+
+    缓存按 URL 加上 Vary 列出的请求头的值区分变体，例如不同 Accept-Language 的请求各自缓存、
+    互不覆盖；Vary 的字段名取该 URL 最近一次响应的值。Vary: * 的响应不缓存。
+
+    内存缓存按估算的总字节数（见 max_bytes）做 LRU 淘汰；指定 directory 时同时写入磁盘（每个变体一个 JSON 文件，
+    每个带 Vary 的 URL 另有一个记录字段名的 .vary 文件），磁盘缓存同样按总字节数 LRU 淘汰，
+    进程重启后仍可使用。
+
+    Example:
+        >>> cache = ResponseCache(directory="~/.cache/wicspy/http")
+        >>> page = fetch_page("https://example.com", cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        directory: Optional[str] = None,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        """
+        初始化响应缓存
+
+        Args:
+            max_bytes: 内存缓存的最大字节数，为近似限制：每个网页按 HTML 的 UTF-8 字节数的两倍
+                估算（为按需提取的字段预留），不是实际占用的内存
+            directory: 磁盘缓存目录，为 None 时只使用内存
+            max_disk_bytes: 磁盘缓存的最大字节数
+        """
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = os.path.expanduser(directory) if directory else None
+        self._lock = threading.Lock()
+        # 缓存键 -> 缓存项，按最近使用时间排序
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        # URL -> Vary 字段名；只保留内存中仍有变体的 URL，_variants 记录每个 URL 的变体数
+        self._vary: Dict[str, Tuple[str, ...]] = {}
+        self._variants: Dict[str, int] = {}
+        # 文件名 -> 文件大小，按最近使用时间排序
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            self._load_disk_index()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _load_disk_index(self) -> None:
+        """扫描磁盘缓存目录，按修改时间重建 LRU 顺序"""
+        files = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    st = entry.stat()
+                    files.append((st.st_mtime, entry.name, st.st_size))
+        for _, name, size in sorted(files):
+            self._disk[name] = size
+            self._disk_bytes += size
+
+    @staticmethod
+    def _filename(key: str, suffix: str = ".json") -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest() + suffix
+
+    def _remember(self, entry: CacheEntry) -> None:
+        """放入内存 LRU 并淘汰超出容量的项，调用方需持有锁"""
+        self._forget(entry.key)
+        if entry.size > self.max_bytes:
+            return
+        self._memory[entry.key] = entry
+        self._memory_bytes += entry.size
+        self._variants[entry.url] = self._variants.get(entry.url, 0) + 1
+        self._vary.setdefault(entry.url, tuple(sorted(entry.vary)))
+        while self._memory_bytes > self.max_bytes:
+            self._forget(next(iter(self._memory)))
+
+    def _forget(self, key: str) -> None:
+        """从内存中移除缓存项，调用方需持有锁"""
+        entry = self._memory.pop(key, None)
+        if entry is None:
+            return
+        self._memory_bytes -= entry.size
+        count = self._variants.pop(entry.url) - 1
+        if count:
+            self._variants[entry.url] = count
+        else:
+            self._vary.pop(entry.url, None)
+
+    def _vary_names(self, url: str) -> Tuple[str, ...]:
+        """获取 URL 最近一次响应的 Vary 字段名，调用方需持有锁"""
+        names = self._vary.get(url)
+        if names is not None or not self.directory:
+            return names or ()
+        try:
+            with open(os.path.join(self.directory, self._filename(url, ".vary")), "rb") as f:
+                return tuple(json.load(f))
+        except FileNotFoundError:
+            return ()
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"读取 Vary 记录失败: {url}, 异常: {e}")
+            return ()
+
+    def _write_vary(self, url: str, names: Iterable[str]) -> None:
+        """保存 URL 的 Vary 字段名，没有 Vary 时删除记录，调用方需持有锁"""
+        path = os.path.join(self.directory, self._filename(url, ".vary"))
+        names = list(names)
+        try:
+            if names:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(names, f)
+            else:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"写入 Vary 记录失败: {path}, 异常: {e}")
+
+    def _read_disk(self, key: str, page_type: Any) -> Optional[CacheEntry]:
+        """从磁盘读取缓存项，调用方需持有锁"""
+        name = self._filename(key)
+        if name not in self._disk:
+            return None
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, "rb") as f:
+                data = json.load(f)
+            entry = CacheEntry(
+                url=data["url"],
+                vary=data["vary"],
+                etag=data["etag"],
+                last_modified=data["last_modified"],
+                stored_at=data["stored_at"],
+                expires_at=data["expires_at"],
+                page=page_type(**data["page"]),
+                size=0,
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"读取磁盘缓存失败: {path}, 异常: {e}")
+            self._drop_disk(name)
+            return None
+        entry.size = _page_size(entry.page)
+        self._disk.move_to_end(name)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def _write_disk(self, entry: CacheEntry) -> None:
+        """写入磁盘并淘汰超出容量的文件，调用方需持有锁"""
+        name = self._filename(entry.key)
+        path = os.path.join(self.directory, name)
+        data = json.dumps(entry.to_json(), ensure_ascii=False).encode("utf-8")
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"写入磁盘缓存失败: {path}, 异常: {e}")
+            return
+        self._disk_bytes += len(data) - self._disk.pop(name, 0)
+        self._disk[name] = len(data)
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            self._drop_disk(next(iter(self._disk)))
+
+    def _drop_disk(self, name: str) -> None:
+        self._disk_bytes -= self._disk.pop(name, 0)
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
+
+    def lookup(self, url: str, request_headers: Mapping[str, str], page_type: Any) -> Optional[CacheEntry]:
+        """
+        查找缓存项（可能已过期，过期项用于条件请求）
+
+        Args:
+            url: 请求 URL
+            request_headers: 实际发送的请求头，按 Vary 选择变体
+            page_type: 反序列化磁盘缓存时使用的网页内容类型
+
+        Returns:
+            Optional[CacheEntry]: 缓存项，未命中时返回 None
+        """
+        headers = httpx.Headers(request_headers)
+        with self._lock:
+            vary = {name: headers.get(name, "") for name in self._vary_names(url)}
+            key = _cache_key(url, vary)
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            elif self.directory:
+                entry = self._read_disk(key, page_type)
+                if entry is not None:
+                    self._remember(entry)
+        return entry
+
+    def store(
+        self,
+        url: str,
+        request_headers: Mapping[str, str],
+        response: "httpx.Response",
+        page: Any,
+    ) -> Optional[CacheEntry]:
+        """
+        按响应头决定是否缓存网页内容
+
+        Args:
+            url: 请求 URL
+            request_headers: 实际发送的请求头
+            response: 响应对象
+            page: 解析后的网页内容
+
+        Returns:
+            Optional[CacheEntry]: 缓存项，响应不可缓存时返回 None
+        """
+        now = time.time()
+        headers = response.headers
+        lifetime = _freshness_lifetime(headers, now)
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        vary_names = sorted({v.strip().lower() for v in headers.get("vary", "").split(",") if v.strip()})
+        if lifetime is None or "*" in vary_names or (lifetime <= 0 and not etag and not last_modified):
+            return None
+        request = httpx.Headers(request_headers)
+        entry = CacheEntry(
+            url=url,
+            vary={name: request.get(name, "") for name in vary_names},
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=now,
+            expires_at=now + lifetime,
+            page=page,
+            size=_page_size(page),
+        )
+        with self._lock:
+            names = tuple(vary_names)
+            if self.directory and self._vary_names(url) != names:
+                self._write_vary(url, names)
+            self._remember(entry)
+            if url in self._variants:
+                # Vary 字段名以最近一次响应为准
+                self._vary[url] = names
+            if self.directory:
+                self._write_disk(entry)
+        return entry
+
+    def revalidated(self, entry: CacheEntry, response: "httpx.Response") -> None:
+        """
+        服务器返回 304 后更新缓存项的新鲜期和验证信息
+
+        Args:
+            entry: 缓存项
+            response: 304 响应
+        """
+        now = time.time()
+        headers = response.headers
+        lifetime = _freshness_lifetime(headers, now)
+        with self._lock:
+            if lifetime is None:
+                # 304 中出现 no-store，不再保留缓存；该项可能已被淘汰或被并发请求移除
+                if self._memory.get(entry.key) is entry:
+                    self._forget(entry.key)
+                if self.directory:
+                    self._drop_disk(self._filename(entry.key))
+                return
+            entry.expires_at = now + lifetime
+            entry.etag = headers.get("etag", entry.etag)
+            entry.last_modified = headers.get("last-modified", entry.last_modified)
+            if self.directory:
+                self._write_disk(entry)
+
+    def clear(self) -> None:
+        """清空内存和磁盘缓存"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._vary.clear()
+            self._variants.clear()
+            if self.directory:
+                for name in list(self._disk):
+                    self._drop_disk(name)
+                with os.scandir(self.directory) as it:
+                    for item in it:
+                        if item.name.endswith(".vary"):
+                            try:
+                                os.remove(item.path)
+                            except OSError:
+                                pass
+
+
+_default_cache: Optional[ResponseCache] = None
+
+
+def get_cache() -> ResponseCache:
+    """
+    获取默认响应缓存实例
+
+    参数从配置中读取：http_cache_max_bytes、http_cache_dir、http_cache_max_disk_bytes。
+
+    Returns:
+        ResponseCache: 响应缓存实例
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResponseCache(
+            max_bytes=get_config("http_cache_max_bytes", 64 * 1024 * 1024),
+            directory=get_config("http_cache_dir"),
+            max_disk_bytes=get_config("http_cache_max_disk_bytes", 512 * 1024 * 1024),
+        )
+    return _default_cache
@@ -0,0 +1,274 @@
+"""
+HTTP 客户端模块 - 提供长期复用连接的同步/异步 HTTP 客户端
+"""
+
+try:
+    import httpx
+except ImportError:
+    raise ImportError(
+        "To use the web module, you need to install the wicspy[web] extra.\n"
+    )
+import asyncio
+import threading
+from typing import AsyncGenerator, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+from loguru import logger
+
+from wicspy.config import get_config
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+
+async def _close_with_loop(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+    """
+    在事件循环关闭前关闭异步客户端
+
+    asyncio.run() 等在关闭事件循环前调用 loop.shutdown_asyncgens()，对循环中所有未结束的
+    异步生成器调用 aclose()；启动后停在 yield 处的本生成器借此在 finally 中关闭客户端。
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+_AsyncEntry = Tuple[httpx.AsyncClient, Dict[str, asyncio.Semaphore], AsyncGenerator[None, None]]
+
+
+class HttpClient:
+    """
+    长期复用连接的 HTTP 客户端
+
+    同步和异步请求分别使用一个懒创建的 httpx.Client / httpx.AsyncClient，连接在请求之间
+    保持 keep-alive 并复用，同一主机的大量请求不必重复 TCP 和 TLS 握手。httpx 只限制
+    连接池的总连接数，每个主机的并发请求数由客户端自己的信号量限制。
+
+    httpx.AsyncClient 的连接绑定创建它的事件循环，因此每个事件循环各有一个异步客户端，
+    多个线程中的事件循环可以同时使用同一个 HttpClient。异步连接池只在同一个事件循环内复用：
+    fetch_many() 和 asyncio.run() 每次都使用新的事件循环，不会复用上一次调用的连接。
+    异步客户端在事件循环调用 shutdown_asyncgens()（asyncio.run() 结束时会调用）或
+    aclose_async() 时关闭，fetch_many() 结束时也会关闭它的异步客户端；自行管理事件循环且
+    不调用这两者时，循环关闭后其中的客户端只能在下次创建异步客户端时丢弃，连接由垃圾回收释放。
+
+    Example:
+        >>> with HttpClient(max_per_host=4) as client:
+        ...     page = fetch_page("https://example.com", client=client)
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        max_per_host: int = 10,
+        http2: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        初始化 HTTP 客户端
+
+        Args:
+            timeout: 请求超时时间(秒)，为 None 时从配置中读取 timeout
+            max_connections: 连接池最大连接数
+            max_keepalive_connections: 最多保持的空闲连接数
+            keepalive_expiry: 空闲连接的保持时间(秒)
+            max_per_host: 每个主机的最大并发请求数
+            http2: 是否启用 HTTP/2（需要安装 h2，即 httpx[http2]）
+            headers: 默认请求头，为 None 时使用 DEFAULT_HEADERS
+
+        Raises:
+            ImportError: 启用 HTTP/2 但未安装 h2
+        """
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError("To use HTTP/2, you need to install httpx[http2].\n")
+        self.timeout = get_config("timeout", 30) if timeout is None else timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_per_host = max_per_host
+        self.http2 = http2
+        self.headers = dict(DEFAULT_HEADERS if headers is None else headers)
+        self._lock = threading.Lock()
+        self._client: Optional[httpx.Client] = None
+        # 事件循环 -> (异步客户端, 主机 -> 信号量, 随循环关闭客户端的异步生成器)
+        self._async_clients: Dict[asyncio.AbstractEventLoop, _AsyncEntry] = {}
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._closed = False
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "HttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    @property
+    def closed(self) -> bool:
+        """客户端是否已关闭"""
+        return self._closed
+
+    def _options(self) -> Dict[str, object]:
+        return {
+            "timeout": self.timeout,
+            "limits": self.limits,
+            "http2": self.http2,
+            "headers": self.headers,
+            "follow_redirects": True,
+        }
+
+    @property
+    def client(self) -> httpx.Client:
+        """底层的同步 httpx 客户端，首次访问时创建"""
+        if self._client is None:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("HttpClient 已关闭")
+                if self._client is None:
+                    self._client = httpx.Client(**self._options())
+        return self._client
+
+    def _async_entry(self) -> _AsyncEntry:
+        """当前事件循环的异步客户端和主机信号量，首次访问时创建"""
+        loop = asyncio.get_running_loop()
+        entry = self._async_clients.get(loop)
+        if entry is None:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("HttpClient 已关闭")
+                self._drop_closed_loops()
+                client = httpx.AsyncClient(**self._options())
+                closer = _close_with_loop(client)
+                # 首次迭代时事件循环登记该生成器，运行到 yield 处暂停
+                try:
+                    closer.asend(None).send(None)
+                except StopIteration:
+                    pass
+                entry = self._async_clients[loop] = (client, {}, closer)
+        return entry
+
+    def _drop_closed_loops(self) -> None:
+        """丢弃已关闭的事件循环中的异步客户端，调用方需持有锁"""
+        for loop in [loop for loop in self._async_clients if loop.is_closed()]:
+            # 事件循环已关闭，无法再 await 关闭其中的连接，只能丢弃
+            logger.debug("事件循环已关闭，丢弃其中未关闭的异步 HTTP 客户端")
+            del self._async_clients[loop]
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """当前事件循环的异步 httpx 客户端，首次在某个事件循环中访问时创建"""
+        return self._async_entry()[0]
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            with self._lock:
+                slot = self._host_slots.setdefault(host, threading.BoundedSemaphore(self.max_per_host))
+        return slot
+
+    def _async_host_slot(self, url: str) -> asyncio.Semaphore:
+        slots = self._async_entry()[1]
+        host = urlsplit(url).netloc
+        slot = slots.get(host)
+        if slot is None:
+            slot = slots[host] = asyncio.Semaphore(self.max_per_host)
+        return slot
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        同步发送 GET 请求
+
+        Args:
+            url: 请求 URL
+            headers: 额外的请求头，与默认请求头合并
+
+        Returns:
+            httpx.Response: 响应对象
+        """
+        client = self.client
+        with self._host_slot(url):
+            return client.get(url, headers=headers)
+
+    async def aget(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        异步发送 GET 请求
+
+        Args:
+            url: 请求 URL
+            headers: 额外的请求头，与默认请求头合并
+
+        Returns:
+            httpx.Response: 响应对象
+        """
+        client = self.async_client
+        async with self._async_host_slot(url):
+            return await client.get(url, headers=headers)
+
+    def close(self) -> None:
+        """关闭同步客户端；异步客户端需要在各自的事件循环中调用 aclose() 关闭"""
+        with self._lock:
+            self._closed = True
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+            self._drop_closed_loops()
+
+    async def aclose_async(self) -> None:
+        """只关闭当前事件循环中的异步客户端，客户端仍可继续使用（下次使用时重新创建）"""
+        with self._lock:
+            entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[2].aclose()
+
+    async def aclose(self) -> None:
+        """关闭同步和异步客户端"""
+        self.close()
+        await self.aclose_async()
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """
+    获取默认 HTTP 客户端实例，已关闭时重新创建
+
+    连接池参数从配置中读取：http_max_connections、http_max_keepalive、http_keepalive_expiry、
+    http_max_per_host、http2。
+
+    Returns:
+        HttpClient: HTTP 客户端实例
+    """
+    global _default_client
+    if _default_client is None or _default_client.closed:
+        with _default_client_lock:
+            if _default_client is None or _default_client.closed:
+                _default_client = HttpClient(
+                    max_connections=get_config("http_max_connections", 100),
+                    max_keepalive_connections=get_config("http_max_keepalive", 20),
+                    keepalive_expiry=get_config("http_keepalive_expiry", 30.0),
+                    max_per_host=get_config("http_max_per_host", 10),
+                    http2=get_config("http2", False),
+                )
+    return _default_client
+
+
+def close_client() -> None:
+    """关闭默认 HTTP 客户端的同步连接池，下次使用时会重新创建"""
+    if _default_client is not None:
+        _default_client.close()
@@ -0,0 +1,313 @@
+"""
+HTML 解析后端模块 - 提供可替换的 HTML 解析后端，从同一棵解析树中按需提取标题、链接、元数据和文本
+"""
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+except ImportError:
+    raise ImportError(
+        "To use the web module, you need to install the wicspy[web] extra.\n"
+    )
+import os
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from wicspy.config import get_config
+
+
+# 可提取的字段
+PAGE_FIELDS = frozenset({"title", "links", "metadata", "text"})
+
+# 只需要这些字段时可以只解析对应的标签
+_FIELD_TAGS = {
+    "title": "title",
+    "links": "a",
+    "metadata": "meta",
+}
+
+# 只需要少量标签、提取代价低的字段；text 需要完整解析并遍历整个文档
+TAG_FIELDS = frozenset(_FIELD_TAGS)
+
+
+class HtmlParser(ABC):
+    """
+    HTML 解析后端基类
+
+    parse() 构建解析树，其余方法从解析树中提取字段；同一棵树可以被多次提取。
+    解析器实例不保存状态，可以在线程间共享。
+    """
+
+    name = ""
+
+    @abstractmethod
+    def parse(self, html: str, fields: Optional[FrozenSet[str]] = None) -> Any:
+        """
+        解析 HTML
+
+        Args:
+            html: HTML 内容
+            fields: 需要提取的字段，为 None 时解析完整文档；后端可以据此缩小解析范围
+
+        Returns:
+            Any: 解析树
+        """
+
+    @abstractmethod
+    def title(self, tree: Any) -> str:
+        """提取 <title> 的文本，没有标题时返回空字符串"""
+
+    @abstractmethod
+    def links(self, tree: Any) -> List[str]:
+        """提取所有带 href 的 <a> 的链接地址"""
+
+    @abstractmethod
+    def metadata(self, tree: Any) -> Dict[str, str]:
+        """提取 <meta> 的 name/property -> content"""
+
+    @abstractmethod
+    def text(self, tree: Any) -> str:
+        """提取不含脚本和样式的可见文本，不修改解析树"""
+
+
+class SoupParser(HtmlParser):
+    """
+    基于 BeautifulSoup 的解析后端
+
+    features 为 "html.parser"（标准库，无额外依赖）或 "lxml"（需要安装 lxml，速度快数倍）。
+    不需要 text 时使用 SoupStrainer 只构建 title/a/meta 标签，解析树小得多。
+    """
+
+    def __init__(self, features: str = "html.parser"):
+        """
+        初始化 BeautifulSoup 解析后端
+
+        Args:
+            features: BeautifulSoup 的解析器名称
+
+        Raises:
+            ImportError: 使用 lxml 但未安装
+        """
+        if features == "lxml":
+            try:
+                import lxml  # noqa: F401
+            except ImportError:
+                raise ImportError("To use the lxml parser, you need to install lxml.\n")
+        self.name = features
+        self.features = features
+
+    def parse(self, html: str, fields: Optional[FrozenSet[str]] = None) -> Any:
+        parse_only = None
+        if fields is not None and "text" not in fields:
+            parse_only = SoupStrainer([_FIELD_TAGS[field] for field in fields])
+        return BeautifulSoup(html, self.features, parse_only=parse_only)
+
+    def title(self, tree: Any) -> str:
+        return tree.title.text.strip() if tree.title else ""
+
+    def links(self, tree: Any) -> List[str]:
+        return [a.get("href", "") for a in tree.find_all("a", href=True)]
+
+    def metadata(self, tree: Any) -> Dict[str, str]:
+        return {
+            meta.get("name", meta.get("property", "unknown")): meta.get("content", "")
+            for meta in tree.find_all("meta")
+            if meta.get("name") or meta.get("property")
+        }
+
+    def text(self, tree: Any) -> str:
+        return tree.get_text(separator="\n", strip=True)
+
+
+class SelectolaxParser(HtmlParser):
+    """
+    基于 selectolax（lexbor 引擎）的解析后端
+
+    解析速度通常是 html.parser 的数十倍；总是解析完整文档，不使用 fields 缩小范围。
+    """
+
+    name = "selectolax"
+
+    def __init__(self):
+        """
+        初始化 selectolax 解析后端
+
+        Raises:
+            ImportError: 未安装 selectolax
+        """
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError:
+            raise ImportError("To use the selectolax parser, you need to install selectolax.\n")
+        self._parser = LexborHTMLParser
+
+    def parse(self, html: str, fields: Optional[FrozenSet[str]] = None) -> Any:
+        return self._parser(html)
+
+    def title(self, tree: Any) -> str:
+        node = tree.css_first("title")
+        return node.text(strip=True) if node is not None else ""
+
+    def links(self, tree: Any) -> List[str]:
+        return [node.attributes.get("href") or "" for node in tree.css("a[href]")]
+
+    def metadata(self, tree: Any) -> Dict[str, str]:
+        metadata = {}
+        for node in tree.css("meta"):
+            attrs = node.attributes
+            key = attrs.get("name") or attrs.get("property")
+            if key:
+                metadata[key] = attrs.get("content") or ""
+        return metadata
+
+    def text(self, tree: Any) -> str:
+        # 与 BeautifulSoup 一致，不包含脚本和样式；strip_tags 会修改解析树，在副本上操作，
+        # 避免同一棵树之后提取 links/metadata 时漏掉 <template>/<noscript> 中的内容
+        tree = tree.clone()
+        tree.strip_tags(["script", "style", "noscript", "template"])
+        return tree.text(separator="\n", strip=True)
+
+
+# 后端名称 -> 创建函数，按 "auto" 的优先顺序排列
+_PARSER_FACTORIES: Dict[str, Callable[[], HtmlParser]] = {
+    "selectolax": SelectolaxParser,
+    "lxml": lambda: SoupParser("lxml"),
+    "html.parser": lambda: SoupParser("html.parser"),
+}
+_parsers: Dict[str, HtmlParser] = {}
+
+
+def register_parser(name: str, factory: Callable[[], HtmlParser]) -> None:
+    """
+    注册自定义解析后端
+
+    Args:
+        name: 后端名称
+        factory: 创建解析后端的函数，依赖缺失时应抛出 ImportError
+    """
+    _PARSER_FACTORIES[name] = factory
+    _parsers.pop(name, None)
+    _parsers.pop("auto", None)
+
+
+def get_parser(name: Optional[str] = None) -> HtmlParser:
+    """
+    获取解析后端实例
+
+    Args:
+        name: 后端名称(html.parser/lxml/selectolax/auto 或自定义名称)，为 None 时从配置中读取
+            html_parser（默认 html.parser）；auto 选择已安装的最快后端
+
+    Returns:
+        HtmlParser: 解析后端实例
+
+    Raises:
+        ValueError: 未知的后端名称
+        ImportError: 后端依赖未安装
+    """
+    if name is None:
+        name = get_config("html_parser", "html.parser")
+    parser = _parsers.get(name)
+    if parser is not None:
+        return parser
+    if name == "auto":
+        for candidate in _PARSER_FACTORIES:
+            try:
+                parser = get_parser(candidate)
+            except ImportError:
+                continue
+            _parsers["auto"] = parser
+            return parser
+    factory = _PARSER_FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"未知的 HTML 解析后端: {name}")
+    parser = factory()
+    if not parser.name:
+        parser.name = name
+    _parsers[name] = parser
+    return parser
+
+
+def available_parsers() -> List[str]:
+    """
+    获取已安装依赖、可以使用的解析后端名称
+
+    Returns:
+        List[str]: 后端名称列表
+    """
+    names = []
+    for name in _PARSER_FACTORIES:
+        try:
+            get_parser(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def extract_fields(html: str, parser: str, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    解析 HTML 并提取字段，供工作线程或工作进程调用
+
+    只提取请求的字段，解析后端据此缩小解析范围，例如不需要 text 时只构建 title/a/meta 标签。
+    结果只包含字符串、列表和字典，可以在进程间传递。
+
+    Args:
+        html: HTML 内容
+        parser: 解析后端名称；进程池中只能使用内置后端或在创建进程池前注册的后端
+        fields: 需要提取的字段，为 None 时完整解析并提取全部字段
+
+    Returns:
+        Dict[str, Any]: 字段名 -> 提取结果
+    """
+    backend = get_parser(parser)
+    wanted = PAGE_FIELDS if fields is None else frozenset(fields)
+    tree = backend.parse(html, None if fields is None else wanted)
+    return {field: getattr(backend, field)(tree) for field in wanted}
+
+
+_default_parse_executor: Optional[Executor] = None
+_default_parse_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> Optional[Executor]:
+    """
+    获取默认的 HTML 解析工作池
+
+    类型从配置 parse_executor 中读取：thread（默认，不阻塞事件循环，但受 GIL 限制）、
+    process（多核并行解析，需要在进程间传递 HTML）或 inline（不使用工作池）；
+    工作数量从配置 parse_workers 中读取，默认为 CPU 核数。
+
+    Returns:
+        Optional[Executor]: 工作池，inline 时返回 None
+
+    Raises:
+        ValueError: 无效的工作池类型
+    """
+    global _default_parse_executor
+    kind = get_config("parse_executor", "thread")
+    if kind == "inline":
+        return None
+    if _default_parse_executor is None:
+        with _default_parse_executor_lock:
+            if _default_parse_executor is None:
+                workers = get_config("parse_workers", os.cpu_count() or 1)
+                if kind == "thread":
+                    _default_parse_executor = ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix="wicspy-parse"
+                    )
+                elif kind == "process":
+                    _default_parse_executor = ProcessPoolExecutor(max_workers=workers)
+                else:
+                    raise ValueError(f"无效的解析工作池类型: {kind}")
+    return _default_parse_executor
+
+
+def close_parse_executor() -> None:
+    """关闭默认的 HTML 解析工作池，下次使用时重新创建"""
+    global _default_parse_executor
+    with _default_parse_executor_lock:
+        executor, _default_parse_executor = _default_parse_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
@@ -9,77 +9,225 @@ except ImportError:
     raise ImportError(
         "To use the web module, you need to install the wicspy[web] extra.\n"
     )
+import asyncio
 import re
-from typing import Dict, List, Optional, Union, Any
-from pydantic import BaseModel, Field
+import time
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, model_validator
 from loguru import logger
 
 from wicspy.config import get_config
+from .cache import CacheEntry, ResponseCache
+from .client import HttpClient, get_client
+from .parser import PAGE_FIELDS, TAG_FIELDS, extract_fields, get_parse_executor, get_parser
 
 
 class PageContent(BaseModel):
-    """网页内容模型"""
+    """
+    网页内容模型
+
+    title、text、links、metadata 在首次访问时才从 HTML 中提取，不访问字段的调用方不必付出
+    解析代价。title、links、metadata 只需要少量标签，首次访问其中任意一个时用一次只构建这些
+    标签的解析提取尚未提取的全部三个（指定 fields 时只提取 fields 中的）；text 需要完整解析
+    整个文档，只在访问 text 时才解析。提取后立即释放解析树，对象（例如放入响应缓存后）
+    不会长期持有比 HTML 大得多的解析树。
+    """
     url: str = Field(..., description="网页 URL")
-    title: str = Field("", description="网页标题")
     html: str = Field(..., description="原始 HTML")
-    text: str = Field("", description="提取的文本内容")
-    links: List[str] = Field(default_factory=list, description="页面中的链接")
-    metadata: Dict[str, str] = Field(default_factory=dict, description="页面元数据")
+    parser: str = Field("html.parser", description="HTML 解析后端名称")
+    fields: Optional[List[str]] = Field(None, description="预先提取的字段，为 None 时按访问提取")
+
+    _values: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _legacy_values(cls, data: Any, handler: Any) -> "PageContent":
+        """兼容直接传入提取结果的旧用法，传入的字段不再解析；对构造和 model_validate 都生效"""
+        values = {}
+        if isinstance(data, dict):
+            values = {field: data[field] for field in PAGE_FIELDS if field in data}
+            data = {key: value for key, value in data.items() if key not in PAGE_FIELDS}
+        page = handler(data)
+        page._values.update(values)
+        return page
+
+    @classmethod
+    def model_construct(
+        cls, _fields_set: Optional[Set[str]] = None, **values: Any
+    ) -> "PageContent":
+        """不经校验创建对象，同样保留传入的提取结果"""
+        extracted = {field: values.pop(field) for field in PAGE_FIELDS if field in values}
+        page = super().model_construct(_fields_set, **values)
+        page._values.update(extracted)
+        return page
+
+    def _extract(self, field: str) -> Any:
+        """提取字段，text 单独完整解析，其余字段共用一次只构建所需标签的解析"""
+        if field not in self._values:
+            if field == "text":
+                wanted = {"text"}
+            else:
+                wanted = {name for name in TAG_FIELDS if name not in self._values}
+                if self.fields:
+                    wanted = (wanted & set(self.fields)) | {field}
+            self._values.update(extract_fields(self.html, self.parser, wanted))
+        return self._values[field]
+
+    @computed_field(description="网页标题")
+    @property
+    def title(self) -> str:
+        return self._extract("title")
+
+    @computed_field(description="提取的文本内容")
+    @property
+    def text(self) -> str:
+        return self._extract("text")
+
+    @computed_field(description="页面中的链接")
+    @property
+    def links(self) -> List[str]:
+        return self._extract("links")
+
+    @computed_field(description="页面元数据")
+    @property
+    def metadata(self) -> Dict[str, str]:
+        return self._extract("metadata")
+
+
+def _check_fields(fields: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """校验需要提取的字段"""
+    if fields is None:
+        return None
+    fields = sorted(set(fields))
+    unknown = set(fields) - PAGE_FIELDS
+    if unknown or not fields:
+        raise ValueError(f"无效的提取字段: {sorted(unknown)}，可选: {sorted(PAGE_FIELDS)}")
+    return fields
+
+
+def _parse_page(url: str, html: str, parser: str, fields: Optional[List[str]] = None) -> PageContent:
+    """创建网页内容对象，字段在首次访问时才解析"""
+    return PageContent(url=url, html=html, parser=parser, fields=fields)
+
+
+async def _parse_page_async(
+    url: str,
+    html: str,
+    parser: str,
+    fields: Optional[List[str]],
+    executor: Optional[Executor],
+) -> PageContent:
+    """在工作池中解析 HTML 并提取字段，较小的页面仍然按需解析"""
+    if executor is None or len(html) < get_config("parse_offload_min_bytes", 32 * 1024):
+        return _parse_page(url, html, parser, fields)
+    loop = asyncio.get_running_loop()
+    values = await loop.run_in_executor(executor, extract_fields, html, parser, fields)
+    return PageContent(url=url, html=html, parser=parser, fields=fields, **values)
+
+
+def _cache_lookup(
+    cache: ResponseCache,
+    client: HttpClient,
+    url: str,
+    headers: Optional[Dict[str, str]],
+) -> Tuple[Optional[CacheEntry], httpx.Headers]:
+    """查找缓存项，同时返回实际发送的请求头（用于匹配 Vary）"""
+    sent = httpx.Headers(client.headers)
+    sent.update(headers or {})
+    return cache.lookup(url, sent, PageContent), sent
+
+
+def _not_modified(
+    url: str,
+    response: httpx.Response,
+    cache: Optional[ResponseCache],
+    entry: Optional[CacheEntry],
+) -> bool:
+    """服务器返回 304 时更新缓存，返回是否可以使用缓存的网页内容"""
+    if entry is None or response.status_code != 304:
+        return False
+    logger.debug(f"缓存验证通过: {url}")
+    cache.revalidated(entry, response)
+    return True
+
 
+def _reuse_page(page: PageContent, parser: str, fields: Optional[List[str]]) -> PageContent:
+    """复用缓存的网页内容；解析后端或提取字段与调用方不同时，用缓存的 HTML 按调用方的参数重新创建"""
+    if page.parser == parser and page.fields == fields:
+        return page
+    return _parse_page(page.url, page.html, parser, fields)
 
-async def fetch_page_async(url: str, headers: Optional[Dict[str, str]] = None) -> PageContent:
+
+async def _reuse_page_async(
+    page: PageContent, parser: str, fields: Optional[List[str]], executor: Optional[Executor]
+) -> PageContent:
+    """_reuse_page() 的异步版本，重新创建时与新下载的页面一样可以在工作池中解析"""
+    if page.parser == parser and page.fields == fields:
+        return page
+    return await _parse_page_async(page.url, page.html, parser, fields, executor)
+
+
+async def fetch_page_async(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    client: Optional[HttpClient] = None,
+    cache: Optional[ResponseCache] = None,
+    parser: Optional[str] = None,
+    fields: Optional[Iterable[str]] = None,
+    executor: Optional[Executor] = None,
+) -> PageContent:
     """
     异步抓取网页内容
+
+    请求通过长期复用连接的 HttpClient 发送，重试和后续请求复用已建立的连接。
+    指定 cache 时新鲜的缓存直接返回；过期的缓存发送条件请求，服务器返回 304 时不再下载正文。
+    缓存的网页使用不同的 parser 或 fields 时，按调用方的参数用缓存的 HTML 重新创建。
+    超过 parse_offload_min_bytes（默认 32 KiB）的页面在工作池中解析并提取 fields（默认全部字段），
+    解析期间事件循环可以继续处理其他请求；较小的页面在首次访问字段时才解析。
     
     Args:
         url: 要抓取的网页 URL
-        headers: 请求头
+        headers: 额外的请求头，与客户端的默认请求头合并
+        client: HTTP 客户端，为 None 时使用默认客户端
+        cache: 响应缓存，为 None 时不使用缓存
+        parser: HTML 解析后端(html.parser/lxml/selectolax/auto)，为 None 时从配置中读取 html_parser
+        fields: 需要提取的字段(title/text/links/metadata)，解析后端据此缩小解析范围
+        executor: 解析 HTML 的工作池，为 None 时使用 get_parse_executor()
         
     Returns:
         PageContent: 网页内容对象
+
+    Raises:
+        ValueError: 未知的解析后端或提取字段
+        ImportError: 解析后端依赖未安装
     """
-    if headers is None:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        
-    timeout = get_config("timeout", 30)
+    parser = get_parser(parser).name
+    fields = _check_fields(fields)
+    executor = executor or get_parse_executor()
+    client = client or get_client()
     max_retries = get_config("max_retries", 3)
+    entry, sent, request_headers = None, None, headers
+    if cache is not None:
+        entry, sent = _cache_lookup(cache, client, url, headers)
+        if entry is not None:
+            if entry.fresh():
+                logger.debug(f"命中缓存: {url}")
+                return await _reuse_page_async(entry.page, parser, fields, executor)
+            request_headers = {**(headers or {}), **entry.validators()}
     
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                logger.debug(f"抓取网页: {url}")
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                response.raise_for_status()
-                
-                html = response.text
-                soup = BeautifulSoup(html, "html.parser")
-                
-                # 提取标题
-                title = soup.title.text.strip() if soup.title else ""
-                
-                # 提取链接
-                links = [a.get("href", "") for a in soup.find_all("a", href=True)]
-                
-                # 提取元数据
-                metadata = {
-                    meta.get("name", meta.get("property", "unknown")): meta.get("content", "")
-                    for meta in soup.find_all("meta")
-                    if meta.get("name") or meta.get("property")
-                }
-                
-                # 提取文本
-                text = soup.get_text(separator="\n", strip=True)
-                
-                return PageContent(
-                    url=url,
-                    title=title,
-                    html=html,
-                    text=text,
-                    links=links,
-                    metadata=metadata
-                )
+            logger.debug(f"抓取网页: {url}")
+            response = await client.aget(url, headers=request_headers)
+            if _not_modified(url, response, cache, entry):
+                return await _reuse_page_async(entry.page, parser, fields, executor)
+            response.raise_for_status()
+            page = await _parse_page_async(url, response.text, parser, fields, executor)
+            if cache is not None:
+                cache.store(url, sent, response, page)
+            return page
                 
         except Exception as e:
             logger.warning(f"抓取网页失败 (尝试 {attempt+1}/{max_retries}): {url}, 异常: {e}")
@@ -91,58 +239,61 @@ async def fetch_page_async(url: str, headers: Optional[Dict[str, str]] = None) -
     raise Exception("无法抓取网页")
 
 
-def fetch_page(url: str, headers: Optional[Dict[str, str]] = None) -> PageContent:
+def fetch_page(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    client: Optional[HttpClient] = None,
+    cache: Optional[ResponseCache] = None,
+    parser: Optional[str] = None,
+    fields: Optional[Iterable[str]] = None,
+) -> PageContent:
     """
     同步抓取网页内容
+
+    请求通过长期复用连接的 HttpClient 发送，重试和后续请求复用已建立的连接。
+    指定 cache 时新鲜的缓存直接返回；过期的缓存发送条件请求，服务器返回 304 时不再下载正文。
+    缓存的网页使用不同的 parser 或 fields 时，按调用方的参数用缓存的 HTML 重新创建。
+    返回的 PageContent 在首次访问 title/text/links/metadata 时才解析 HTML。
     
     Args:
         url: 要抓取的网页 URL
-        headers: 请求头
+        headers: 额外的请求头，与客户端的默认请求头合并
+        client: HTTP 客户端，为 None 时使用默认客户端
+        cache: 响应缓存，为 None 时不使用缓存
+        parser: HTML 解析后端(html.parser/lxml/selectolax/auto)，为 None 时从配置中读取 html_parser
+        fields: 需要提取的字段(title/text/links/metadata)，解析后端据此缩小解析范围
         
     Returns:
         PageContent: 网页内容对象
+
+    Raises:
+        ValueError: 未知的解析后端或提取字段
+        ImportError: 解析后端依赖未安装
     """
-    if headers is None:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        
-    timeout = get_config("timeout", 30)
+    parser = get_parser(parser).name
+    fields = _check_fields(fields)
+    client = client or get_client()
     max_retries = get_config("max_retries", 3)
+    entry, sent, request_headers = None, None, headers
+    if cache is not None:
+        entry, sent = _cache_lookup(cache, client, url, headers)
+        if entry is not None:
+            if entry.fresh():
+                logger.debug(f"命中缓存: {url}")
+                return _reuse_page(entry.page, parser, fields)
+            request_headers = {**(headers or {}), **entry.validators()}
     
     for attempt in range(max_retries):
         try:
             logger.debug(f"抓取网页: {url}")
-            response = httpx.get(url, headers=headers, timeout=timeout, follow_redirects=True)
+            response = client.get(url, headers=request_headers)
+            if _not_modified(url, response, cache, entry):
+                return _reuse_page(entry.page, parser, fields)
             response.raise_for_status()
-            
-            html = response.text
-            soup = BeautifulSoup(html, "html.parser")
-            
-            # 提取标题
-            title = soup.title.text.strip() if soup.title else ""
-            
-            # 提取链接
-            links = [a.get("href", "") for a in soup.find_all("a", href=True)]
-            
-            # 提取元数据
-            metadata = {
-                meta.get("name", meta.get("property", "unknown")): meta.get("content", "")
-                for meta in soup.find_all("meta")
-                if meta.get("name") or meta.get("property")
-            }
-            
-            # 提取文本
-            text = soup.get_text(separator="\n", strip=True)
-            
-            return PageContent(
-                url=url,
-                title=title,
-                html=html,
-                text=text,
-                links=links,
-                metadata=metadata
-            )
+            page = _parse_page(url, response.text, parser, fields)
+            if cache is not None:
+                cache.store(url, sent, response, page)
+            return page
             
         except Exception as e:
             logger.warning(f"抓取网页失败 (尝试 {attempt+1}/{max_retries}): {url}, 异常: {e}")
@@ -154,6 +305,210 @@ def fetch_page(url: str, headers: Optional[Dict[str, str]] = None) -> PageConten
     raise Exception("无法抓取网页")
 
 
+class FetchError(Exception):
+    """批量抓取中单个 URL 的失败"""
+
+    def __init__(self, url: str, error: BaseException):
+        super().__init__(f"抓取网页失败: {url}, 异常: {error}")
+        self.url = url
+        self.error = error
+
+
+class TokenBucket:
+    """
+    异步令牌桶限速器
+
+    令牌以 rate 个/秒的速度补充，最多积累 burst 个；acquire() 在没有令牌时按需等待，
+    多个协程按调用顺序依次获得令牌。
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数
+            burst: 桶容量，为 None 时等于 max(rate, 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate 必须大于 0")
+        self.rate = rate
+        self.burst = max(rate, 1.0) if burst is None else burst
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """获取一个令牌"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+async def fetch_many_async(
+    urls: Union[Iterable[str], AsyncIterable[str]],
+    concurrency: int = 10,
+    rate: Optional[float] = None,
+    burst: Optional[float] = None,
+    headers: Optional[Dict[str, str]] = None,
+    client: Optional[HttpClient] = None,
+    return_exceptions: bool = False,
+    cache: Optional[ResponseCache] = None,
+    parser: Optional[str] = None,
+    fields: Optional[Iterable[str]] = None,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[Union[PageContent, FetchError]]:
+    """
+    并发抓取多个网页，按完成顺序产出结果
+
+    URL 按需从 urls 中逐个取出，任意时刻最多只有 concurrency 个请求在进行；结果只有在调用方
+    取走后才会补充新的请求，因此 urls 可以是很长的生成器，不会一次性创建全部任务。
+    指定 rate 时每个主机使用独立的令牌桶限速，等待令牌的请求同样占用并发名额。
+
+    Args:
+        urls: URL 序列，可以是同步或异步可迭代对象
+        concurrency: 全局最大并发请求数
+        rate: 每个主机每秒最多发起的请求数，为 None 时不限速
+        burst: 每个主机令牌桶的容量，为 None 时等于 max(rate, 1)
+        headers: 额外的请求头
+        client: HTTP 客户端，为 None 时使用默认客户端
+        return_exceptions: 为 True 时失败的 URL 以 FetchError 产出；为 False 时遇到第一个
+            失败即抛出 FetchError 并取消其余请求
+        cache: 响应缓存，为 None 时不使用缓存
+        parser: HTML 解析后端，为 None 时从配置中读取 html_parser
+        fields: 需要提取的字段，解析后端据此缩小解析范围
+        executor: 解析 HTML 的工作池，为 None 时使用 get_parse_executor()
+
+    Yields:
+        Union[PageContent, FetchError]: 网页内容，或 return_exceptions 为 True 时的失败信息
+
+    Example:
+        >>> async for page in fetch_many_async(urls, concurrency=20, rate=5):
+        ...     print(page.url, page.title)
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency 必须大于 0")
+    parser = get_parser(parser).name
+    fields = _check_fields(fields)
+    executor = executor or get_parse_executor()
+    client = client or get_client()
+    buckets: Dict[str, TokenBucket] = {}
+
+    async def fetch_one(url: str) -> Union[PageContent, FetchError]:
+        if rate is not None:
+            host = urlsplit(url).netloc
+            bucket = buckets.get(host)
+            if bucket is None:
+                bucket = buckets[host] = TokenBucket(rate, burst)
+            await bucket.acquire()
+        try:
+            return await fetch_page_async(url, headers, client, cache, parser, fields, executor)
+        except Exception as e:
+            return FetchError(url, e)
+
+    if isinstance(urls, AsyncIterable):
+        source = urls.__aiter__()
+
+        async def next_url() -> Optional[str]:
+            try:
+                return await source.__anext__()
+            except StopAsyncIteration:
+                return None
+    else:
+        sync_source = iter(urls)
+
+        async def next_url() -> Optional[str]:
+            return next(sync_source, None)
+
+    pending: Set[asyncio.Task] = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                url = await next_url()
+                if url is None:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(fetch_one(url)))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if isinstance(result, FetchError) and not return_exceptions:
+                    raise result
+                yield result
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def fetch_many(
+    urls: Iterable[str],
+    concurrency: int = 10,
+    rate: Optional[float] = None,
+    burst: Optional[float] = None,
+    headers: Optional[Dict[str, str]] = None,
+    client: Optional[HttpClient] = None,
+    return_exceptions: bool = False,
+    cache: Optional[ResponseCache] = None,
+    parser: Optional[str] = None,
+    fields: Optional[Iterable[str]] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[Union[PageContent, FetchError]]:
+    """
+    并发抓取多个网页的同步版本，按完成顺序产出结果
+
+    在私有事件循环中驱动 fetch_many_async()，每取走一个结果才推进一步，背压行为与异步版本相同。
+    不能在运行中的事件循环里调用，此时请直接使用 fetch_many_async()。异步连接绑定事件循环，
+    每次调用结束时关闭，多次调用之间不会复用连接；需要跨批次复用连接时在同一个事件循环中
+    调用 fetch_many_async()。
+
+    Args:
+        urls: URL 序列
+        concurrency: 全局最大并发请求数
+        rate: 每个主机每秒最多发起的请求数，为 None 时不限速
+        burst: 每个主机令牌桶的容量
+        headers: 额外的请求头
+        client: HTTP 客户端，为 None 时使用默认客户端
+        return_exceptions: 为 True 时失败的 URL 以 FetchError 产出，否则抛出
+        cache: 响应缓存，为 None 时不使用缓存
+        parser: HTML 解析后端，为 None 时从配置中读取 html_parser
+        fields: 需要提取的字段，解析后端据此缩小解析范围
+        executor: 解析 HTML 的工作池，为 None 时使用 get_parse_executor()
+
+    Yields:
+        Union[PageContent, FetchError]: 网页内容，或 return_exceptions 为 True 时的失败信息
+
+    Example:
+        >>> for page in fetch_many(urls, concurrency=20, rate=5):
+        ...     print(page.url, page.title)
+    """
+    client = client or get_client()
+    loop = asyncio.new_event_loop()
+    agen = fetch_many_async(
+        urls, concurrency, rate, burst, headers, client, return_exceptions, cache, parser, fields,
+        executor,
+    )
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(agen.aclose())
+        # 异步连接绑定在这个私有事件循环上，循环关闭前释放
+        loop.run_until_complete(client.aclose_async())
+        loop.close()
+
+
 def extract_text(html: str, selector: Optional[str] = None) -> str:
     """
     从 HTML 中提取文本
@@ -0,0 +1,100 @@
+import asyncio
+import os
+import threading
+from collections import Counter
+
+import pytest
+
+from wicspy.server import monitor
+from wicspy.server.monitor import DiskCollector, MountTable
+
+
+def _mountinfo(tmp_path, mountpoints):
+    lines = [
+        f"{i} 1 0:{i} / {mp} rw - ext4 /dev/fake{i} rw" for i, mp in enumerate(mountpoints, 1)
+    ]
+    path = tmp_path / "mountinfo"
+    path.write_text("\n".join(lines) + "\n")
+    return MountTable(str(path))
+
+
+@pytest.fixture
+def hung_statvfs(monkeypatch):
+    """让以 /hang 开头的挂载点上的 statvfs 一直阻塞，测试结束时放行"""
+    release = threading.Event()
+    calls = Counter()
+    real_statvfs = os.statvfs
+
+    def statvfs(path):
+        calls[path] += 1
+        if path.startswith("/hang"):
+            release.wait()
+        return real_statvfs("/")
+
+    monkeypatch.setattr(os, "statvfs", statvfs)
+    yield calls
+    release.set()
+
+
+def test_hung_mount_is_stale_and_not_resubmitted(tmp_path, hung_statvfs):
+    collector = DiskCollector(_mountinfo(tmp_path, ["/", "/hang"]), timeout=0.2, backoff=0.0)
+    try:
+        for _ in range(3):
+            records = {r.mountpoint: r for r in collector.collect_records()}
+            assert not records["/"].stale
+            assert records["/hang"].stale
+        # 卡住的调用仍在执行，不再占用新的线程
+        assert hung_statvfs["/hang"] == 1
+        assert hung_statvfs["/"] == 3
+    finally:
+        collector.close()
+
+
+def test_queued_mount_is_not_backed_off(tmp_path, hung_statvfs):
+    collector = DiskCollector(
+        _mountinfo(tmp_path, ["/hang", "/"]), max_workers=1, timeout=0.2, backoff=60.0
+    )
+    try:
+        records = {r.mountpoint: r for r in collector.collect_records()}
+        # 唯一的线程卡在 /hang 上，/ 还在排队，只在本次标记为 stale
+        assert records["/hang"].stale
+        assert records["/"].stale
+        assert hung_statvfs["/"] == 0
+
+        # 卡住的调用占满线程池后改用新的线程池，/ 不受 /hang 的退避影响
+        records = {r.mountpoint: r for r in collector.collect_records()}
+        assert records["/hang"].stale
+        assert not records["/"].stale
+        assert hung_statvfs == {"/hang": 1, "/": 1}
+    finally:
+        collector.close()
+
+
+@pytest.fixture
+def hung_collector(tmp_path, monkeypatch, hung_statvfs):
+    collector = DiskCollector(_mountinfo(tmp_path, ["/", "/hang"]), timeout=0.2)
+    monkeypatch.setattr(monitor, "_default_disk_collector", collector)
+    yield collector
+    collector.close()
+
+
+def test_snapshot_iterator_survives_hung_mount(hung_collector):
+    async def take(count):
+        snapshots = []
+        # 间隔短于采集器的截止时间
+        async for snapshot in monitor.iter_snapshots_async(interval=0.05, exclude_pseudo=False):
+            snapshots.append(snapshot)
+            if len(snapshots) == count:
+                return snapshots
+
+    snapshots = asyncio.run(take(3))
+    for snapshot in snapshots:
+        disks = {d.mountpoint: d for d in snapshot.disks}
+        assert not disks["/"].stale
+        assert disks["/hang"].stale
+
+
+def test_snapshot_timeout_returns_stale_disks(hung_collector):
+    snapshot = asyncio.run(monitor.get_snapshot_async(exclude_pseudo=False, timeout=0.05))
+    assert [d.mountpoint for d in snapshot.disks] == ["/", "/hang"]
+    assert all(d.stale for d in snapshot.disks)
@@ -0,0 +1,66 @@
+import pytest
+
+from wicspy.web import scraper
+from wicspy.web.parser import HtmlParser
+from wicspy.web.scraper import PageContent
+
+HTML = (
+    "<html><head><title>Title</title><meta name='description' content='desc'></head>"
+    "<body><p>hello <a href='/a'>a</a></p><script>var x = 1;</script></body></html>"
+)
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """记录每次解析请求的字段"""
+    calls = []
+    extract_fields = scraper.extract_fields
+
+    def spy(html, parser, fields=None):
+        calls.append(None if fields is None else sorted(fields))
+        return extract_fields(html, parser, fields)
+
+    monkeypatch.setattr(scraper, "extract_fields", spy)
+    return calls
+
+
+def test_text_is_parsed_only_when_read(parses):
+    page = PageContent(url="u", html=HTML)
+    assert parses == []
+    assert page.title == "Title"
+    assert page.links == ["/a"]
+    assert page.metadata == {"description": "desc"}
+    assert parses == [["links", "metadata", "title"]]
+    assert page.text == "Title\nhello\na"
+    assert parses == [["links", "metadata", "title"], ["text"]]
+
+
+def test_fields_restrict_tag_parse(parses):
+    page = PageContent(url="u", html=HTML, fields=["title"])
+    assert page.title == "Title"
+    assert page.links == ["/a"]
+    assert parses == [["title"], ["links"]]
+
+
+@pytest.mark.parametrize("build", [
+    lambda data: PageContent(**data),
+    PageContent.model_validate,
+    lambda data: PageContent.model_construct(**data),
+])
+def test_legacy_values_are_kept(parses, build):
+    page = build({"url": "u", "html": HTML, "title": "Legacy", "text": "legacy text"})
+    assert page.title == "Legacy"
+    assert page.text == "legacy text"
+    assert parses == []
+
+
+def test_incomplete_parser_fails_on_instantiation():
+    class TitleOnly(HtmlParser):
+        def parse(self, html, fields=None):
+            return html
+
+        def title(self, tree):
+            return ""
+
+    with pytest.raises(TypeError):
+        TitleOnly()
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+from wicspy.server.process import find_processes
+from wicspy.server.proctable import CHANGED, ProcessTable
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="需要 /proc")
+
+
+def _wait_comm(pid, comm, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with open(f"/proc/{pid}/comm") as f:
+            if f.read().strip() == comm:
+                return
+        time.sleep(0.01)
+    raise AssertionError(f"进程 {pid} 未在 {timeout} 秒内变为 {comm}")
+
+
+def test_exec_rereads_static_info():
+    # 子进程收到一行输入后 exec 为 sleep，pid 和 starttime 保持不变
+    child = subprocess.Popen(
+        [sys.executable, "-c", "import os, sys; sys.stdin.readline(); "
+         "os.execv('/bin/sleep', ['sleep', '30'])"],
+        stdin=subprocess.PIPE,
+    )
+    try:
+        table = ProcessTable()
+        table.refresh()
+        before = table.get(child.pid)
+        assert "-c" in before.cmd
+
+        child.stdin.write(b"\n")
+        child.stdin.flush()
+        _wait_comm(child.pid, "sleep")
+
+        events = [e for e in table.refresh() if e.pid == child.pid]
+        assert [e.kind for e in events] == [CHANGED]
+        after = table.get(child.pid)
+        assert after.name == "sleep"
+        assert after.cmd == "sleep 30"
+        assert after.exe.endswith("sleep")
+        assert [p.pid for p in find_processes(cmd="sleep 30", table=table)] == [child.pid]
+        assert find_processes(cmd="readline", table=table) == []
+    finally:
+        child.kill()
+        child.wait()
@@ -0,0 +1,61 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from wicspy.web import HttpClient, ResponseCache, fetch_page
+from wicspy.web.cache import _page_size
+from wicspy.web.scraper import PageContent
+
+HTML = "<html><head><title>Заголовок</title></head><body><a href='/a'>a</a></body></html>"
+
+
+@pytest.fixture
+def server():
+    """可缓存 60 秒的本地页面，记录请求次数"""
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            requests.append(self.path)
+            body = HTML.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "max-age=60")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/", requests
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fresh_hit_uses_callers_fields(server):
+    url, requests = server
+    cache = ResponseCache()
+    with HttpClient() as client:
+        first = fetch_page(url, client=client, cache=cache, parser="html.parser", fields=["title"])
+        same = fetch_page(url, client=client, cache=cache, parser="html.parser", fields=["title"])
+        other = fetch_page(url, client=client, cache=cache, parser="html.parser")
+    assert len(requests) == 1
+    assert same is first
+    assert other is not first
+    assert other.fields is None
+    assert other.html == first.html
+    assert other.title == "Заголовок"
+
+
+def test_page_size_counts_utf8_bytes():
+    page = PageContent(url="u", html=HTML)
+    assert _page_size(page) == 2 * len(HTML.encode("utf-8"))
+    assert _page_size(page) > 2 * len(HTML)